@@ -0,0 +1,244 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from resample import interval_minutes, to_calendar_period
+from timeseries import TimeSeries, to_epoch_seconds
+
+DAY_SECONDS = 86400
+# Symbols with cached factors, and (symbol, interval, shape) adjusted series, kept between calls
+FACTOR_ENTRIES = 64
+RESULT_ENTRIES = 32
+
+ADJUSTED_SERIES_KEYS = {
+    "daily": "Time Series (Daily)",
+    "weekly": "Weekly Adjusted Time Series",
+    "monthly": "Monthly Adjusted Time Series",
+}
+ADJUSTED_LABELS = ["1. open", "2. high", "3. low", "4. close", "5. adjusted close", "6. volume", "7. dividend amount"]
+OHLCV_LABELS = ["1. open", "2. high", "3. low", "4. close", "5. volume", "6. total return index"]
+
+
+def _action_dates(rows: List[Dict[str, Any]], field: str) -> np.ndarray:
+    return to_epoch_seconds(np.array([row[field] for row in rows], dtype="S10"))
+
+
+def parse_splits(response: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """(effective dates, ratios) from a CORPORATE_ACTION_SPLITS response; 2.0 is a 2-for-1 split"""
+    rows = []
+    for row in response.get("data", []):
+        try:
+            ratio = float(row["split_factor"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if ratio > 0 and row.get("effective_date"):
+            rows.append({"date": row["effective_date"], "ratio": ratio})
+    return _action_dates(rows, "date"), np.array([row["ratio"] for row in rows], dtype=np.float64)
+
+
+def parse_dividends(response: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """(ex-dividend dates, cash amounts per share) from a CORPORATE_ACTION_DIVIDENDS response"""
+    rows = []
+    for row in response.get("data", []):
+        try:
+            amount = float(row["amount"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if amount > 0 and row.get("ex_dividend_date") not in (None, "", "None"):
+            rows.append({"date": row["ex_dividend_date"], "amount": amount})
+    return _action_dates(rows, "date"), np.array([row["amount"] for row in rows], dtype=np.float64)
+
+
+class Adjustments:
+    """Backward split and dividend adjustment factors for one symbol.
+
+    Each corporate action contributes a price factor that applies to every
+    bar before its date: 1/ratio for a split, and 1 - amount/previous close
+    for a cash dividend (the CRSP convention Alpha Vantage's adjusted close
+    follows). Splits also scale volume by the ratio. The factor for a bar is
+    the product over all later actions. It is looked up with a binary search
+    over the action dates, so the same factors adjust bars of any interval.
+    """
+
+    __slots__ = ("dates", "price_factors", "volume_factors", "split_dates", "split_ratios",
+                 "dividend_dates", "dividend_amounts", "_price_suffix", "_volume_suffix")
+
+    def __init__(self, daily: TimeSeries, splits: Tuple[np.ndarray, np.ndarray],
+                 dividends: Tuple[np.ndarray, np.ndarray]):
+        self.split_dates, self.split_ratios = splits
+        self.dividend_dates, self.dividend_amounts = dividends
+        # Dividends are priced off the last close before the ex-date
+        previous = np.searchsorted(daily.timestamps, self.dividend_dates, side="left") - 1
+        close = daily["close"]
+        known = previous >= 0
+        dividend_factors = np.ones(len(self.dividend_dates))
+        dividend_factors[known] = 1.0 - self.dividend_amounts[known] / close[previous[known]]
+        dates = np.concatenate([self.split_dates, self.dividend_dates])
+        order = np.argsort(dates, kind="stable")
+        self.dates = dates[order]
+        self.price_factors = np.concatenate([1.0 / self.split_ratios, dividend_factors])[order]
+        self.volume_factors = np.concatenate([self.split_ratios, np.ones(len(self.dividend_dates))])[order]
+        # suffix[i] is the product of the factors of actions i..end; suffix[len] == 1
+        self._price_suffix = np.append(np.cumprod(self.price_factors[::-1])[::-1], 1.0)
+        self._volume_suffix = np.append(np.cumprod(self.volume_factors[::-1])[::-1], 1.0)
+
+    def _later(self, timestamps: np.ndarray) -> np.ndarray:
+        """Index of the first action dated after each bar's day"""
+        days = timestamps // DAY_SECONDS * DAY_SECONDS
+        return np.searchsorted(self.dates, days, side="right")
+
+    def price_factor(self, timestamps: np.ndarray) -> np.ndarray:
+        return self._price_suffix[self._later(timestamps)]
+
+    def volume_factor(self, timestamps: np.ndarray) -> np.ndarray:
+        return self._volume_suffix[self._later(timestamps)]
+
+    def adjust(self, series: TimeSeries, base: float = 100.0) -> TimeSeries:
+        """Split- and dividend-adjusted OHLCV of any interval, plus a total-return index starting at `base`"""
+        price = self.price_factor(series.timestamps)
+        columns = {name: series[name] * price for name in ("open", "high", "low", "close")}
+        columns["volume"] = series["volume"] * self.volume_factor(series.timestamps)
+        close = columns["close"]
+        columns["total return index"] = close / close[0] * base if len(close) else close.copy()
+        return TimeSeries(series.timestamps, columns, dict(series.metadata),
+                          f"Adjusted {series.series_key}", OHLCV_LABELS, {"adjusted": True})
+
+    def av_adjusted(self, daily: TimeSeries, period: str = "daily") -> TimeSeries:
+        """Alpha Vantage's *_ADJUSTED shape: raw OHLCV, adjusted close, dividends (and daily split coefficients)"""
+        n = len(daily)
+        at_split = np.searchsorted(daily.timestamps, self.split_dates, side="left")
+        at_dividend = np.searchsorted(daily.timestamps, self.dividend_dates, side="left")
+        dividends = np.zeros(n)
+        split_coefficient = np.ones(n)
+        np.add.at(dividends, at_dividend[at_dividend < n], self.dividend_amounts[at_dividend < n])
+        np.multiply.at(split_coefficient, at_split[at_split < n], self.split_ratios[at_split < n])
+        columns = {
+            "open": daily["open"],
+            "high": daily["high"],
+            "low": daily["low"],
+            "close": daily["close"],
+            "adjusted close": daily["close"] * self.price_factor(daily.timestamps),
+            "volume": daily["volume"],
+            "dividend amount": dividends,
+        }
+        labels = list(ADJUSTED_LABELS)
+        if period == "daily":
+            columns["split coefficient"] = split_coefficient
+            labels.append("8. split coefficient")
+        metadata = {**daily.metadata, "1. Information": f"{period.capitalize()} Adjusted Prices and Volumes"}
+        series = TimeSeries(daily.timestamps, columns, metadata, ADJUSTED_SERIES_KEYS[period], labels)
+        if period != "daily":
+            series = to_calendar_period(series, period)
+            series.series_key = ADJUSTED_SERIES_KEYS[period]
+        return series.with_meta(adjusted_locally=True)
+
+
+def actions_fingerprint(splits: Dict[str, Any], dividends: Dict[str, Any]) -> int:
+    """Identity of a symbol's corporate action history; changes only when an action is added or amended"""
+    split_rows = tuple(sorted((row.get("effective_date"), row.get("split_factor")) for row in splits.get("data", [])))
+    dividend_rows = tuple(sorted((row.get("ex_dividend_date"), row.get("amount")) for row in dividends.get("data", [])))
+    return hash((split_rows, dividend_rows))
+
+
+def _remember(entries: Dict[Any, Any], key: Any, value: Any, limit: int):
+    """entries[key] = value as the most recently used entry, dropping the least recently used past `limit`"""
+    entries.pop(key, None)
+    entries[key] = value
+    while len(entries) > limit:
+        del entries[next(iter(entries))]
+
+
+class AdjustmentEngine:
+    """Adjusted series computed locally from raw bars and corporate actions.
+
+    Alpha Vantage's adjusted endpoints are premium (daily) or a separate
+    call per interval. This engine fetches the raw full daily history plus
+    the split and dividend lists once, computes Adjustments from them, and
+    applies them to any interval. Factors are cached per symbol and rebuilt
+    only when the corporate action history changes. Adjusted series are
+    cached too, and are reused until the raw bars they came from move on.
+    Both caches keep only their most recently used entries.
+
+    Intraday bars are requested with `adjusted=false`: Alpha Vantage
+    adjusts them by default, and applying the factors again would count
+    every split and dividend twice.
+    """
+
+    def __init__(self, av_client: Any):
+        self.av_client = av_client
+        # symbol -> (actions fingerprint, Adjustments)
+        self._factors: Dict[str, Tuple[int, Adjustments]] = {}
+        # (symbol, interval, shape) -> (actions fingerprint, source bar count, source last timestamp, series)
+        self._results: Dict[Tuple[str, str, str], Tuple[int, int, int, TimeSeries]] = {}
+        self.factor_builds = 0
+        self.invalidations = 0
+        self.hits = 0
+
+    async def _inputs(self, symbol: str) -> Tuple[int, Adjustments, TimeSeries]:
+        daily = await self.av_client.get_time_series_daily(symbol, "full", as_columns=True)
+        splits = await self.av_client.get_corporate_action_splits(symbol)
+        dividends = await self.av_client.get_corporate_action_dividends(symbol)
+        fingerprint = actions_fingerprint(splits, dividends)
+        cached = self._factors.get(symbol)
+        if cached is not None and cached[0] == fingerprint:
+            _remember(self._factors, symbol, cached, FACTOR_ENTRIES)
+            return fingerprint, cached[1], daily
+        if cached is not None:
+            self.invalidations += 1
+        adjustments = Adjustments(daily, parse_splits(splits), parse_dividends(dividends))
+        self.factor_builds += 1
+        _remember(self._factors, symbol, (fingerprint, adjustments), FACTOR_ENTRIES)
+        return fingerprint, adjustments, daily
+
+    def _cached(self, key: Tuple[str, str, str], fingerprint: int, source: TimeSeries) -> Optional[TimeSeries]:
+        cached = self._results.get(key)
+        if cached is None or cached[0] != fingerprint or not len(source):
+            return None
+        if cached[1] != len(source) or cached[2] != source.timestamps[-1]:
+            return None
+        self.hits += 1
+        _remember(self._results, key, cached, RESULT_ENTRIES)
+        return cached[3]
+
+    async def adjusted_series(self, symbol: str, interval: str = "daily") -> TimeSeries:
+        """Adjusted OHLCV plus total-return index for "daily", "weekly", "monthly" or an intraday interval"""
+        symbol = symbol.upper()
+        fingerprint, adjustments, daily = await self._inputs(symbol)
+        if interval_minutes(interval) is not None:
+            source = await self.av_client.get_time_series_intraday(
+                symbol, interval, as_columns=True, outputsize="full", adjusted=False
+            )
+        elif interval in ("daily", "weekly", "monthly"):
+            source = daily
+        else:
+            raise ValueError(f"Unsupported interval {interval!r}")
+        key = (symbol, interval, "ohlcv")
+        result = self._cached(key, fingerprint, source)
+        if result is None:
+            result = adjustments.adjust(source)
+            if interval in ("weekly", "monthly"):
+                result = to_calendar_period(result, interval)
+                result.series_key = f"Adjusted {interval.capitalize()} Time Series"
+            _remember(self._results, key, (fingerprint, len(source), int(source.timestamps[-1]) if len(source) else 0, result),
+                      RESULT_ENTRIES)
+        return result
+
+    async def av_adjusted(self, symbol: str, period: str) -> TimeSeries:
+        """TIME_SERIES_{DAILY,WEEKLY,MONTHLY}_ADJUSTED computed locally, in Alpha Vantage's shape"""
+        symbol = symbol.upper()
+        fingerprint, adjustments, daily = await self._inputs(symbol)
+        key = (symbol, period, "av")
+        result = self._cached(key, fingerprint, daily)
+        if result is None:
+            result = adjustments.av_adjusted(daily, period)
+            _remember(self._results, key, (fingerprint, len(daily), int(daily.timestamps[-1]) if len(daily) else 0, result),
+                      RESULT_ENTRIES)
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "symbols": len(self._factors),
+            "factor_builds": self.factor_builds,
+            "invalidations": self.invalidations,
+            "hits": self.hits,
+        }
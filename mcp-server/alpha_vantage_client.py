@@ -1,23 +1,215 @@
 import sys
 import asyncio
+import random
+import time
 
 if sys.platform.startswith('win'):
     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
 
 import aiohttp
-from typing import Dict, Any
+import json
+from typing import Dict, Any, List, Optional, Set
+
+from circuit_breaker import CircuitBreaker, CircuitOpenError
+from market_calendar import MarketCalendar, is_market_function
+from quote_batcher import QuoteBatcher
+from rate_limiter import Priority, RateLimiter, priority_scope
+from resample import COMPACT_BARS, INTRADAY_MINUTES, interval_minutes, to_intraday_interval
+from response_cache import ResponseCache, ttl_for
+from series_parser import StreamingSeriesParser, parse_csv, series_key_for
+from series_store import SeriesStore, store_interval
+from timeseries import TimeSeries, format_timestamp, merge_series
+from transport import HttpTransport
+from singleflight import SingleFlight
+
+
+class AlphaVantageError(Exception):
+    """Base class for errors reported by Alpha Vantage"""
+
+
+class AlphaVantageHTTPError(AlphaVantageError):
+    """Non-200 HTTP status from Alpha Vantage"""
+
+    def __init__(self, status: int):
+        super().__init__(f"Alpha Vantage API error: {status}")
+        self.status = status
+
+
+class AlphaVantageThrottleError(AlphaVantageError):
+    """Short-term rate limit hit (per-minute / per-second); worth retrying"""
+
+
+class AlphaVantageQuotaExceededError(AlphaVantageError):
+    """Daily request quota exhausted; retrying before the reset is pointless"""
+
+
+class AlphaVantagePremiumError(AlphaVantageError):
+    """Endpoint or parameter requires a premium plan"""
+
+
+class AlphaVantageInvalidRequestError(AlphaVantageError):
+    """Alpha Vantage rejected the call (bad symbol, function or parameters)"""
+
+
+def classify_payload(data: Any) -> Optional[AlphaVantageError]:
+    """Return the error encoded in an HTTP 200 payload, or None if it carries data"""
+    if not isinstance(data, dict):
+        return None
+    if "Error Message" in data:
+        return AlphaVantageInvalidRequestError(data["Error Message"])
+    # Throttle and plan notices come back as a lone "Note" or "Information" field
+    for field in ("Note", "Information"):
+        message = data.get(field)
+        if not isinstance(message, str) or len(data) > 2:
+            continue
+        text = message.lower()
+        if "call frequency" in text or "per minute" in text or "per second" in text:
+            return AlphaVantageThrottleError(message)
+        if "per day" in text or "daily" in text:
+            return AlphaVantageQuotaExceededError(message)
+        if "premium" in text:
+            return AlphaVantagePremiumError(message)
+        if "rate limit" in text:
+            return AlphaVantageThrottleError(message)
+        return AlphaVantageInvalidRequestError(message)
+    return None
+
+
+# Failures that say the upstream is unreachable or unhealthy rather than that the call was bad
+UPSTREAM_FAILURES = (aiohttp.ClientError, asyncio.TimeoutError, AlphaVantageHTTPError, AlphaVantageThrottleError)
+
+
+def annotate_response(data: Any, **meta) -> Any:
+    """Return a shallow copy of a response dict with entries merged into its `_meta` block"""
+    if isinstance(data, TimeSeries):
+        return data.with_meta(**meta)
+    if not isinstance(data, dict):
+        return data
+    return {**data, "_meta": {**data.get("_meta", {}), **meta}}
+
+
+def bulk_row_to_global_quote(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Reshape one REALTIME_BULK_QUOTES row into a GLOBAL_QUOTE response"""
+    timestamp = str(row.get("timestamp", ""))
+    return {
+        "Global Quote": {
+            "01. symbol": row.get("symbol"),
+            "02. open": row.get("open"),
+            "03. high": row.get("high"),
+            "04. low": row.get("low"),
+            "05. price": row.get("close"),
+            "06. volume": row.get("volume"),
+            "07. latest trading day": timestamp[:10],
+            "08. previous close": row.get("previous_close"),
+            "09. change": row.get("change"),
+            "10. change percent": f"{row['change_percent']}%" if row.get("change_percent") is not None else None,
+        }
+    }
+
 
 class AlphaVantageClient:
     """Client for Alpha Vantage financial data API"""
     
     BASE_URL = "https://www.alphavantage.co/query"
-    
-    def __init__(self, api_key: str):
+    STREAM_CHUNK_SIZE = 64 * 1024
+    MAX_BULK_SYMBOLS = 100
+    
+    def __init__(
+        self,
+        api_key: str,
+        pool_size: int = 20,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: int = 300,
+        request_timeout: float = 15.0,
+        connect_timeout: float = 5.0,
+        requests_per_minute: int = 5,
+        requests_per_day: int = 25,
+        background_share: float = 1.0,
+        cache_max_bytes: int = 64 * 1024 * 1024,
+        cache_path: Optional[str] = None,
+        series_store_path: Optional[str] = None,
+        stale_while_revalidate: bool = False,
+        stale_grace: float = 300.0,
+        max_retries: int = 3,
+        retry_base_delay: float = 1.0,
+        breaker_failure_threshold: int = 5,
+        breaker_reset_timeout: float = 30.0,
+        series_datatype: str = "json",
+        bulk_quotes: bool = False,
+        quote_batch_window: float = 0.05,
+        base_url: Optional[str] = None,
+        transport: Optional[Any] = None,
+        calendar: Optional[MarketCalendar] = None,
+        calendar_reconcile_interval: float = 3600.0
+    ):
         self.api_key = api_key
-    
-    async def _make_request(self, function: str, symbol: str = None, **kwargs) -> Dict[str, Any]:
-        """Make HTTP request to Alpha Vantage API"""
+        self.transport = transport or HttpTransport(
+            base_url=base_url or self.BASE_URL,
+            pool_size=pool_size,
+            keepalive_timeout=keepalive_timeout,
+            dns_cache_ttl=dns_cache_ttl,
+            request_timeout=request_timeout,
+            connect_timeout=connect_timeout
+        )
+        self.rate_limiter = RateLimiter(per_minute=requests_per_minute, per_day=requests_per_day, background_share=background_share)
+        self._inflight = SingleFlight()
+        self.cache = ResponseCache(max_bytes=cache_max_bytes, path=cache_path)
+        self.store = SeriesStore(series_store_path) if series_store_path else None
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_grace = stale_grace
+        self._background: Set[asyncio.Task] = set()
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retries = 0
+        self.series_datatype = series_datatype
+        self.bulk_quotes = bulk_quotes
+        self.quote_batcher = QuoteBatcher(self.get_bulk_quotes, window=quote_batch_window, max_batch=self.MAX_BULK_SYMBOLS)
+        self.breaker = CircuitBreaker(failure_threshold=breaker_failure_threshold, reset_timeout=breaker_reset_timeout)
+        self.calendar = calendar or MarketCalendar()
+        self.calendar_reconcile_interval = calendar_reconcile_interval
+        self._calendar_checked = 0.0
+        self.incremental_refreshes = 0
+        self.full_refreshes = 0
+        self.revised_bars = 0
+
+    async def start(self):
+        """Open the transport's shared HTTP session"""
+        await self.transport.start()
+
+    async def close(self):
+        """Close the transport, release pooled connections and close the cache"""
+        await self.transport.close()
+        self.cache.close()
+        if self.store is not None:
+            self.store.close()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @staticmethod
+    def _request_key(params: Dict[str, Any]) -> tuple:
+        """Canonical (function, params) key for a request, excluding the API key"""
+        return (params["function"],) + tuple(sorted(
+            (name, str(value)) for name, value in params.items()
+            if name not in ("function", "apikey") and value is not None
+        ))
+    
+    @staticmethod
+    def _cache_key(request_key: tuple) -> str:
+        return ResponseCache.make_key(request_key)
+
+    async def _make_request(self, function: str, symbol: str = None, *, decode: str = "json", **kwargs) -> Any:
+        """Make HTTP request to Alpha Vantage API.
+
+        decode="json" returns the response dict; decode="columns" streams a
+        time-series response straight into a TimeSeries; decode="csv"
+        requests datatype=csv and parses it into a TimeSeries.
+        """
         params = {
             "function": function,
             "apikey": self.api_key,
@@ -25,44 +217,359 @@ class AlphaVantageClient:
         }
         if symbol:
             params["symbol"] = symbol
+        if decode == "csv":
+            params["datatype"] = "csv"
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self.BASE_URL, params=params) as response:
-                if response.status != 200:
-                    raise Exception(f"Alpha Vantage API error: {response.status}")
-                return await response.json()
+        key = self._request_key(params) + (("_decode", decode),)
+        cache_key = self._cache_key(key)
+        if self.stale_while_revalidate:
+            cached = await self.cache.get_or_stale(cache_key, self.stale_grace)
+            if cached is not None:
+                value, overdue = cached
+                if not overdue:
+                    return value
+                self._revalidate(key, cache_key, params, decode)
+                return annotate_response(value, stale=True, stale_for_s=round(overdue, 1))
+        else:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        # Identical concurrent requests share one upstream call
+        try:
+            return await self._inflight.do(key, lambda: self._load(cache_key, params, decode))
+        except (CircuitOpenError,) + UPSTREAM_FAILURES:
+            fallback = await self.cache.get_last_good(cache_key)
+            if fallback is None:
+                raise
+            value, overdue = fallback
+            return annotate_response(value, stale=True, stale_for_s=round(overdue, 1), circuit=self.breaker.state)
+
+    def _revalidate(self, key: tuple, cache_key: str, params: Dict[str, Any], decode: str):
+        """Refresh an expired cache entry in the background at low priority"""
+        async def refresh():
+            with priority_scope(Priority.BACKGROUND):
+                await self._inflight.do(key, lambda: self._load(cache_key, params, decode))
+
+        task = asyncio.ensure_future(refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background_done)
+
+    def _background_done(self, task: asyncio.Task):
+        self._background.discard(task)
+        if not task.cancelled():
+            # A failed refresh leaves the stale entry in place; the next caller retries
+            task.exception()
+
+    async def _load(self, cache_key: str, params: Dict[str, Any], decode: str) -> Any:
+        """Fetch a response upstream and store it in the cache"""
+        if not self.breaker.allow():
+            raise CircuitOpenError(
+                f"Alpha Vantage circuit open, retry in {self.breaker.retry_after():.0f}s"
+            )
+        try:
+            data, queue_wait = await self._fetch(params, decode)
+        except UPSTREAM_FAILURES:
+            self.breaker.record_failure()
+            raise
+        except AlphaVantageError:
+            # The upstream answered, if only with an error; connectivity is fine
+            self.breaker.record_success()
+            raise
+        except BaseException:
+            # Cancelled or failed before an answer arrived; say nothing about the upstream
+            self.breaker.record_abandoned()
+            raise
+        self.breaker.record_success()
+        function = params["function"]
+        await self.cache.set(cache_key, function, data, self._ttl(function, params))
+        await self._store_series(params, data)
+        if queue_wait > 0.001:
+            data = annotate_response(data, queue_wait_ms=round(queue_wait * 1000, 1))
+        return data
+
+    async def _store_series(self, params: Dict[str, Any], data: Any):
+        """Append a decoded price series to the on-disk series store"""
+        if self.store is None or not isinstance(data, TimeSeries):
+            return
+        interval = store_interval(params["function"], params)
+        if interval is None or not params.get("symbol"):
+            return
+        full = params.get("outputsize") == "full"
+        await asyncio.to_thread(self.store.write, params["symbol"], interval, data, full)
+
+    def stored_series(self, symbol: str, interval: str) -> Optional[TimeSeries]:
+        """Zero-copy, read-only view of a stored series ("daily", "5min", ...), or None"""
+        if self.store is None:
+            return None
+        return self.store.read(symbol, interval)
+
+    def settled_daily(self, symbol: str, full_history: bool = False) -> Optional[TimeSeries]:
+        """Stored daily bars, if they already end at the last settled session; never calls upstream"""
+        if self.store is None or (full_history and not self.store.has_full_history(symbol, "daily")):
+            return None
+        settled = self.calendar.last_settled_session()
+        daily = self.store.read(symbol, "daily")
+        if settled is None or daily is None or not len(daily):
+            return None
+        return daily if format_timestamp(daily.timestamps[-1]) == settled.isoformat() else None
+
+    def _ttl(self, function: str, params: Dict[str, Any]) -> float:
+        """Cache lifetime of a response: exact to the market calendar for market data, TTL_POLICY otherwise"""
+        base = ttl_for(function, params)
+        if base <= 0 or not is_market_function(function):
+            return base
+        self._schedule_calendar_reconcile()
+        return max(0.0, self.calendar.expires_at(function, params, base) - time.time())
+
+    def _schedule_calendar_reconcile(self):
+        """Check the calendar against MARKET_STATUS in the background, at most once per interval"""
+        if self.calendar_reconcile_interval <= 0:
+            return
+        now = time.monotonic()
+        if self._calendar_checked and now - self._calendar_checked < self.calendar_reconcile_interval:
+            return
+        self._calendar_checked = now
+
+        async def reconcile():
+            with priority_scope(Priority.BACKGROUND):
+                self.calendar.reconcile(await self.get_global_market_status())
+
+        task = asyncio.ensure_future(reconcile())
+        self._background.add(task)
+        task.add_done_callback(self._background_done)
+
+    async def _fetch(self, params: Dict[str, Any], decode: str) -> tuple:
+        """Send a rate-limited request upstream, retrying throttles, and return (data, queue_wait)"""
+        queue_wait = 0.0
+        for attempt in range(self.max_retries + 1):
+            queue_wait += await self.rate_limiter.acquire()
+            try:
+                data = await self._send(params, decode)
+            except AlphaVantageError as e:
+                transient = isinstance(e, AlphaVantageThrottleError) or (
+                    isinstance(e, AlphaVantageHTTPError) and (e.status == 429 or e.status >= 500)
+                )
+                if not transient or attempt == self.max_retries:
+                    raise
+                self.retries += 1
+                # Full jitter keeps concurrent retries from arriving together
+                await asyncio.sleep(random.uniform(0, self.retry_base_delay * 2 ** attempt))
+            else:
+                return data, queue_wait
+
+    async def _send(self, params: Dict[str, Any], decode: str = "json") -> Any:
+        """Send one request and raise if Alpha Vantage reports an error"""
+        async with self.transport.get(params) as response:
+            if response.status != 200:
+                raise AlphaVantageHTTPError(response.status)
+            if decode == "csv":
+                body = await response.read()
+                if not body.lstrip().startswith(b"{"):
+                    metadata = {
+                        name: value for name, value in params.items()
+                        if name not in ("function", "apikey", "datatype")
+                    }
+                    return await asyncio.to_thread(parse_csv, body, series_key_for(params), metadata)
+                # Errors come back as JSON even for datatype=csv
+                data = json.loads(body)
+            elif decode == "columns":
+                parser = StreamingSeriesParser(size_hint=response.content_length or 0)
+                async for chunk in response.iter_chunks(self.STREAM_CHUNK_SIZE):
+                    parser.feed(chunk)
+                series = parser.finish()
+                if series is not None:
+                    return series
+                # Not a series: an error payload, decoded below
+                data = json.loads(parser.raw)
+            else:
+                data = json.loads(await response.read())
+        error = classify_payload(data)
+        if error is not None:
+            raise error
+        if decode != "json":
+            raise AlphaVantageInvalidRequestError(f"{params['function']} response holds no time series")
+        return data
+
+    def stats(self) -> Dict[str, Any]:
+        """Return rate limiter, coalescing and cache counters"""
+        return {
+            "rate_limiter": self.rate_limiter.stats(),
+            "single_flight": self._inflight.stats(),
+            "retries": self.retries,
+            "circuit_breaker": self.breaker.stats(),
+            "cache": self.cache.stats(),
+            "quote_batcher": self.quote_batcher.stats(),
+            "calendar": self.calendar.stats(),
+            "series_store": self.store.stats() if self.store is not None else None,
+            "history": {
+                "incremental_refreshes": self.incremental_refreshes,
+                "full_refreshes": self.full_refreshes,
+                "revised_bars": self.revised_bars,
+            },
+        }
             
-    async def get_stock_price(self, symbol: str, interval: str = "5min") -> Dict[str, Any]:
+    def _series_decode(self, as_columns: bool, datatype: Optional[str] = None) -> str:
+        """Pick the decode mode for a time-series call: plain JSON dict, streamed JSON or CSV columns"""
+        if not as_columns:
+            return "json"
+        return "csv" if (datatype or self.series_datatype) == "csv" else "columns"
+
+    async def get_series_columns(self, function: str, symbol: str = None, datatype: Optional[str] = None, **kwargs) -> TimeSeries:
+        """Fetch any time-series or technical-indicator function decoded into numeric columns"""
+        return await self._make_request(function, symbol, decode=self._series_decode(True, datatype), **kwargs)
+
+    async def _get_history(self, function: str, symbol: str, decode: str, **kwargs) -> TimeSeries:
+        """Return a full-history series, kept current by merging `compact` refreshes into the stored copy"""
+        params = {"function": function, "symbol": symbol, "outputsize": "full", **kwargs}
+        if decode == "csv":
+            params["datatype"] = "csv"
+        key = self._request_key(params) + (("_decode", decode),)
+        cache_key = self._cache_key(key)
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        return await self._inflight.do(
+            key + (("_refresh", "incremental"),),
+            lambda: self._refresh_history(cache_key, function, symbol, decode, kwargs)
+        )
+
+    async def _refresh_history(self, cache_key: str, function: str, symbol: str, decode: str, kwargs: Dict[str, Any]) -> TimeSeries:
+        stored = await self.cache.get_last_good(cache_key)
+        if stored is None and self.store is not None:
+            # After a cache eviction or restart the series store still holds the history
+            interval = store_interval(function, kwargs)
+            if interval and self.store.has_full_history(symbol, interval):
+                stored = (self.store.read(symbol, interval), 0.0)
+        if stored is not None and len(stored[0]):
+            history = stored[0]
+            try:
+                update = await self._make_request(function, symbol, decode=decode, outputsize="compact", **kwargs)
+            except (CircuitOpenError,) + UPSTREAM_FAILURES:
+                return annotate_response(history, stale=True, stale_for_s=round(stored[1], 1), circuit=self.breaker.state)
+            merged, revised = merge_series(history, update)
+            # The newest stored bar may have been recorded mid-session; a change to
+            # any older bar (or no overlap at all) means the stored copy can't be patched
+            overlaps = len(update) and update.timestamps[0] <= history.timestamps[-1]
+            if overlaps and not (revised < history.timestamps[-1]).any():
+                self.incremental_refreshes += 1
+                self.revised_bars += len(revised)
+                await self.cache.set(cache_key, function, merged, self._ttl(function, kwargs))
+                await self._store_series({"function": function, "symbol": symbol, "outputsize": "full", **kwargs}, merged)
+                return merged.with_meta(revised_bars=len(revised)) if len(revised) else merged
+        self.full_refreshes += 1
+        return await self._make_request(function, symbol, decode=decode, outputsize="full", **kwargs)
+
+    async def cached_response(self, function: str, symbol: Optional[str] = None, decode: str = "json", **kwargs) -> Any:
+        """Return the fresh cached response for a request, or None; never calls upstream"""
+        params = {"function": function, **kwargs}
+        if symbol:
+            params["symbol"] = symbol
+        if decode == "csv":
+            params["datatype"] = "csv"
+        return await self.cache.peek(self._cache_key(self._request_key(params) + (("_decode", decode),)))
+
+    async def cached_series(self, function: str, symbol: str, **kwargs) -> Optional[TimeSeries]:
+        """Return a fresh cached columnar response for a request, or None; never calls upstream"""
+        for decode in ("columns", "csv"):
+            value = await self.cached_response(function, symbol, decode, **kwargs)
+            if value is not None:
+                return value
+        return None
+
+    async def resampled_intraday(self, symbol: str, interval: str, outputsize: str = "compact") -> Optional[TimeSeries]:
+        """Intraday bars resampled from a fresh cached finer interval, if one covers the request; never calls upstream"""
+        target = interval_minutes(interval)
+        if target is None:
+            return None
+        now = self.calendar.wall_clock_seconds()
+        # Coarsest usable source first: least work, and the most history per bar
+        for source in sorted((m for m in INTRADAY_MINUTES if m < target and target % m == 0), reverse=True):
+            for source_size in ("full", "compact"):
+                if outputsize == "full" and source_size == "compact":
+                    continue
+                series = await self.cached_series(
+                    "TIME_SERIES_INTRADAY", symbol, interval=f"{source}min", outputsize=source_size
+                )
+                if series is None or not len(series):
+                    continue
+                resampled = to_intraday_interval(series, source, target, now=now)
+                if outputsize == "full":
+                    return resampled
+                # A compact answer must hold as many bars as Alpha Vantage would send
+                if len(resampled) >= COMPACT_BARS:
+                    return resampled.tail(COMPACT_BARS)
+        return None
+
+    async def get_stock_price(self, symbol: str, interval: str = "5min", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get intraday stock price data"""
-        return await self._make_request("TIME_SERIES_INTRADAY", symbol, interval=interval)
+        return await self._make_request("TIME_SERIES_INTRADAY", symbol, decode=self._series_decode(as_columns, datatype), interval=interval)
         
     async def get_stock_quote(self, symbol: str) -> Dict[str, Any]:
         """Get current stock quote"""
-        return await self._make_request("GLOBAL_QUOTE", symbol)
+        if not self.bulk_quotes:
+            return await self._make_request("GLOBAL_QUOTE", symbol)
+        # Concurrent single-symbol quotes are merged into one bulk call and
+        # the results cached under each symbol's own GLOBAL_QUOTE key
+        params = {"function": "GLOBAL_QUOTE", "symbol": symbol}
+        cache_key = self._cache_key(self._request_key(params) + (("_decode", "json"),))
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        try:
+            quote = bulk_row_to_global_quote(await self.quote_batcher.get(symbol.upper()))
+        except AlphaVantagePremiumError:
+            # The key does not include bulk quotes; stop trying
+            self.bulk_quotes = False
+            return await self._make_request("GLOBAL_QUOTE", symbol)
+        except KeyError:
+            return await self._make_request("GLOBAL_QUOTE", symbol)
+        await self.cache.set(cache_key, "GLOBAL_QUOTE", quote, self._ttl("GLOBAL_QUOTE", params))
+        return quote
+
+    async def get_bulk_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get realtime quotes for many symbols, up to 100 per upstream call, keyed by symbol"""
+        symbols = sorted({symbol.upper() for symbol in symbols})
+        chunks = [symbols[i:i + self.MAX_BULK_SYMBOLS] for i in range(0, len(symbols), self.MAX_BULK_SYMBOLS)]
+        responses = await asyncio.gather(*[
+            self._make_request("REALTIME_BULK_QUOTES", ",".join(chunk)) for chunk in chunks
+        ])
+        quotes = {}
+        for response in responses:
+            for row in response.get("data", []):
+                quotes[str(row.get("symbol", "")).upper()] = row
+        return quotes
     
     async def get_company_overview(self, symbol: str) -> Dict[str, Any]:
         """Get company overview and fundamentals"""
         return await self._make_request("OVERVIEW", symbol)
     
-    async def get_time_series_daily(self, symbol: str, outputsize: str = "compact") -> Dict[str, Any]:
+    async def get_time_series_daily(self, symbol: str, outputsize: str = "compact", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get daily time series data"""
-        return await self._make_request("TIME_SERIES_DAILY", symbol, outputsize=outputsize)
-    
-    async def get_time_series_intraday(self, symbol: str, interval: str = "5min") -> Dict[str, Any]:
-        """Get intraday time series data"""
-        return await self._make_request("TIME_SERIES_INTRADAY", symbol, interval=interval)
-
-    async def get_intraday(self, symbol: str, interval: str = "1min") -> Dict[str, Any]:
+        decode = self._series_decode(as_columns, datatype)
+        if outputsize == "full" and decode != "json":
+            return await self._get_history("TIME_SERIES_DAILY", symbol, decode)
+        return await self._make_request("TIME_SERIES_DAILY", symbol, decode=decode, outputsize=outputsize)
+    
+    async def get_time_series_intraday(self, symbol: str, interval: str = "5min", as_columns: bool = False, datatype: Optional[str] = None, outputsize: str = "compact", adjusted: bool = True) -> Any:
+        """Get intraday time series data; `adjusted=False` asks for raw bars, without split and dividend adjustment"""
+        decode = self._series_decode(as_columns, datatype)
+        # Only the non-default is sent, so adjusted requests keep their cache keys
+        extra = {} if adjusted else {"adjusted": "false"}
+        if outputsize == "full" and decode != "json":
+            return await self._get_history("TIME_SERIES_INTRADAY", symbol, decode, interval=interval, **extra)
+        return await self._make_request("TIME_SERIES_INTRADAY", symbol, decode=decode, interval=interval, outputsize=outputsize, **extra)
+
+    async def get_intraday(self, symbol: str, interval: str = "1min", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get intraday time series data for a stock"""
-        return await self._make_request("TIME_SERIES_INTRADAY", symbol, interval=interval)
+        return await self._make_request("TIME_SERIES_INTRADAY", symbol, decode=self._series_decode(as_columns, datatype), interval=interval)
 
-    async def get_time_series_weekly(self, symbol: str) -> Dict[str, Any]:
+    async def get_time_series_weekly(self, symbol: str, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get weekly time series data"""
-        return await self._make_request("TIME_SERIES_WEEKLY", symbol)
+        return await self._make_request("TIME_SERIES_WEEKLY", symbol, decode=self._series_decode(as_columns, datatype))
 
-    async def get_time_series_monthly(self, symbol: str) -> Dict[str, Any]:
+    async def get_time_series_monthly(self, symbol: str, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get monthly time series data"""
-        return await self._make_request("TIME_SERIES_MONTHLY", symbol)
+        return await self._make_request("TIME_SERIES_MONTHLY", symbol, decode=self._series_decode(as_columns, datatype))
 
     async def search_ticker(self, keywords: str) -> Dict[str, Any]:
         """Search ticker symbols based on keywords"""
@@ -184,33 +691,33 @@ class AlphaVantageClient:
         """Get Exchange Rates Trending for a given symbol"""
         return await self._make_request("EXCHANGE_RATES_TRENDING", symbol)
 
-    async def get_fx_daily_data(self, symbol: str) -> Dict[str, Any]:
+    async def get_fx_daily_data(self, symbol: str, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Daily FX (foreign exchange) rates for a given symbol"""
-        return await self._make_request("FX_DAILY", symbol)
+        return await self._make_request("FX_DAILY", symbol, decode=self._series_decode(as_columns, datatype))
 
-    async def get_fx_weekly_data(self, symbol: str) -> Dict[str, Any]:
+    async def get_fx_weekly_data(self, symbol: str, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Weekly FX rates for a given symbol"""
-        return await self._make_request("FX_WEEKLY", symbol)
+        return await self._make_request("FX_WEEKLY", symbol, decode=self._series_decode(as_columns, datatype))
 
-    async def get_fx_monthly_data(self, symbol: str) -> Dict[str, Any]:
+    async def get_fx_monthly_data(self, symbol: str, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Monthly FX rates for a given symbol"""
-        return await self._make_request("FX_MONTHLY", symbol)
+        return await self._make_request("FX_MONTHLY", symbol, decode=self._series_decode(as_columns, datatype))
                 
     async def get_exchange_rates_trending(self, symbol: str) -> Dict[str, Any]:
         """Get Exchange Rates Trending for a given symbol"""
         return await self._make_request("EXCHANGE_RATES_TRENDING", symbol)
 
-    async def get_fx_daily_data(self, symbol: str) -> Dict[str, Any]:
+    async def get_fx_daily_data(self, symbol: str, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Daily FX (foreign exchange) rates for a given symbol"""
-        return await self._make_request("FX_DAILY", symbol)
+        return await self._make_request("FX_DAILY", symbol, decode=self._series_decode(as_columns, datatype))
 
-    async def get_fx_weekly_data(self, symbol: str) -> Dict[str, Any]:
+    async def get_fx_weekly_data(self, symbol: str, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Weekly FX rates for a given symbol"""
-        return await self._make_request("FX_WEEKLY", symbol)
+        return await self._make_request("FX_WEEKLY", symbol, decode=self._series_decode(as_columns, datatype))
 
-    async def get_fx_monthly_data(self, symbol: str) -> Dict[str, Any]:
+    async def get_fx_monthly_data(self, symbol: str, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Monthly FX rates for a given symbol"""
-        return await self._make_request("FX_MONTHLY", symbol)
+        return await self._make_request("FX_MONTHLY", symbol, decode=self._series_decode(as_columns, datatype))
 
 
 
@@ -299,214 +806,214 @@ class AlphaVantageClient:
         """Get US Non-Farm Payrolls data"""
         return await self._make_request("NONFARM_PAYROLL", symbol=None)
 
-    async def get_sma(self, symbol: str, interval: str = "daily", time_period: int = 20, series_type: str = "close") -> Dict[str, Any]:
+    async def get_sma(self, symbol: str, interval: str = "daily", time_period: int = 20, series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Simple Moving Average (SMA) data"""
-        return await self._make_request("SMA", symbol, interval=interval, time_period=time_period, series_type=series_type)
+        return await self._make_request("SMA", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period, series_type=series_type)
     
-    async def get_ema(self, symbol: str, interval: str = "daily", time_period: int = 20, series_type: str = "close") -> Dict[str, Any]:
+    async def get_ema(self, symbol: str, interval: str = "daily", time_period: int = 20, series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Exponential Moving Average (EMA) data"""
-        return await self._make_request("EMA", symbol, interval=interval, time_period=time_period, series_type=series_type)
+        return await self._make_request("EMA", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period, series_type=series_type)
     
-    async def get_wma(self, symbol: str, interval: str = "daily", time_period: int = 20, series_type: str = "close") -> Dict[str, Any]:
+    async def get_wma(self, symbol: str, interval: str = "daily", time_period: int = 20, series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Weighted Moving Average (WMA) data"""
-        return await self._make_request("WMA", symbol, interval=interval, time_period=time_period, series_type=series_type)
+        return await self._make_request("WMA", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period, series_type=series_type)
     
-    async def get_dema(self, symbol: str, interval: str = "daily", time_period: int = 20, series_type: str = "close") -> Dict[str, Any]:
+    async def get_dema(self, symbol: str, interval: str = "daily", time_period: int = 20, series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Double Exponential Moving Average (DEMA) data"""
-        return await self._make_request("DEMA", symbol, interval=interval, time_period=time_period, series_type=series_type)
+        return await self._make_request("DEMA", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period, series_type=series_type)
     
-    async def get_tema(self, symbol: str, interval: str = "daily", time_period: int = 20, series_type: str = "close") -> Dict[str, Any]:
+    async def get_tema(self, symbol: str, interval: str = "daily", time_period: int = 20, series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Triple Exponential Moving Average (TEMA) data"""
-        return await self._make_request("TEMA", symbol, interval=interval, time_period=time_period, series_type=series_type)
+        return await self._make_request("TEMA", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period, series_type=series_type)
     
-    async def get_trima(self, symbol: str, interval: str = "daily", time_period: int = 20, series_type: str = "close") -> Dict[str, Any]:
+    async def get_trima(self, symbol: str, interval: str = "daily", time_period: int = 20, series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Triangular Moving Average (TRIMA) data"""
-        return await self._make_request("TRIMA", symbol, interval=interval, time_period=time_period, series_type=series_type)
+        return await self._make_request("TRIMA", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period, series_type=series_type)
     
-    async def get_kama(self, symbol: str, interval: str = "daily", time_period: int = 20, series_type: str = "close") -> Dict[str, Any]:
+    async def get_kama(self, symbol: str, interval: str = "daily", time_period: int = 20, series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Kaufman Adaptive Moving Average (KAMA) data"""
-        return await self._make_request("KAMA", symbol, interval=interval, time_period=time_period, series_type=series_type)
+        return await self._make_request("KAMA", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period, series_type=series_type)
     
-    async def get_mama(self, symbol: str, interval: str = "daily", fastlimit: float = 0.5, slowlimit: float = 0.05, series_type: str = "close") -> Dict[str, Any]:
+    async def get_mama(self, symbol: str, interval: str = "daily", fastlimit: float = 0.5, slowlimit: float = 0.05, series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get MESA Adaptive Moving Average (MAMA) data"""
-        return await self._make_request("MAMA", symbol, interval=interval, fast_limit=fastlimit, slow_limit=slowlimit, series_type=series_type)
+        return await self._make_request("MAMA", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, fast_limit=fastlimit, slow_limit=slowlimit, series_type=series_type)
     
-    async def get_vwap(self, symbol: str, interval: str = "daily") -> Dict[str, Any]:
+    async def get_vwap(self, symbol: str, interval: str = "daily", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Volume Weighted Average Price (VWAP) data"""
-        return await self._make_request("VWAP", symbol, interval=interval)
+        return await self._make_request("VWAP", symbol, decode=self._series_decode(as_columns, datatype), interval=interval)
     
-    async def get_tthree(self, symbol: str, interval: str = "daily", time_period: int = 20, series_type: str = "close") -> Dict[str, Any]:
+    async def get_tthree(self, symbol: str, interval: str = "daily", time_period: int = 20, series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Triple Exponential Moving Average (T3) data"""
-        return await self._make_request("T3", symbol, interval=interval, time_period=time_period, series_type=series_type)
+        return await self._make_request("T3", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period, series_type=series_type)
     
     #async def get_macd(self, symbol: str, interval: str = "daily", fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9, series_type: str = "close") -> Dict[str, Any]:
     #    """Get Moving Average Convergence Divergence (MACD) data"""
     #    return await self._make_request("MACD", symbol, interval=interval, fast_period=fastperiod, slow_period=slowperiod, signal_period=signalperiod, series_type=series_type)
 
-    async def get_macdext(self, symbol: str, interval: str = "daily", fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9, series_type: str = "close", fastmatype: int = 0, slowmatype: int = 0, signalmatype: int = 0) -> Dict[str, Any]:
+    async def get_macdext(self, symbol: str, interval: str = "daily", fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9, series_type: str = "close", fastmatype: int = 0, slowmatype: int = 0, signalmatype: int = 0, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get MACD with additional parameters"""
-        return await self._make_request("MACDEXT", symbol, interval=interval, fast_period=fastperiod, slow_period=slowperiod, signal_period=signalperiod, series_type=series_type, fastmatype=fastmatype, slowmatype=slowmatype, signalmatype=signalmatype)
+        return await self._make_request("MACDEXT", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, fast_period=fastperiod, slow_period=slowperiod, signal_period=signalperiod, series_type=series_type, fastmatype=fastmatype, slowmatype=slowmatype, signalmatype=signalmatype)
     
-    async def get_stoch(self, symbol: str, interval: str = "daily", fastkperiod: int = 5, slowkperiod: int = 3, slowdperiod: int = 3, slowkmatype: int = 0, slowdmatype: int = 0) -> Dict[str, Any]:
+    async def get_stoch(self, symbol: str, interval: str = "daily", fastkperiod: int = 5, slowkperiod: int = 3, slowdperiod: int = 3, slowkmatype: int = 0, slowdmatype: int = 0, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Stochastic Oscillator data"""
-        return await self._make_request("STOCH", symbol, interval=interval, fastk_period=fastkperiod, slowk_period=slowkperiod, slowd_period=slowdperiod, slowkmatype=slowkmatype, slowdmatype=slowdmatype)
+        return await self._make_request("STOCH", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, fastk_period=fastkperiod, slowk_period=slowkperiod, slowd_period=slowdperiod, slowkmatype=slowkmatype, slowdmatype=slowdmatype)
     
-    async def get_stochfast(self, symbol: str, interval: str = "daily", fastkperiod: int = 5, fastdperiod: int = 3, fastdmatype: int = 0) -> Dict[str, Any]:
+    async def get_stochfast(self, symbol: str, interval: str = "daily", fastkperiod: int = 5, fastdperiod: int = 3, fastdmatype: int = 0, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Stochastic Fast Oscillator data"""
-        return await self._make_request("STOCHF", symbol, interval=interval, fastk_period=fastkperiod, fastd_period=fastdperiod, fastdmatype=fastdmatype)
+        return await self._make_request("STOCHF", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, fastk_period=fastkperiod, fastd_period=fastdperiod, fastdmatype=fastdmatype)
     
-    async def get_rsi(self, symbol: str, interval: str = "daily", time_period: int = 14, series_type: str = "close") -> Dict[str, Any]:
+    async def get_rsi(self, symbol: str, interval: str = "daily", time_period: int = 14, series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Relative Strength Index (RSI) data"""
-        return await self._make_request("RSI", symbol, interval=interval, time_period=time_period, series_type=series_type)
+        return await self._make_request("RSI", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period, series_type=series_type)
     
-    async def get_stochrsi(self, symbol: str, interval: str = "daily", time_period: int = 14, fastkperiod: int = 5, fastdperiod: int = 3, fastdmatype: int = 0, series_type: str = "close") -> Dict[str, Any]:
+    async def get_stochrsi(self, symbol: str, interval: str = "daily", time_period: int = 14, fastkperiod: int = 5, fastdperiod: int = 3, fastdmatype: int = 0, series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Stochastic RSI data"""
-        return await self._make_request("STOCHRSI", symbol, interval=interval, time_period=time_period, fastk_period=fastkperiod, fastd_period=fastdperiod, fastdmatype=fastdmatype, series_type=series_type)
+        return await self._make_request("STOCHRSI", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period, fastk_period=fastkperiod, fastd_period=fastdperiod, fastdmatype=fastdmatype, series_type=series_type)
     
-    async def get_willr(self, symbol: str, interval: str = "daily", time_period: int = 14) -> Dict[str, Any]:
+    async def get_willr(self, symbol: str, interval: str = "daily", time_period: int = 14, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Williams %R data"""
-        return await self._make_request("WILLR", symbol, interval=interval, time_period=time_period)
+        return await self._make_request("WILLR", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period)
     
-    async def get_adx(self, symbol: str, interval: str = "daily", time_period: int = 14) -> Dict[str, Any]:
+    async def get_adx(self, symbol: str, interval: str = "daily", time_period: int = 14, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Average Directional Index (ADX) data"""
-        return await self._make_request("ADX", symbol, interval=interval, time_period=time_period)
+        return await self._make_request("ADX", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period)
     
-    async def get_adxr(self, symbol: str, interval: str = "daily", time_period: int = 14) -> Dict[str, Any]:
+    async def get_adxr(self, symbol: str, interval: str = "daily", time_period: int = 14, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Average Directional Movement Index Rating (ADXR) data"""
-        return await self._make_request("ADXR", symbol, interval=interval, time_period=time_period)
+        return await self._make_request("ADXR", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period)
     
-    async def get_apo(self, symbol: str, interval: str = "daily", fastperiod: int = 12, slowperiod: int = 26, series_type: str = "close") -> Dict[str, Any]:
+    async def get_apo(self, symbol: str, interval: str = "daily", fastperiod: int = 12, slowperiod: int = 26, series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Absolute Price Oscillator (APO) data"""
-        return await self._make_request("APO", symbol, interval=interval, fast_period=fastperiod, slow_period=slowperiod, series_type=series_type)
+        return await self._make_request("APO", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, fast_period=fastperiod, slow_period=slowperiod, series_type=series_type)
     
-    async def get_ppo(self, symbol: str, interval: str = "daily", fastperiod: int = 12, slowperiod: int = 26, series_type: str = "close", matype: int = 0) -> Dict[str, Any]:
+    async def get_ppo(self, symbol: str, interval: str = "daily", fastperiod: int = 12, slowperiod: int = 26, series_type: str = "close", matype: int = 0, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Percentage Price Oscillator (PPO) data"""
-        return await self._make_request("PPO", symbol, interval=interval, fast_period=fastperiod, slow_period=slowperiod, series_type=series_type, matype=matype)
+        return await self._make_request("PPO", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, fast_period=fastperiod, slow_period=slowperiod, series_type=series_type, matype=matype)
     
-    async def get_mom(self, symbol: str, interval: str = "daily", time_period: int = 10, series_type: str = "close") -> Dict[str, Any]:
+    async def get_mom(self, symbol: str, interval: str = "daily", time_period: int = 10, series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Momentum data"""
-        return await self._make_request("MOM", symbol, interval=interval, time_period=time_period, series_type=series_type)
+        return await self._make_request("MOM", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period, series_type=series_type)
     
-    async def get_bop(self, symbol: str, interval: str = "daily") -> Dict[str, Any]:
+    async def get_bop(self, symbol: str, interval: str = "daily", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Balance of Power (BOP) data"""
-        return await self._make_request("BOP", symbol, interval=interval)
+        return await self._make_request("BOP", symbol, decode=self._series_decode(as_columns, datatype), interval=interval)
     
-    async def get_cci(self, symbol: str, interval: str = "daily", time_period: int = 20) -> Dict[str, Any]:
+    async def get_cci(self, symbol: str, interval: str = "daily", time_period: int = 20, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Commodity Channel Index (CCI) data"""
-        return await self._make_request("CCI", symbol, interval=interval, time_period=time_period)
+        return await self._make_request("CCI", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period)
     
-    async def get_cmo(self, symbol: str, interval: str = "daily", time_period: int = 14, series_type: str = "close") -> Dict[str, Any]:
+    async def get_cmo(self, symbol: str, interval: str = "daily", time_period: int = 14, series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Chande Momentum Oscillator (CMO) data"""
-        return await self._make_request("CMO", symbol, interval=interval, time_period=time_period, series_type=series_type)
+        return await self._make_request("CMO", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period, series_type=series_type)
     
-    async def get_roc(self, symbol: str, interval: str = "daily", time_period: int = 10, series_type: str = "close") -> Dict[str, Any]:
+    async def get_roc(self, symbol: str, interval: str = "daily", time_period: int = 10, series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Rate of Change (ROC) data"""
-        return await self._make_request("ROC", symbol, interval=interval, time_period=time_period, series_type=series_type)
+        return await self._make_request("ROC", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period, series_type=series_type)
     
-    async def get_rocr(self, symbol: str, interval: str = "daily", time_period: int = 10, series_type: str = "close") -> Dict[str, Any]:
+    async def get_rocr(self, symbol: str, interval: str = "daily", time_period: int = 10, series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Rate of Change Ratio (ROCR) data"""
-        return await self._make_request("ROCR", symbol, interval=interval, time_period=time_period, series_type=series_type)
+        return await self._make_request("ROCR", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period, series_type=series_type)
     
-    async def get_aroon(self, symbol: str, interval: str = "daily", time_period: int = 14) -> Dict[str, Any]:
+    async def get_aroon(self, symbol: str, interval: str = "daily", time_period: int = 14, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Aroon Indicator data"""
-        return await self._make_request("AROON", symbol, interval=interval, time_period=time_period)
+        return await self._make_request("AROON", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period)
     
-    async def get_aroonosc(self, symbol: str, interval: str = "daily", time_period: int = 14) -> Dict[str, Any]:
+    async def get_aroonosc(self, symbol: str, interval: str = "daily", time_period: int = 14, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Aroon Oscillator data"""
-        return await self._make_request("AROONOSC", symbol, interval=interval, time_period=time_period)
+        return await self._make_request("AROONOSC", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period)
     
-    async def get_mfi(self, symbol: str, interval: str = "daily", time_period: int = 14) -> Dict[str, Any]:
+    async def get_mfi(self, symbol: str, interval: str = "daily", time_period: int = 14, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Money Flow Index (MFI) data"""
-        return await self._make_request("MFI", symbol, interval=interval, time_period=time_period)
+        return await self._make_request("MFI", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period)
     
-    async def get_trix(self, symbol: str, interval: str = "daily", time_period: int = 30, series_type: str = "close") -> Dict[str, Any]:
+    async def get_trix(self, symbol: str, interval: str = "daily", time_period: int = 30, series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get 1 day rate of change of a Triple Exponential Average (TRIX) data"""
-        return await self._make_request("TRIX", symbol, interval=interval, time_period=time_period, series_type=series_type)
+        return await self._make_request("TRIX", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period, series_type=series_type)
     
-    async def get_ultosc(self, symbol: str, interval: str = "daily", timeperiod1: int = 7, timeperiod2: int = 14, timeperiod3: int = 28) -> Dict[str, Any]:
+    async def get_ultosc(self, symbol: str, interval: str = "daily", timeperiod1: int = 7, timeperiod2: int = 14, timeperiod3: int = 28, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Ultimate Oscillator data"""
-        return await self._make_request("ULTOSC", symbol, interval=interval, timeperiod1=timeperiod1, time_period2=timeperiod2, timeperiod3=timeperiod3)
+        return await self._make_request("ULTOSC", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, timeperiod1=timeperiod1, time_period2=timeperiod2, timeperiod3=timeperiod3)
     
-    async def get_dx(self, symbol: str, interval: str = "daily", time_period: int = 14) -> Dict[str, Any]:
+    async def get_dx(self, symbol: str, interval: str = "daily", time_period: int = 14, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Directional Movement Index (DX) data"""
-        return await self._make_request("DX", symbol, interval=interval, time_period=time_period)
+        return await self._make_request("DX", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period)
     
-    async def get_minus_di(self, symbol: str, interval: str = "daily", time_period: int = 14) -> Dict[str, Any]:
+    async def get_minus_di(self, symbol: str, interval: str = "daily", time_period: int = 14, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Minus Directional Indicator (-DI) data"""
-        return await self._make_request("MINUS_DI", symbol, interval=interval, time_period=time_period)
+        return await self._make_request("MINUS_DI", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period)
     
-    async def get_plus_di(self, symbol: str, interval: str = "daily", time_period: int = 14) -> Dict[str, Any]:
+    async def get_plus_di(self, symbol: str, interval: str = "daily", time_period: int = 14, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Plus Directional Indicator (+DI) data"""
-        return await self._make_request("PLUS_DI", symbol, interval=interval, time_period=time_period)
+        return await self._make_request("PLUS_DI", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period)
     
-    async def get_minus_dm(self, symbol: str, interval: str = "daily", time_period: int = 14) -> Dict[str, Any]:
+    async def get_minus_dm(self, symbol: str, interval: str = "daily", time_period: int = 14, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Minus Directional Movement (-DM) data"""
-        return await self._make_request("MINUS_DM", symbol, interval=interval, time_period=time_period)
+        return await self._make_request("MINUS_DM", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period)
     
-    async def get_plus_dm(self, symbol: str, interval: str = "daily", time_period: int = 14) -> Dict[str, Any]:
+    async def get_plus_dm(self, symbol: str, interval: str = "daily", time_period: int = 14, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Plus Directional Movement (+DM) data"""
-        return await self._make_request("PLUS_DM", symbol, interval=interval, time_period=time_period)
+        return await self._make_request("PLUS_DM", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period)
     
-    async def get_bbands(self, symbol: str, interval: str = "daily", time_period: int = 20, nbdevup: int = 2, nbdevdn: int = 2, series_type: str = "close") -> Dict[str, Any]:
+    async def get_bbands(self, symbol: str, interval: str = "daily", time_period: int = 20, nbdevup: int = 2, nbdevdn: int = 2, series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Bollinger Bands data"""
-        return await self._make_request("BBANDS", symbol, interval=interval, time_period=time_period, nbdevup=nbdevup, nbdevdn=nbdevdn, series_type=series_type)
+        return await self._make_request("BBANDS", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period, nbdevup=nbdevup, nbdevdn=nbdevdn, series_type=series_type)
     
-    async def get_midpoint(self, symbol: str, interval: str = "daily", time_period: int = 14, series_type: str = "close") -> Dict[str, Any]:
+    async def get_midpoint(self, symbol: str, interval: str = "daily", time_period: int = 14, series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Midpoint data"""
-        return await self._make_request("MIDPOINT", symbol, interval=interval, time_period=time_period, series_type=series_type)
+        return await self._make_request("MIDPOINT", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period, series_type=series_type)
     
-    async def get_midprice(self, symbol: str, interval: str = "daily", time_period: int = 14) -> Dict[str, Any]:
+    async def get_midprice(self, symbol: str, interval: str = "daily", time_period: int = 14, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Midprice data"""
-        return await self._make_request("MIDPRICE", symbol, interval=interval, time_period=time_period)
+        return await self._make_request("MIDPRICE", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period)
     
-    async def get_sar(self, symbol: str, interval: str = "daily", acceleration: float = 0.02, maximum: float = 0.2) -> Dict[str, Any]:
+    async def get_sar(self, symbol: str, interval: str = "daily", acceleration: float = 0.02, maximum: float = 0.2, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Parabolic SAR data"""
-        return await self._make_request("SAR", symbol, interval=interval, acceleration=acceleration, maximum=maximum)
+        return await self._make_request("SAR", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, acceleration=acceleration, maximum=maximum)
     
-    async def get_trange(self, symbol: str, interval: str = "daily") -> Dict[str, Any]:
+    async def get_trange(self, symbol: str, interval: str = "daily", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get True Range data"""
-        return await self._make_request("TRANGE", symbol, interval=interval)
+        return await self._make_request("TRANGE", symbol, decode=self._series_decode(as_columns, datatype), interval=interval)
     
-    async def get_atr(self, symbol: str, interval: str = "daily", time_period: int = 14) -> Dict[str, Any]:
+    async def get_atr(self, symbol: str, interval: str = "daily", time_period: int = 14, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Average True Range (ATR) data"""
-        return await self._make_request("ATR", symbol, interval=interval, time_period=time_period)
+        return await self._make_request("ATR", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period)
     
-    async def get_natr(self, symbol: str, interval: str = "daily", time_period: int = 14) -> Dict[str, Any]:
+    async def get_natr(self, symbol: str, interval: str = "daily", time_period: int = 14, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Normalized Average True Range (NATR) data"""
-        return await self._make_request("NATR", symbol, interval=interval, time_period=time_period)
+        return await self._make_request("NATR", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, time_period=time_period)
     
-    async def get_ad(self, symbol: str, interval: str = "daily") -> Dict[str, Any]:
+    async def get_ad(self, symbol: str, interval: str = "daily", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Chaikin A/D Line data"""
-        return await self._make_request("AD", symbol, interval=interval)
+        return await self._make_request("AD", symbol, decode=self._series_decode(as_columns, datatype), interval=interval)
     
-    async def get_adosc(self, symbol: str, interval: str = "daily", fastperiod: int = 3, slowperiod: int = 10) -> Dict[str, Any]:
+    async def get_adosc(self, symbol: str, interval: str = "daily", fastperiod: int = 3, slowperiod: int = 10, as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Chaikin A/D Oscillator data"""
-        return await self._make_request("ADOSC", symbol, interval=interval, fast_period=fastperiod, slow_period=slowperiod)
+        return await self._make_request("ADOSC", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, fast_period=fastperiod, slow_period=slowperiod)
     
-    async def get_obv(self, symbol: str, interval: str = "daily") -> Dict[str, Any]:
+    async def get_obv(self, symbol: str, interval: str = "daily", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get On-Balance Volume (OBV) data"""
-        return await self._make_request("OBV", symbol, interval=interval)
+        return await self._make_request("OBV", symbol, decode=self._series_decode(as_columns, datatype), interval=interval)
     
-    async def get_ht_trendliner(self, symbol: str, interval: str = "daily", series_type: str = "close") -> Dict[str, Any]:
+    async def get_ht_trendliner(self, symbol: str, interval: str = "daily", series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Hilbert Transform - Trendline data"""
-        return await self._make_request("HT_TRENDLINE", symbol, interval=interval, series_type=series_type)
+        return await self._make_request("HT_TRENDLINE", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, series_type=series_type)
     
-    async def get_ht_sine(self, symbol: str, interval: str = "daily", series_type: str = "close") -> Dict[str, Any]:
+    async def get_ht_sine(self, symbol: str, interval: str = "daily", series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Hilbert Transform - SineWave data"""
-        return await self._make_request("HT_SINE", symbol, interval=interval, series_type=series_type)
+        return await self._make_request("HT_SINE", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, series_type=series_type)
     
-    async def get_ht_trendmode(self, symbol: str, interval: str = "daily", series_type: str = "close") -> Dict[str, Any]:
+    async def get_ht_trendmode(self, symbol: str, interval: str = "daily", series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Hilbert Transform - Trend Mode data"""
-        return await self._make_request("HT_TRENDMODE", symbol, interval=interval, series_type=series_type)
+        return await self._make_request("HT_TRENDMODE", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, series_type=series_type)
     
-    async def get_ht_dcperiod(self, symbol: str, interval: str = "daily", series_type: str = "close") -> Dict[str, Any]:
+    async def get_ht_dcperiod(self, symbol: str, interval: str = "daily", series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Hilbert Transform - Dominant Cycle Period data"""
-        return await self._make_request("HT_DCPERIOD", symbol, interval=interval, series_type=series_type)
+        return await self._make_request("HT_DCPERIOD", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, series_type=series_type)
     
-    async def get_ht_dcphase(self, symbol: str, interval: str = "daily", series_type: str = "close") -> Dict[str, Any]:
+    async def get_ht_dcphase(self, symbol: str, interval: str = "daily", series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Hilbert Transform - Dominant Cycle Phase data"""
-        return await self._make_request("HT_DCPHASE", symbol, interval=interval, series_type=series_type)
+        return await self._make_request("HT_DCPHASE", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, series_type=series_type)
     
-    async def get_ht_phasor(self, symbol: str, interval: str = "daily", series_type: str = "close") -> Dict[str, Any]:
+    async def get_ht_phasor(self, symbol: str, interval: str = "daily", series_type: str = "close", as_columns: bool = False, datatype: Optional[str] = None) -> Any:
         """Get Hilbert Transform - Phasor data"""
-        return await self._make_request("HT_PHASOR", symbol, interval=interval, series_type=series_type)
+        return await self._make_request("HT_PHASOR", symbol, decode=self._series_decode(as_columns, datatype), interval=interval, series_type=series_type)
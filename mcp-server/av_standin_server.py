@@ -0,0 +1,57 @@
+"""Local stand-in for the Alpha Vantage API serving recorded fixtures.
+
+Record fixtures first (AV_TRANSPORT=record), then run:
+    python av_standin_server.py --fixtures fixtures --port 8765 --latency 0.2 --throttle-rate 0.05
+
+and point the MCP server at it with AV_BASE_URL=http://127.0.0.1:8765/query.
+"""
+import argparse
+
+from aiohttp import web
+
+from transport import ReplayTransport
+
+
+def create_app(replay: ReplayTransport) -> web.Application:
+    """Build an app answering GET /query exactly like www.alphavantage.co/query"""
+
+    async def query(request: web.Request) -> web.Response:
+        response = await replay.respond(dict(request.query))
+        return web.Response(status=response.status, body=response.body, content_type=content_type(response.body))
+
+    async def stats(request: web.Request) -> web.Response:
+        return web.json_response({"served": replay.served, "throttled": replay.throttled, "missing": replay.missing})
+
+    app = web.Application()
+    app.router.add_get("/query", query)
+    app.router.add_get("/stats", stats)
+    return app
+
+
+def content_type(body: bytes) -> str:
+    return "application/json" if body.lstrip()[:1] in (b"{", b"[") else "text/csv"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", default="fixtures", help="directory of recorded responses")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many extra seconds per response")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of requests answered with a throttle note")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    replay = ReplayTransport(
+        fixture_dir=args.fixtures,
+        latency=args.latency,
+        jitter=args.jitter,
+        throttle_rate=args.throttle_rate,
+        seed=args.seed
+    )
+    web.run_app(create_app(replay), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Compare payload size and parse time of the JSON and CSV time-series transports.
+
+Usage:
+    python bench_series_transport.py                 # synthetic 20-year daily history
+    python bench_series_transport.py --symbol IBM    # live TIME_SERIES_DAILY full (uses 2 API calls)
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import date, timedelta
+from typing import Callable, Tuple
+
+import aiohttp
+import numpy as np
+
+from alpha_vantage_client import AlphaVantageClient
+from series_parser import StreamingSeriesParser, parse_csv
+
+
+def synthetic_payloads(bars: int) -> Tuple[bytes, bytes]:
+    """Build matching JSON and CSV TIME_SERIES_DAILY bodies with `bars` bars"""
+    day = date(2024, 6, 21)
+    price = 100.0
+    series = {}
+    rows = ["timestamp,open,high,low,close,volume"]
+    while len(series) < bars:
+        if day.weekday() < 5:
+            close = price * (1 + random.uniform(-0.02, 0.02))
+            high, low = max(price, close) * 1.01, min(price, close) * 0.99
+            volume = random.randint(10 ** 5, 10 ** 7)
+            bar = [f"{price:.4f}", f"{high:.4f}", f"{low:.4f}", f"{close:.4f}", str(volume)]
+            series[day.isoformat()] = dict(zip(["1. open", "2. high", "3. low", "4. close", "5. volume"], bar))
+            rows.append(",".join([day.isoformat()] + bar))
+            price = close
+        day -= timedelta(days=1)
+    payload = {
+        "Meta Data": {"1. Information": "Daily Prices", "2. Symbol": "SYN", "5. Time Zone": "US/Eastern"},
+        "Time Series (Daily)": series,
+    }
+    return json.dumps(payload, indent=4).encode(), ("\r\n".join(rows) + "\r\n").encode()
+
+
+async def live_payloads(symbol: str) -> Tuple[bytes, bytes]:
+    """Fetch TIME_SERIES_DAILY full history for `symbol` in both formats"""
+    from config import Config
+    api_key = Config().alpha_vantage_api_key
+    bodies = []
+    async with aiohttp.ClientSession() as session:
+        for datatype in ("json", "csv"):
+            params = {"function": "TIME_SERIES_DAILY", "symbol": symbol, "outputsize": "full",
+                      "datatype": datatype, "apikey": api_key}
+            async with session.get(AlphaVantageClient.BASE_URL, params=params) as response:
+                bodies.append(await response.read())
+    return bodies[0], bodies[1]
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def json_dict_to_arrays(body: bytes):
+    """Baseline: json.loads then walk the dict tree into a float array"""
+    data = json.loads(body)
+    series = next(value for key, value in data.items() if "Time Series" in key)
+    return np.array([[float(value) for value in bar.values()] for bar in series.values()])
+
+
+def json_streaming(body: bytes):
+    parser = StreamingSeriesParser(size_hint=len(body))
+    for start in range(0, len(body), AlphaVantageClient.STREAM_CHUNK_SIZE):
+        parser.feed(body[start:start + AlphaVantageClient.STREAM_CHUNK_SIZE])
+    return parser.finish()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbol", help="benchmark live responses for this symbol")
+    parser.add_argument("--bars", type=int, default=5000, help="bars in the synthetic payload")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.symbol:
+        json_body, csv_body = asyncio.run(live_payloads(args.symbol))
+    else:
+        json_body, csv_body = synthetic_payloads(args.bars)
+
+    bars = len(json_streaming(json_body))
+    rows = [
+        ("json -> dict -> array", len(json_body), best_of(lambda: json_dict_to_arrays(json_body), args.repeat)),
+        ("json streaming columns", len(json_body), best_of(lambda: json_streaming(json_body), args.repeat)),
+        ("csv columns", len(csv_body), best_of(lambda: parse_csv(csv_body, "TIME_SERIES_DAILY"), args.repeat)),
+    ]
+    print(f"{bars} bars")
+    print(f"{'path':<26}{'bytes':>12}{'parse ms':>12}")
+    for name, size, seconds in rows:
+        print(f"{name:<26}{size:>12,}{seconds * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
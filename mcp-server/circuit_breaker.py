@@ -0,0 +1,69 @@
+import time
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling upstream while the circuit is open"""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a half-open probe.
+
+    CLOSED: calls pass through; `failure_threshold` consecutive failures open it.
+    OPEN: calls fail fast until `reset_timeout` seconds have passed.
+    HALF_OPEN: a single probe call is let through; success closes the circuit,
+    failure reopens it for another cool-off period.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self.rejected = 0
+        self.trips = 0
+
+    def allow(self) -> bool:
+        """Return True if a call may go upstream now"""
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def record_abandoned(self):
+        """A call ended without an upstream verdict (cancelled, or failed locally): free the probe, keep the state"""
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.trips += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def retry_after(self) -> float:
+        """Seconds left in the current cool-off period"""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def stats(self) -> dict:
+        return {"state": self.state, "consecutive_failures": self.failures, "trips": self.trips, "rejected": self.rejected}
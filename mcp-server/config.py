@@ -12,6 +12,39 @@ class Config:
         self.openai_model = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
         self.max_tokens = int(os.getenv("MAX_TOKENS", "1000"))
         self.temperature = float(os.getenv("TEMPERATURE", "0.7"))
+        self.av_pool_size = int(os.getenv("AV_POOL_SIZE", "20"))
+        self.av_keepalive_timeout = float(os.getenv("AV_KEEPALIVE_TIMEOUT", "30"))
+        self.av_dns_cache_ttl = int(os.getenv("AV_DNS_CACHE_TTL", "300"))
+        self.av_request_timeout = float(os.getenv("AV_REQUEST_TIMEOUT", "15"))
+        self.av_connect_timeout = float(os.getenv("AV_CONNECT_TIMEOUT", "5"))
+        self.av_requests_per_minute = int(os.getenv("AV_REQUESTS_PER_MINUTE", "5"))
+        self.av_requests_per_day = int(os.getenv("AV_REQUESTS_PER_DAY", "25"))
+        self.av_background_share = float(os.getenv("AV_BACKGROUND_SHARE", "0.2"))
+        self.av_cache_max_bytes = int(os.getenv("AV_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+        self.av_cache_path = os.getenv("AV_CACHE_PATH", "av_cache.sqlite3") or None
+        self.av_series_store_path = os.getenv("AV_SERIES_STORE_PATH", "series_store") or None
+        self.av_stale_while_revalidate = os.getenv("AV_STALE_WHILE_REVALIDATE", "false").lower() in ("1", "true", "yes")
+        self.av_stale_grace = float(os.getenv("AV_STALE_GRACE", "300"))
+        self.av_max_retries = int(os.getenv("AV_MAX_RETRIES", "3"))
+        self.av_retry_base_delay = float(os.getenv("AV_RETRY_BASE_DELAY", "1"))
+        self.av_breaker_failure_threshold = int(os.getenv("AV_BREAKER_FAILURE_THRESHOLD", "5"))
+        self.av_breaker_reset_timeout = float(os.getenv("AV_BREAKER_RESET_TIMEOUT", "30"))
+        self.av_series_datatype = os.getenv("AV_SERIES_DATATYPE", "json").lower()
+        self.av_bulk_quotes = os.getenv("AV_BULK_QUOTES", "false").lower() in ("1", "true", "yes")
+        self.av_quote_batch_window = float(os.getenv("AV_QUOTE_BATCH_WINDOW", "0.05"))
+        self.av_base_url = os.getenv("AV_BASE_URL") or None
+        self.av_transport = os.getenv("AV_TRANSPORT", "http").lower()
+        self.av_fixture_dir = os.getenv("AV_FIXTURE_DIR", "fixtures")
+        self.av_replay_latency = float(os.getenv("AV_REPLAY_LATENCY", "0"))
+        self.av_replay_jitter = float(os.getenv("AV_REPLAY_JITTER", "0"))
+        self.av_replay_throttle_rate = float(os.getenv("AV_REPLAY_THROTTLE_RATE", "0"))
+        self.av_replay_seed = int(os.getenv("AV_REPLAY_SEED")) if os.getenv("AV_REPLAY_SEED") else None
+        self.av_calendar_reconcile_interval = float(os.getenv("AV_CALENDAR_RECONCILE_INTERVAL", "3600"))
+        self.watchlist = [s.strip() for s in os.getenv("WATCHLIST", "").split(",") if s.strip()]
+        self.prefetch_tools = [s.strip() for s in os.getenv("PREFETCH_TOOLS", "get_stock_quote,get_time_series_daily").split(",") if s.strip()]
+        self.prefetch_interval = float(os.getenv("PREFETCH_INTERVAL", "300"))
+        self.prefetch_pre_open_lead = float(os.getenv("PREFETCH_PRE_OPEN_LEAD", "1800"))
+        self.prefetch_concurrency = int(os.getenv("PREFETCH_CONCURRENCY", "4"))
     
     def _get_required_env(self, key: str) -> str:
         """Get required environment variable or raise error"""
@@ -0,0 +1,218 @@
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from moving_averages import nans
+
+# Welles Wilder's directional movement system and Aroon, following TA-Lib.
+# The indicators are different views of the same few intermediates (true
+# range, +DM/-DM and their Wilder sums, DX), so kernels take a `scratch`
+# dict from IndicatorEngine and build each intermediate there at most once
+# per bar series. Asking for ADX, +DI and -DI in one turn smooths once.
+
+
+def shared(scratch: Optional[Dict[Any, Any]], key: Any, build: Callable[[], Any]) -> Any:
+    """scratch[key], built on first use; with no scratch dict, just build()"""
+    if scratch is None:
+        return build()
+    value = scratch.get(key)
+    if value is None:
+        value = scratch[key] = build()
+    return value
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """Greatest of high-low and the gaps from the previous close; NaN on the first bar"""
+    out = nans(len(close))
+    if len(close) > 1:
+        previous = close[:-1]
+        out[1:] = np.maximum(high[1:], previous) - np.minimum(low[1:], previous)
+    return out
+
+
+def directional_movement(high: np.ndarray, low: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """+DM and -DM: the larger of the up and down moves if positive, else 0; NaN on the first bar"""
+    plus, minus = nans(len(high)), nans(len(high))
+    if len(high) > 1:
+        up = high[1:] - high[:-1]
+        down = low[:-1] - low[1:]
+        plus[1:] = np.where((up > 0) & (up > down), up, 0.0)
+        minus[1:] = np.where((down > 0) & (down > up), down, 0.0)
+    return plus, minus
+
+
+def wilder_sums(period: int, *series: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Wilder running sums, S = S - S/period + x, of series that start on bar 1.
+
+    Each is seeded on bar period-1 with the sum of its first period-1
+    values, as TA-Lib does; with period 1 the sums are the values themselves.
+    """
+    if period == 1:
+        return tuple(x.copy() for x in series)
+    n = len(series[0])
+    keep = 1.0 - 1.0 / period
+    outs = []
+    for x in series:
+        out = nans(n)
+        if n >= period:
+            total = float(np.sum(x[1:period]))
+            values = x[period:].tolist()
+            smoothed = [total] * (len(values) + 1)
+            # The recurrence is inherently sequential; a float loop beats NumPy per-element calls
+            for i, value in enumerate(values, 1):
+                total = total * keep + value
+                smoothed[i] = total
+            out[period - 1:] = smoothed
+        outs.append(out)
+    return tuple(outs)
+
+
+def bar_true_range(bars: Any, scratch: Optional[Dict[Any, Any]]) -> np.ndarray:
+    """True range of `bars`, shared through `scratch` with the volatility kernels"""
+    return shared(scratch, "true range", lambda: true_range(bars["high"], bars["low"], bars["close"]))
+
+
+def _raw(bars: Any, scratch: Optional[Dict[Any, Any]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    plus, minus = shared(scratch, "dm", lambda: directional_movement(bars["high"], bars["low"]))
+    return bar_true_range(bars, scratch), plus, minus
+
+
+def _smoothed(bars: Any, scratch: Optional[Dict[Any, Any]], period: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Wilder sums of true range, +DM and -DM for `period`"""
+    return shared(scratch, ("wilder sums", period), lambda: wilder_sums(period, *_raw(bars, scratch)))
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """numerator / denominator, 0 where the denominator is 0 (NaN stays NaN)"""
+    zero = denominator == 0
+    return np.where(zero, 0.0, numerator / np.where(zero, 1.0, denominator))
+
+
+def _indicators(bars: Any, scratch: Optional[Dict[Any, Any]], period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """+DI and -DI, output from bar `period` on"""
+    def build():
+        tr, plus, minus = _smoothed(bars, scratch, period)
+        plus_di, minus_di = _ratio(100.0 * plus, tr), _ratio(100.0 * minus, tr)
+        plus_di[:period], minus_di[:period] = np.nan, np.nan
+        return plus_di, minus_di
+    return shared(scratch, ("di", period), build)
+
+
+def _raw_dx(bars: Any, scratch: Optional[Dict[Any, Any]], period: int) -> np.ndarray:
+    """DX from bar `period` on, NaN where either denominator is 0 (TA-Lib skips those bars)"""
+    def build():
+        tr = _smoothed(bars, scratch, period)[0]
+        plus_di, minus_di = _indicators(bars, scratch, period)
+        total = plus_di + minus_di
+        undefined = (tr == 0) | (total == 0)
+        dx = 100.0 * np.abs(minus_di - plus_di) / np.where(undefined, 1.0, total)
+        dx[undefined] = np.nan
+        dx[:period] = np.nan
+        return dx
+    return shared(scratch, ("dx", period), build)
+
+
+def dx(bars: Any, scratch: Optional[Dict[Any, Any]], period: int) -> np.ndarray:
+    """Directional movement index; an undefined bar repeats the previous value (0 at the start)"""
+    raw = _raw_dx(bars, scratch, period)
+    out = nans(len(raw))
+    if len(raw) <= period:
+        return out
+    values = raw[period:].copy()
+    if np.isnan(values[0]):
+        values[0] = 0.0
+    filled = np.where(np.isnan(values), 0, np.arange(len(values)))
+    out[period:] = values[np.maximum.accumulate(filled)]
+    return out
+
+
+def adx(bars: Any, scratch: Optional[Dict[Any, Any]], period: int) -> np.ndarray:
+    """Wilder average of DX, seeded with the mean of the first `period` DX values"""
+    def build():
+        raw = _raw_dx(bars, scratch, period)
+        out = nans(len(raw))
+        seed_at = 2 * period - 1
+        if len(raw) <= seed_at:
+            return out
+        # Undefined DX counts as 0 in the seed and leaves the average unchanged afterwards
+        prev = float(np.nansum(raw[period:seed_at + 1])) / period
+        values = raw[seed_at + 1:].tolist()
+        averaged = [prev] * (len(values) + 1)
+        for i, value in enumerate(values, 1):
+            if value == value:
+                prev = (prev * (period - 1) + value) / period
+            averaged[i] = prev
+        out[seed_at:] = averaged
+        return out
+    return shared(scratch, ("adx", period), build)
+
+
+def adxr(bars: Any, scratch: Optional[Dict[Any, Any]], period: int) -> np.ndarray:
+    """Mean of ADX and ADX period-1 bars earlier"""
+    line = adx(bars, scratch, period)
+    out = nans(len(line))
+    lag = period - 1
+    if lag < len(line):
+        out[lag:] = (line[lag:] + line[:len(line) - lag]) / 2.0
+    return out
+
+
+def dm(bars: Any, scratch: Optional[Dict[Any, Any]], period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Wilder sums of +DM and -DM (raw DM for period 1)"""
+    _, plus, minus = _smoothed(bars, scratch, period)
+    return plus, minus
+
+
+def aroon(bars: Any, scratch: Optional[Dict[Any, Any]], period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Aroon down and up: how recently the last `period`+1 bars made their low and high, 0-100"""
+    def build():
+        high, low = bars["high"], bars["low"]
+        down, up = nans(len(high)), nans(len(high))
+        if len(high) > period:
+            # Ties go to the most recent bar, so search each window reversed
+            latest_high = period - np.argmax(sliding_window_view(high, period + 1)[:, ::-1], axis=1)
+            latest_low = period - np.argmin(sliding_window_view(low, period + 1)[:, ::-1], axis=1)
+            up[period:] = latest_high * (100.0 / period)
+            down[period:] = latest_low * (100.0 / period)
+        return down, up
+    return shared(scratch, ("aroon", period), build)
+
+
+def _line(kernel: Callable[..., np.ndarray], name: str):
+    def compute(bars: Any, time_period: int = 14, scratch: Optional[Dict[Any, Any]] = None) -> Dict[str, np.ndarray]:
+        return {name: kernel(bars, scratch, int(time_period))}
+    return compute
+
+
+def _pick(kernel: Callable[..., Tuple[np.ndarray, ...]], index: int, name: str):
+    def compute(bars: Any, time_period: int = 14, scratch: Optional[Dict[Any, Any]] = None) -> Dict[str, np.ndarray]:
+        return {name: kernel(bars, scratch, int(time_period))[index]}
+    return compute
+
+
+def _aroon(bars: Any, time_period: int = 14, scratch: Optional[Dict[Any, Any]] = None) -> Dict[str, np.ndarray]:
+    down, up = aroon(bars, scratch, int(time_period))
+    return {"Aroon Down": down, "Aroon Up": up}
+
+
+def _aroonosc(bars: Any, time_period: int = 14, scratch: Optional[Dict[Any, Any]] = None) -> Dict[str, np.ndarray]:
+    down, up = aroon(bars, scratch, int(time_period))
+    return {"AROONOSC": up - down}
+
+
+# Alpha Vantage function -> (indicator name in Meta Data, kernel over a bar series)
+FUNCTIONS = {
+    "ADX": ("Average Directional Movement Index (ADX)", _line(adx, "ADX")),
+    "ADXR": ("Average Directional Movement Index Rating (ADXR)", _line(adxr, "ADXR")),
+    "DX": ("Directional Movement Index (DX)", _line(dx, "DX")),
+    "PLUS_DI": ("Plus Directional Indicator (PLUS_DI)", _pick(_indicators, 0, "PLUS_DI")),
+    "MINUS_DI": ("Minus Directional Indicator (MINUS_DI)", _pick(_indicators, 1, "MINUS_DI")),
+    "PLUS_DM": ("Plus Directional Movement (PLUS_DM)", _pick(dm, 0, "PLUS_DM")),
+    "MINUS_DM": ("Minus Directional Movement (MINUS_DM)", _pick(dm, 1, "MINUS_DM")),
+    "AROON": ("Aroon (AROON)", _aroon),
+    "AROONOSC": ("Aroon Oscillator (AROONOSC)", _aroonosc),
+}
+
+# Kernels that take the engine's `scratch` dict
+SHARED = frozenset(FUNCTIONS)
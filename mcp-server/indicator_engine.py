@@ -0,0 +1,155 @@
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+import directional
+import moving_averages
+import oscillators
+import volatility
+import volume
+from resample import interval_minutes, to_calendar_period
+from timeseries import TimeSeries, format_timestamp
+
+# Meta Data labels for indicator parameters; others are title-cased
+PARAMETER_LABELS = {
+    "time_period": "Time Period",
+    "series_type": "Series Type",
+    "fastperiod": "Fast Period",
+    "slowperiod": "Slow Period",
+    "signalperiod": "Signal Period",
+    "fastmatype": "Fast MA Type",
+    "slowmatype": "Slow MA Type",
+    "signalmatype": "Signal MA Type",
+    "matype": "MA Type",
+    "fastlimit": "Fast Limit",
+    "slowlimit": "Slow Limit",
+}
+
+
+# (symbol, interval) entries of shared intermediates kept between calls
+INTERMEDIATE_ENTRIES = 32
+
+
+def _parameter_label(name: str) -> str:
+    return PARAMETER_LABELS.get(name, name.replace("_", " ").title())
+
+
+class IndicatorEngine:
+    """Technical indicators computed locally from cached OHLCV bars.
+
+    Every Alpha Vantage indicator is a pure function of a price series the
+    client often already holds. compute() looks for that series without
+    spending quota: a fresh full-history response in the cache, or the
+    series store's daily history once the session has settled. Weekly and
+    monthly bars can also be resampled from daily ones. It then runs the
+    indicator's NumPy kernel and renders the result like Alpha Vantage
+    does: TA-Lib's warm-up bars are dropped and values are rounded to four
+    decimals. If no base series is available it returns None, and the
+    caller falls back to the remote indicator endpoint.
+
+    Kernels are registered per family module in `FUNCTIONS` tables mapping
+    an Alpha Vantage function name to (indicator name, kernel). Families
+    whose indicators share intermediates (true range, Wilder sums) also get
+    a `scratch` dict per (symbol, interval). It lives as long as the same
+    base bars object is passed in with the same last bar, so related calls
+    in one turn compute them once.
+    """
+
+    def __init__(self, av_client: Any):
+        self.av_client = av_client
+        self._functions: Dict[str, Tuple[str, Callable[..., Dict[str, np.ndarray]]]] = {
+            **moving_averages.FUNCTIONS,
+            **oscillators.FUNCTIONS,
+            **directional.FUNCTIONS,
+            **volatility.FUNCTIONS,
+            **volume.FUNCTIONS,
+        }
+        # Functions whose kernels take a `scratch` dict of shared intermediates
+        self._shared = directional.SHARED | volatility.SHARED | volume.SHARED
+        # (symbol, interval) -> (bars, (bar count, last timestamp, last bar's values...), scratch dict)
+        self._intermediates: Dict[Tuple[str, str], Tuple[TimeSeries, Tuple[Any, ...], Dict[Any, Any]]] = {}
+        self.computed = 0
+        self.unavailable = 0
+        self.scratch_reuses = 0
+
+    def supports(self, function: str) -> bool:
+        return function in self._functions
+
+    async def base_series(self, symbol: str, interval: str) -> Optional[TimeSeries]:
+        """Fresh full-history OHLCV bars for `interval`, or None; never calls upstream"""
+        client = self.av_client
+        if interval_minutes(interval) is not None:
+            return await client.cached_series("TIME_SERIES_INTRADAY", symbol, interval=interval, outputsize="full")
+        if interval in ("weekly", "monthly"):
+            series = await client.cached_series(f"TIME_SERIES_{interval.upper()}", symbol)
+            if series is not None:
+                return series
+        elif interval != "daily":
+            return None
+        daily = await client.cached_series("TIME_SERIES_DAILY", symbol, outputsize="full")
+        if daily is None:
+            daily = client.settled_daily(symbol, full_history=True)
+        if daily is None or interval == "daily":
+            return daily
+        return to_calendar_period(daily, interval)
+
+    async def compute(self, function: str, symbol: str, interval: str, **params) -> Optional[TimeSeries]:
+        """Alpha Vantage's response for an indicator call, computed locally, or None if no base series is cached"""
+        symbol = symbol.upper()
+        indicator, kernel = self._functions[function]
+        if function in volume.INTRADAY_ONLY and interval_minutes(interval) is None:
+            # Leave Alpha Vantage to reject it as it always has
+            return None
+        bars = await self.base_series(symbol, interval)
+        if bars is None or not len(bars):
+            self.unavailable += 1
+            return None
+        if function in self._shared:
+            columns = kernel(bars, scratch=self._scratch(symbol, interval, bars), **params)
+        else:
+            columns = kernel(bars, **params)
+        self.computed += 1
+        return self._render(function, indicator, symbol, interval, bars, columns, params)
+
+    def _scratch(self, symbol: str, interval: str, bars: TimeSeries) -> Dict[Any, Any]:
+        """Intermediates for these bars; any other bars object, or a change to its last bar, starts an empty dict.
+
+        A refresh or revision always yields a new bars object, so identity
+        covers older bars; the last bar's values catch it being updated in place.
+        """
+        key = (symbol, interval)
+        version = (len(bars), int(bars.timestamps[-1])) + tuple(float(column[-1]) for column in bars.columns.values())
+        cached = self._intermediates.pop(key, None)
+        if cached is not None and cached[0] is bars and cached[1] == version:
+            self.scratch_reuses += 1
+        else:
+            cached = (bars, version, {})
+        # Reinsert so the dict stays in least-recently-used order
+        self._intermediates[key] = cached
+        while len(self._intermediates) > INTERMEDIATE_ENTRIES:
+            del self._intermediates[next(iter(self._intermediates))]
+        return cached[2]
+
+    @staticmethod
+    def _render(function: str, indicator: str, symbol: str, interval: str, bars: TimeSeries,
+                columns: Dict[str, np.ndarray], params: Dict[str, Any]) -> TimeSeries:
+        # TA-Lib output starts once every column is seeded; later gaps are kept as blanks
+        seeded = np.ones(len(bars), dtype=bool)
+        for column in columns.values():
+            seeded &= ~np.isnan(column)
+        start = int(np.argmax(seeded)) if seeded.any() else len(bars)
+        metadata = {
+            "1: Symbol": symbol,
+            "2: Indicator": indicator,
+            "3: Last Refreshed": format_timestamp(bars.timestamps[-1]),
+            "4: Interval": interval,
+        }
+        for name, value in params.items():
+            metadata[f"{len(metadata) + 1}: {_parameter_label(name)}"] = value
+        time_zone = next((value for key, value in bars.metadata.items() if key.endswith("Time Zone")), "US/Eastern")
+        metadata[f"{len(metadata) + 1}: Time Zone"] = time_zone
+        return TimeSeries(bars.timestamps[start:], {name: np.round(column[start:], 4) for name, column in columns.items()},
+                          metadata, f"Technical Analysis: {function}", list(columns), {"computed_locally": True})
+
+    def stats(self) -> Dict[str, int]:
+        return {"computed": self.computed, "unavailable": self.unavailable, "scratch_reuses": self.scratch_reuses}
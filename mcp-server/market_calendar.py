@@ -0,0 +1,242 @@
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+
+from response_cache import TTL_POLICY
+
+# Functions whose data only changes while the US equity market trades.
+# Technical indicators (anything not in TTL_POLICY) are included too.
+MARKET_FUNCTIONS: Set[str] = {
+    "TIME_SERIES_INTRADAY",
+    "TIME_SERIES_DAILY",
+    "TIME_SERIES_DAILY_ADJUSTED",
+    "TIME_SERIES_WEEKLY",
+    "TIME_SERIES_WEEKLY_ADJUSTED",
+    "TIME_SERIES_MONTHLY",
+    "TIME_SERIES_MONTHLY_ADJUSTED",
+    "GLOBAL_QUOTE",
+    "REALTIME_BULK_QUOTES",
+    "TOP_GAINERS_LOSERS",
+}
+
+
+def is_market_function(function: str) -> bool:
+    return function in MARKET_FUNCTIONS or function not in TTL_POLICY
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def _last_weekday(year: int, month: int, weekday: int) -> date:
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)"""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = b // 4, b % 4
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 19 * l) // 433
+    month = (h + l - 7 * m + 90) // 25
+    return date(year, month, (h + l - 7 * m + 33 * month + 19) % 32)
+
+
+def _observed(day: date) -> date:
+    """Saturday holidays are observed on Friday, Sunday holidays on Monday"""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+@lru_cache(maxsize=32)
+def nyse_holidays(year: int) -> Dict[date, str]:
+    """Full-day NYSE closures for a year under the exchange's standing rules"""
+    holidays = {}
+    new_year = date(year, 1, 1)
+    # A Saturday New Year's Day is not observed on the preceding Friday
+    if new_year.weekday() != 5:
+        holidays[_observed(new_year)] = "New Year's Day"
+    holidays[_nth_weekday(year, 1, 0, 3)] = "Martin Luther King Jr. Day"
+    holidays[_nth_weekday(year, 2, 0, 3)] = "Washington's Birthday"
+    holidays[_easter(year) - timedelta(days=2)] = "Good Friday"
+    holidays[_last_weekday(year, 5, 0)] = "Memorial Day"
+    if year >= 2022:
+        holidays[_observed(date(year, 6, 19))] = "Juneteenth"
+    holidays[_observed(date(year, 7, 4))] = "Independence Day"
+    holidays[_nth_weekday(year, 9, 0, 1)] = "Labor Day"
+    holidays[_nth_weekday(year, 11, 3, 4)] = "Thanksgiving Day"
+    holidays[_observed(date(year, 12, 25))] = "Christmas Day"
+    return holidays
+
+
+@lru_cache(maxsize=32)
+def nyse_early_closes(year: int) -> Set[date]:
+    """Days the NYSE closes at 13:00: July 3, the day after Thanksgiving and Christmas Eve"""
+    holidays = nyse_holidays(year)
+    candidates = [
+        date(year, 7, 3),
+        _nth_weekday(year, 11, 3, 4) + timedelta(days=1),
+        date(year, 12, 24),
+    ]
+    return {day for day in candidates if day.weekday() < 5 and day not in holidays}
+
+
+class MarketCalendar:
+    """US equity trading calendar: sessions, holidays, half-days and time zone.
+
+    Regular sessions run `open_time`-`close_time` (13:00 on half-days);
+    intraday bars also cover the extended `extended_open`-`extended_close`
+    window. Holidays follow NYSE rules. reconcile() folds in Alpha Vantage's
+    live MARKET_STATUS, so unscheduled closures (or a rule this calendar
+    gets wrong) correct themselves the same day.
+    """
+
+    def __init__(
+        self,
+        tz: str = "America/New_York",
+        open_time: time = time(9, 30),
+        close_time: time = time(16, 0),
+        early_close_time: time = time(13, 0),
+        extended_open: time = time(4, 0),
+        extended_close: time = time(20, 0),
+        settle_delay: float = 900.0
+    ):
+        self.tz = ZoneInfo(tz)
+        self.open_time = open_time
+        self.close_time = close_time
+        self.early_close_time = early_close_time
+        self.extended_open = extended_open
+        self.extended_close = extended_close
+        # Daily bars and quotes are final this long after the close
+        self.settle_delay = timedelta(seconds=settle_delay)
+        # date -> whether the market trades that day, learned from MARKET_STATUS
+        self.overrides: Dict[date, bool] = {}
+        self.reconciliations = 0
+        self.corrections = 0
+
+    def now(self) -> datetime:
+        return datetime.now(self.tz)
+
+    def wall_clock_seconds(self, now: Optional[datetime] = None) -> int:
+        """Exchange-local wall-clock time as epoch seconds, the form TimeSeries indexes use"""
+        now = (now or self.now()).astimezone(self.tz)
+        return int((now.replace(tzinfo=None) - datetime(1970, 1, 1)).total_seconds())
+
+    def is_trading_day(self, day: date) -> bool:
+        if day in self.overrides:
+            return self.overrides[day]
+        return day.weekday() < 5 and day not in nyse_holidays(day.year)
+
+    def is_early_close(self, day: date) -> bool:
+        return day in nyse_early_closes(day.year)
+
+    def session(self, day: date, extended: bool = False) -> Optional[Tuple[datetime, datetime]]:
+        """(open, close) of the session on `day`, or None if the market is closed all day"""
+        if not self.is_trading_day(day):
+            return None
+        early = self.is_early_close(day)
+        if extended:
+            close = time(17, 0) if early else self.extended_close
+            return datetime.combine(day, self.extended_open, self.tz), datetime.combine(day, close, self.tz)
+        close = self.early_close_time if early else self.close_time
+        return datetime.combine(day, self.open_time, self.tz), datetime.combine(day, close, self.tz)
+
+    def is_open(self, now: Optional[datetime] = None, extended: bool = False) -> bool:
+        now = now or self.now()
+        session = self.session(now.astimezone(self.tz).date(), extended)
+        return session is not None and session[0] <= now < session[1]
+
+    def next_open(self, now: Optional[datetime] = None, extended: bool = False) -> datetime:
+        """Start of the first session opening strictly after `now`"""
+        now = now or self.now()
+        day = now.astimezone(self.tz).date()
+        for _ in range(366):
+            session = self.session(day, extended)
+            if session is not None and session[0] > now:
+                return session[0]
+            day += timedelta(days=1)
+        raise ValueError("No trading session found within a year")
+
+    def last_settled_session(self, now: Optional[datetime] = None) -> Optional[date]:
+        """Most recent trading day whose closing data has settled, if the market is between sessions"""
+        now = now or self.now()
+        day = now.astimezone(self.tz).date()
+        for _ in range(366):
+            session = self.session(day)
+            if session is not None:
+                if session[1] + self.settle_delay <= now:
+                    return day
+                if session[0] <= now:
+                    # Today's session is trading or still settling
+                    return None
+            day -= timedelta(days=1)
+        return None
+
+    def next_bar_boundary(self, now: datetime, minutes: int) -> datetime:
+        """When the intraday bar covering `now` completes (or the first bar of the next session)"""
+        step = timedelta(minutes=minutes)
+        session = self.session(now.astimezone(self.tz).date(), extended=True)
+        if session is not None and session[0] <= now < session[1]:
+            elapsed = now - session[0]
+            return min(session[0] + (elapsed // step + 1) * step, session[1])
+        return self.next_open(now, extended=True) + step
+
+    def expires_at(self, function: str, params: Dict[str, Any], base_ttl: float,
+                   now: Optional[datetime] = None) -> float:
+        """Epoch second at which a cached response stops being current"""
+        now = now or self.now()
+        if not is_market_function(function):
+            return now.timestamp() + base_ttl
+        interval = str(params.get("interval", ""))
+        if interval.endswith("min") and interval[:-3].isdigit():
+            return self.next_bar_boundary(now, int(interval[:-3])).timestamp()
+        session = self.session(now.astimezone(self.tz).date())
+        if session is not None and session[0] <= now < session[1] + self.settle_delay:
+            # Still moving; cap at the point the session's data settles
+            return min(now.timestamp() + base_ttl, (session[1] + self.settle_delay).timestamp())
+        # Nothing changes until the next session opens
+        return self.next_open(now).timestamp()
+
+    def reconcile(self, market_status: Dict[str, Any], now: Optional[datetime] = None) -> bool:
+        """Correct today's status from a MARKET_STATUS response; return True if it changed"""
+        now = now or self.now()
+        self.reconciliations += 1
+        market = next((
+            m for m in market_status.get("markets", [])
+            if m.get("region") == "United States" and m.get("market_type") == "Equity"
+        ), None)
+        if market is None:
+            return False
+        reported_open = str(market.get("current_status", "")).lower() == "open"
+        today = now.astimezone(self.tz).date()
+        session = self.session(today)
+        changed = False
+        if reported_open and session is None:
+            self.overrides[today] = True
+            changed = True
+        elif not reported_open and session is not None:
+            # Only trust a "closed" report well inside our session, away from edge skew
+            margin = timedelta(minutes=15)
+            if session[0] + margin <= now < session[1] - margin:
+                self.overrides[today] = False
+                changed = True
+        if changed:
+            self.corrections += 1
+        return changed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "open": self.is_open(),
+            "reconciliations": self.reconciliations,
+            "corrections": self.corrections,
+            "overrides": {day.isoformat(): trades for day, trades in self.overrides.items()},
+        }
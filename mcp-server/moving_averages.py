@@ -0,0 +1,290 @@
+import math
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Kernels take a float64 array and return one of the same length. The bars
+# before the first full lookback are NaN, as in TA-Lib (which Alpha Vantage
+# runs): its output starts only once an indicator is fully seeded.
+
+KAMA_FAST = 2.0 / (2 + 1)
+KAMA_SLOW = 2.0 / (30 + 1)
+T3_VFACTOR = 0.7
+MAMA_FAST_LIMIT = 0.5
+MAMA_SLOW_LIMIT = 0.05
+MAMA_LOOKBACK = 32
+
+
+def nans(n: int) -> np.ndarray:
+    return np.full(n, np.nan)
+
+
+def first_valid(x: np.ndarray) -> int:
+    """Index of the first non-NaN value (len(x) if none); cascaded averages start there"""
+    valid = np.flatnonzero(~np.isnan(x))
+    return int(valid[0]) if len(valid) else len(x)
+
+
+def sma(x: np.ndarray, period: int) -> np.ndarray:
+    out = nans(len(x))
+    start = first_valid(x)
+    if len(x) - start < period:
+        return out
+    sums = np.cumsum(np.r_[0.0, x[start:]])
+    out[start + period - 1:] = (sums[period:] - sums[:-period]) / period
+    return out
+
+
+def ema(x: np.ndarray, period: int, alpha: Optional[float] = None) -> np.ndarray:
+    """Exponential average seeded with the SMA of its first `period` values"""
+    out = nans(len(x))
+    start = first_valid(x)
+    if len(x) - start < period:
+        return out
+    k = 2.0 / (period + 1) if alpha is None else alpha
+    seed_at = start + period - 1
+    prev = float(np.mean(x[start:seed_at + 1]))
+    out[seed_at] = prev
+    # The recurrence is inherently sequential; a float loop beats NumPy per-element calls
+    values = x[seed_at + 1:].tolist()
+    smoothed = [0.0] * len(values)
+    for i, value in enumerate(values):
+        prev += k * (value - prev)
+        smoothed[i] = prev
+    out[seed_at + 1:] = smoothed
+    return out
+
+
+def wma(x: np.ndarray, period: int) -> np.ndarray:
+    """Linearly weighted average, the newest bar weighted `period`"""
+    out = nans(len(x))
+    start = first_valid(x)
+    if len(x) - start < period:
+        return out
+    weights = np.arange(1, period + 1, dtype=np.float64)
+    out[start + period - 1:] = sliding_window_view(x[start:], period) @ weights / weights.sum()
+    return out
+
+
+def dema(x: np.ndarray, period: int) -> np.ndarray:
+    e1 = ema(x, period)
+    return 2.0 * e1 - ema(e1, period)
+
+
+def tema(x: np.ndarray, period: int) -> np.ndarray:
+    e1 = ema(x, period)
+    e2 = ema(e1, period)
+    return 3.0 * e1 - 3.0 * e2 + ema(e2, period)
+
+
+def trima(x: np.ndarray, period: int) -> np.ndarray:
+    """Triangular average: an SMA of an SMA whose lengths add up to `period` + 1"""
+    first = (period + 1) // 2
+    return sma(sma(x, first), period - first + 1)
+
+
+def kama(x: np.ndarray, period: int) -> np.ndarray:
+    """Kaufman adaptive average with TA-Lib's fixed 2/30 fast/slow constants"""
+    n = len(x)
+    out = nans(n)
+    if n <= period:
+        return out
+    change = np.abs(x[period:] - x[:-period])
+    sums = np.cumsum(np.r_[0.0, np.abs(np.diff(x))])
+    volatility = sums[period:] - sums[:-period]
+    efficiency = np.where((volatility <= change) | (volatility == 0), 1.0,
+                          change / np.where(volatility == 0, 1.0, volatility))
+    constants = (efficiency * (KAMA_FAST - KAMA_SLOW) + KAMA_SLOW) ** 2
+    prev = float(x[period - 1])
+    values = x[period:].tolist()
+    smoothed = [0.0] * len(values)
+    for i, (value, c) in enumerate(zip(values, constants.tolist())):
+        prev += c * (value - prev)
+        smoothed[i] = prev
+    out[period:] = smoothed
+    return out
+
+
+def t3(x: np.ndarray, period: int, vfactor: float = T3_VFACTOR) -> np.ndarray:
+    """Tillson T3: six cascaded EMAs combined with volume-factor weights"""
+    e1 = ema(x, period)
+    e2 = ema(e1, period)
+    e3 = ema(e2, period)
+    e4 = ema(e3, period)
+    e5 = ema(e4, period)
+    e6 = ema(e5, period)
+    a = vfactor
+    c1 = -a ** 3
+    c2 = 3 * a ** 2 + 3 * a ** 3
+    c3 = -6 * a ** 2 - 3 * a - 3 * a ** 3
+    c4 = 1 + 3 * a + a ** 3 + 3 * a ** 2
+    return c1 * e6 + c2 * e5 + c3 * e4 + c4 * e3
+
+
+def mama(x: np.ndarray, fast_limit: float = MAMA_FAST_LIMIT,
+         slow_limit: float = MAMA_SLOW_LIMIT) -> Tuple[np.ndarray, np.ndarray]:
+    """Ehlers' MESA adaptive average and its following average (MAMA, FAMA), ported from TA-Lib.
+
+    A Hilbert transform of a 4-bar weighted price estimates the dominant
+    cycle's phase; the faster the phase advances, the closer the smoothing
+    constant gets to `fast_limit`. Every step depends on the last, so this
+    is one sequential pass.
+    """
+    n = len(x)
+    out_mama, out_fama = nans(n), nans(n)
+    if n <= MAMA_LOOKBACK:
+        return out_mama, out_fama
+    a, b = 0.0962, 0.5769
+    rad2deg = 180.0 / math.pi
+    values = x.tolist()
+    # Running 4-3-2-1 weighted price, primed on the first 12 bars
+    wma_sub = values[0] + values[1] + values[2]
+    wma_sum = values[0] + values[1] * 2.0 + values[2] * 3.0
+    trailing_at, trailing = 0, 0.0
+    smoothed = 0.0
+
+    def price_wma(price: float) -> float:
+        nonlocal wma_sub, wma_sum, trailing_at, trailing
+        wma_sub += price - trailing
+        wma_sum += price * 4.0
+        trailing = values[trailing_at]
+        trailing_at += 1
+        result = wma_sum * 0.1
+        wma_sum -= wma_sub
+        return result
+
+    for today in range(3, 12):
+        smoothed = price_wma(values[today])
+
+    # Hilbert transform state per (variable, odd/even bar): 3-slot ring, prev output, prev input
+    state = {name: {parity: [[0.0, 0.0, 0.0], 0.0, 0.0] for parity in (0, 1)}
+             for name in ("detrender", "q1", "ji", "jq")}
+    hilbert_at = 0
+
+    def hilbert(name: str, value: float, parity: int, adjusted_period: float) -> float:
+        ring, prev, prev_input = state[name][parity]
+        scaled = a * value
+        result = -ring[hilbert_at] + scaled
+        ring[hilbert_at] = scaled
+        result -= prev
+        prev = b * prev_input
+        state[name][parity][1] = prev
+        state[name][parity][2] = value
+        return (result + prev) * adjusted_period
+
+    period = 0.0
+    prev_i2 = prev_q2 = re = im = 0.0
+    mama_value = fama_value = 0.0
+    i1_odd_prev3 = i1_even_prev3 = i1_odd_prev2 = i1_even_prev2 = 0.0
+    prev_phase = 0.0
+    for today in range(12, n):
+        adjusted_period = 0.075 * period + 0.54
+        price = values[today]
+        smoothed = price_wma(price)
+        if today % 2 == 0:
+            detrender = hilbert("detrender", smoothed, 0, adjusted_period)
+            q1 = hilbert("q1", detrender, 0, adjusted_period)
+            ji = hilbert("ji", i1_even_prev3, 0, adjusted_period)
+            jq = hilbert("jq", q1, 0, adjusted_period)
+            hilbert_at = (hilbert_at + 1) % 3
+            q2 = 0.2 * (q1 + ji) + 0.8 * prev_q2
+            i2 = 0.2 * (i1_even_prev3 - jq) + 0.8 * prev_i2
+            i1_odd_prev3, i1_odd_prev2 = i1_odd_prev2, detrender
+            phase = math.atan(q1 / i1_even_prev3) * rad2deg if i1_even_prev3 != 0.0 else 0.0
+        else:
+            detrender = hilbert("detrender", smoothed, 1, adjusted_period)
+            q1 = hilbert("q1", detrender, 1, adjusted_period)
+            ji = hilbert("ji", i1_odd_prev3, 1, adjusted_period)
+            jq = hilbert("jq", q1, 1, adjusted_period)
+            q2 = 0.2 * (q1 + ji) + 0.8 * prev_q2
+            i2 = 0.2 * (i1_odd_prev3 - jq) + 0.8 * prev_i2
+            i1_even_prev3, i1_even_prev2 = i1_even_prev2, detrender
+            phase = math.atan(q1 / i1_odd_prev3) * rad2deg if i1_odd_prev3 != 0.0 else 0.0
+        delta = max(prev_phase - phase, 1.0)
+        prev_phase = phase
+        alpha = max(fast_limit / delta, slow_limit) if delta > 1.0 else fast_limit
+        mama_value = alpha * price + (1 - alpha) * mama_value
+        fama_value = 0.5 * alpha * mama_value + (1 - 0.5 * alpha) * fama_value
+        if today >= MAMA_LOOKBACK:
+            out_mama[today] = mama_value
+            out_fama[today] = fama_value
+        re = 0.2 * (i2 * prev_i2 + q2 * prev_q2) + 0.8 * re
+        im = 0.2 * (i2 * prev_q2 - q2 * prev_i2) + 0.8 * im
+        prev_q2, prev_i2 = q2, i2
+        last_period = period
+        if im != 0.0 and re != 0.0:
+            period = 360.0 / (math.atan(im / re) * rad2deg)
+        period = min(max(period, 0.67 * last_period), 1.5 * last_period)
+        period = min(max(period, 6.0), 50.0)
+        period = 0.2 * period + 0.8 * last_period
+    return out_mama, out_fama
+
+
+# Alpha Vantage matype codes (TA-Lib's MAType enum); 8 is MAMA with its default limits
+MA_TYPES: Dict[int, Callable[[np.ndarray, int], np.ndarray]] = {
+    0: sma,
+    1: ema,
+    2: wma,
+    3: dema,
+    4: tema,
+    5: trima,
+    6: t3,
+    7: kama,
+    8: lambda x, period: mama(x)[0],
+}
+
+
+def ma_lookback(period: int, matype: int = 0) -> int:
+    """Bars a moving average consumes before its first output (TA-Lib's lookback)"""
+    if period == 1:
+        return 0
+    return {3: 2 * (period - 1), 4: 3 * (period - 1), 6: 6 * (period - 1),
+            7: period, 8: MAMA_LOOKBACK}.get(int(matype), period - 1)
+
+
+def moving_average(x: np.ndarray, period: int, matype: int = 0, start: Optional[int] = None) -> np.ndarray:
+    """Moving average selected by an Alpha Vantage `matype` code.
+
+    Leading NaNs (an upstream indicator's warm-up) are skipped. With
+    `start`, the average is seeded so its first output lands on that
+    index, the way TA-Lib seeds an average asked for a later start; for
+    recursive averages this changes every later value.
+    """
+    matype = int(matype)
+    if matype not in MA_TYPES:
+        raise ValueError(f"Unsupported matype {matype}")
+    out = nans(len(x))
+    first = first_valid(x)
+    if start is not None:
+        first = max(first, start - ma_lookback(period, matype))
+    if first >= len(x):
+        return out
+    out[first:] = x[first:] if period == 1 else MA_TYPES[matype](x[first:], period)
+    return out
+
+
+def _single(kernel: Callable[[np.ndarray, int], np.ndarray], name: str) -> Callable[..., Dict[str, np.ndarray]]:
+    def compute(bars: Any, time_period: int = 20, series_type: str = "close") -> Dict[str, np.ndarray]:
+        return {name: kernel(bars[series_type], int(time_period))}
+    return compute
+
+
+def _mama(bars: Any, fastlimit: float = MAMA_FAST_LIMIT, slowlimit: float = MAMA_SLOW_LIMIT,
+          series_type: str = "close") -> Dict[str, np.ndarray]:
+    mama_line, fama_line = mama(bars[series_type], float(fastlimit), float(slowlimit))
+    return {"FAMA": fama_line, "MAMA": mama_line}
+
+
+# Alpha Vantage function -> (indicator name in Meta Data, kernel over a bar series)
+FUNCTIONS = {
+    "SMA": ("Simple Moving Average (SMA)", _single(sma, "SMA")),
+    "EMA": ("Exponential Moving Average (EMA)", _single(ema, "EMA")),
+    "WMA": ("Weighted Moving Average (WMA)", _single(wma, "WMA")),
+    "DEMA": ("Double Exponential Moving Average (DEMA)", _single(dema, "DEMA")),
+    "TEMA": ("Triple Exponential Moving Average (TEMA)", _single(tema, "TEMA")),
+    "TRIMA": ("Triangular Exponential Moving Average (TRIMA)", _single(trima, "TRIMA")),
+    "KAMA": ("Kaufman Adaptive Moving Average (KAMA)", _single(kama, "KAMA")),
+    "T3": ("Triple Exponential Moving Average (T3)", _single(t3, "T3")),
+    "MAMA": ("MESA Adaptive Moving Average (MAMA)", _mama),
+}
@@ -0,0 +1,235 @@
+from typing import Any, Dict, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from moving_averages import ema, first_valid, ma_lookback, moving_average, nans
+from rolling import rolling_max, rolling_min, rolling_sum
+
+# Kernels follow TA-Lib (which Alpha Vantage runs): same lookbacks, same
+# seeding, and 0 where TA-Lib guards a division by zero. Outputs are full
+# length with NaN warm-up bars.
+
+
+def _shift(x: np.ndarray, period: int) -> np.ndarray:
+    """x[t - period] aligned to t, NaN where it doesn't exist"""
+    out = nans(len(x))
+    if period < len(x):
+        out[period:] = x[:len(x) - period]
+    return out
+
+
+def _safe_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """numerator / denominator, 0 where the denominator is 0 (NaN stays NaN)"""
+    zero = denominator == 0
+    return np.where(zero, 0.0, numerator / np.where(zero, 1.0, denominator))
+
+
+def wilder_gains(x: np.ndarray, period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Wilder-smoothed average gain and loss, seeded with the mean of the first `period` changes"""
+    change = np.r_[np.nan, np.diff(x)]
+    alpha = 1.0 / period
+    return ema(np.maximum(change, 0.0), period, alpha), ema(np.maximum(-change, 0.0), period, alpha)
+
+
+def rsi(x: np.ndarray, period: int = 14) -> np.ndarray:
+    gain, loss = wilder_gains(x, period)
+    return _safe_ratio(100.0 * gain, gain + loss)
+
+
+def cmo(x: np.ndarray, period: int = 14) -> np.ndarray:
+    gain, loss = wilder_gains(x, period)
+    return _safe_ratio(100.0 * (gain - loss), gain + loss)
+
+
+def mom(x: np.ndarray, period: int = 10) -> np.ndarray:
+    return x - _shift(x, period)
+
+
+def rocr(x: np.ndarray, period: int = 10) -> np.ndarray:
+    return _safe_ratio(x, _shift(x, period))
+
+
+def roc(x: np.ndarray, period: int = 10) -> np.ndarray:
+    previous = _shift(x, period)
+    return _safe_ratio((x - previous) * 100.0, previous)
+
+
+def fast_k(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    """Where the close sits in the `period`-bar high-low range, 0-100"""
+    lowest = rolling_min(low, period)
+    return _safe_ratio(100.0 * (close - lowest), rolling_max(high, period) - lowest)
+
+
+def stoch(high: np.ndarray, low: np.ndarray, close: np.ndarray, fastk_period: int = 5,
+          slowk_period: int = 3, slowk_matype: int = 0, slowd_period: int = 3,
+          slowd_matype: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    slow_k = moving_average(fast_k(high, low, close, fastk_period), slowk_period, slowk_matype)
+    return slow_k, moving_average(slow_k, slowd_period, slowd_matype)
+
+
+def stochf(high: np.ndarray, low: np.ndarray, close: np.ndarray, fastk_period: int = 5,
+           fastd_period: int = 3, fastd_matype: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    k = fast_k(high, low, close, fastk_period)
+    return k, moving_average(k, fastd_period, fastd_matype)
+
+
+def stochrsi(x: np.ndarray, period: int = 14, fastk_period: int = 5, fastd_period: int = 3,
+             fastd_matype: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """Fast stochastic of the RSI line"""
+    line = rsi(x, period)
+    return stochf(line, line, line, fastk_period, fastd_period, fastd_matype)
+
+
+def willr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    highest = rolling_max(high, period)
+    return _safe_ratio(-100.0 * (highest - close), highest - rolling_min(low, period))
+
+
+def cci(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 20) -> np.ndarray:
+    """Commodity channel index: typical price's distance from its mean, in mean deviations / 0.015"""
+    typical = (high + low + close) / 3.0
+    out = nans(len(typical))
+    if len(typical) < period:
+        return out
+    windows = sliding_window_view(typical, period)
+    mean = windows.mean(axis=1)
+    deviation = np.abs(windows - mean[:, None]).mean(axis=1)
+    out[period - 1:] = _safe_ratio(typical[period - 1:] - mean, 0.015 * deviation)
+    return out
+
+
+def _price_oscillator(x: np.ndarray, fast_period: int, slow_period: int, matype: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Fast and slow averages, each run from the first bar, NaN before the slower one starts"""
+    if slow_period < fast_period:
+        fast_period, slow_period = slow_period, fast_period
+    fast, slow = moving_average(x, fast_period, matype), moving_average(x, slow_period, matype)
+    fast[:first_valid(x) + ma_lookback(slow_period, matype)] = np.nan
+    return fast, slow
+
+
+def apo(x: np.ndarray, fast_period: int = 12, slow_period: int = 26, matype: int = 0) -> np.ndarray:
+    fast, slow = _price_oscillator(x, fast_period, slow_period, matype)
+    return fast - slow
+
+
+def ppo(x: np.ndarray, fast_period: int = 12, slow_period: int = 26, matype: int = 0) -> np.ndarray:
+    fast, slow = _price_oscillator(x, fast_period, slow_period, matype)
+    return _safe_ratio((fast - slow) * 100.0, slow)
+
+
+def macdext(x: np.ndarray, fast_period: int = 12, fast_matype: int = 0, slow_period: int = 26,
+            slow_matype: int = 0, signal_period: int = 9,
+            signal_matype: int = 0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal and histogram with a separate average type for each"""
+    if slow_period < fast_period:
+        fast_period, slow_period = slow_period, fast_period
+        fast_matype, slow_matype = slow_matype, fast_matype
+    start = first_valid(x) + max(ma_lookback(fast_period, fast_matype), ma_lookback(slow_period, slow_matype))
+    line = moving_average(x, fast_period, fast_matype, start) - moving_average(x, slow_period, slow_matype, start)
+    signal = moving_average(line, signal_period, signal_matype)
+    return line, signal, line - signal
+
+
+def trix(x: np.ndarray, period: int = 30) -> np.ndarray:
+    """1-bar rate of change (percent) of a triple EMA"""
+    triple = ema(ema(ema(x, period), period), period)
+    return roc(triple, 1)
+
+
+def ultosc(high: np.ndarray, low: np.ndarray, close: np.ndarray, period1: int = 7,
+           period2: int = 14, period3: int = 28) -> np.ndarray:
+    """Ultimate oscillator: buying pressure over true range on three horizons, weighted 4:2:1"""
+    if len(close) < 2:
+        return nans(len(close))
+    previous = close[:-1]
+    true_low = np.minimum(low[1:], previous)
+    pressure = close[1:] - true_low
+    true_range = np.maximum(high[1:], previous) - true_low
+    short, medium, long = sorted((period1, period2, period3))
+    total = 0.0
+    for weight, period in ((4.0, short), (2.0, medium), (1.0, long)):
+        total = total + weight * _safe_ratio(rolling_sum(pressure, period), rolling_sum(true_range, period))
+    return np.r_[np.nan, 100.0 * total / 7.0]
+
+
+def bop(open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """Balance of power: (close - open) / (high - low)"""
+    return _safe_ratio(close - open_, high - low)
+
+
+def _series(kernel, name: str, default_period: int):
+    def compute(bars: Any, time_period: int = default_period, series_type: str = "close") -> Dict[str, np.ndarray]:
+        return {name: kernel(bars[series_type], int(time_period))}
+    return compute
+
+
+def _stoch(bars: Any, fastkperiod: int = 5, slowkperiod: int = 3, slowdperiod: int = 3,
+           slowkmatype: int = 0, slowdmatype: int = 0) -> Dict[str, np.ndarray]:
+    k, d = stoch(bars["high"], bars["low"], bars["close"], int(fastkperiod), int(slowkperiod),
+                 int(slowkmatype), int(slowdperiod), int(slowdmatype))
+    return {"SlowK": k, "SlowD": d}
+
+
+def _stochf(bars: Any, fastkperiod: int = 5, fastdperiod: int = 3, fastdmatype: int = 0) -> Dict[str, np.ndarray]:
+    k, d = stochf(bars["high"], bars["low"], bars["close"], int(fastkperiod), int(fastdperiod), int(fastdmatype))
+    return {"FastK": k, "FastD": d}
+
+
+def _stochrsi(bars: Any, time_period: int = 14, fastkperiod: int = 5, fastdperiod: int = 3,
+              fastdmatype: int = 0, series_type: str = "close") -> Dict[str, np.ndarray]:
+    k, d = stochrsi(bars[series_type], int(time_period), int(fastkperiod), int(fastdperiod), int(fastdmatype))
+    return {"FastK": k, "FastD": d}
+
+
+def _hlc(kernel, name: str, default_period: int):
+    def compute(bars: Any, time_period: int = default_period) -> Dict[str, np.ndarray]:
+        return {name: kernel(bars["high"], bars["low"], bars["close"], int(time_period))}
+    return compute
+
+
+def _apo(bars: Any, fastperiod: int = 12, slowperiod: int = 26, series_type: str = "close",
+         matype: int = 0) -> Dict[str, np.ndarray]:
+    return {"APO": apo(bars[series_type], int(fastperiod), int(slowperiod), int(matype))}
+
+
+def _ppo(bars: Any, fastperiod: int = 12, slowperiod: int = 26, series_type: str = "close",
+         matype: int = 0) -> Dict[str, np.ndarray]:
+    return {"PPO": ppo(bars[series_type], int(fastperiod), int(slowperiod), int(matype))}
+
+
+def _macdext(bars: Any, fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9,
+             series_type: str = "close", fastmatype: int = 0, slowmatype: int = 0,
+             signalmatype: int = 0) -> Dict[str, np.ndarray]:
+    line, signal, histogram = macdext(bars[series_type], int(fastperiod), int(fastmatype), int(slowperiod),
+                                      int(slowmatype), int(signalperiod), int(signalmatype))
+    return {"MACD_Signal": signal, "MACD": line, "MACD_Hist": histogram}
+
+
+def _ultosc(bars: Any, timeperiod1: int = 7, timeperiod2: int = 14, timeperiod3: int = 28) -> Dict[str, np.ndarray]:
+    return {"ULTOSC": ultosc(bars["high"], bars["low"], bars["close"], int(timeperiod1), int(timeperiod2), int(timeperiod3))}
+
+
+def _bop(bars: Any) -> Dict[str, np.ndarray]:
+    return {"BOP": bop(bars["open"], bars["high"], bars["low"], bars["close"])}
+
+
+# Alpha Vantage function -> (indicator name in Meta Data, kernel over a bar series)
+FUNCTIONS = {
+    "RSI": ("Relative Strength Index (RSI)", _series(rsi, "RSI", 14)),
+    "STOCH": ("Stochastic (STOCH)", _stoch),
+    "STOCHF": ("Stochastic Fast (STOCHF)", _stochf),
+    "STOCHRSI": ("Stochastic Relative Strength Index (STOCHRSI)", _stochrsi),
+    "WILLR": ("Williams' %R (WILLR)", _hlc(willr, "WILLR", 14)),
+    "CCI": ("Commodity Channel Index (CCI)", _hlc(cci, "CCI", 20)),
+    "CMO": ("Chande Momentum Oscillator (CMO)", _series(cmo, "CMO", 14)),
+    "MOM": ("Momentum (MOM)", _series(mom, "MOM", 10)),
+    "ROC": ("Rate of change : ((price/prevPrice)-1)*100", _series(roc, "ROC", 10)),
+    "ROCR": ("Rate of change ratio: (price/prevPrice)", _series(rocr, "ROCR", 10)),
+    "APO": ("Absolute Price Oscillator (APO)", _apo),
+    "PPO": ("Percentage Price Oscillator (PPO)", _ppo),
+    "MACDEXT": ("MACD with Controllable MA Type (MACDEXT)", _macdext),
+    "TRIX": ("1-day Rate-Of-Change (ROC) of a Triple Smooth EMA (TRIX)", _series(trix, "TRIX", 30)),
+    "ULTOSC": ("Ultimate Oscillator (ULTOSC)", _ultosc),
+    "BOP": ("Balance Of Power (BOP)", _bop),
+}
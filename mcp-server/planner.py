@@ -0,0 +1,184 @@
+import math
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from resample import to_calendar_period
+from timeseries import TimeSeries, format_timestamp, parse_timestamp
+
+# Tool arguments that narrow a series answer, shared by every series tool
+WINDOW_PROPERTIES = {
+    "from_date": {"type": "string", "description": "Earliest bar to return, YYYY-MM-DD or YYYY-MM-DD HH:MM"},
+    "to_date": {"type": "string", "description": "Latest bar to return, YYYY-MM-DD or YYYY-MM-DD HH:MM (a date includes the whole day)"},
+    "as_of": {"type": "string", "description": "Return only the bar at this date/time, or the closest one before it"},
+}
+
+
+def window_start(args: Dict[str, Any]) -> Optional[int]:
+    """Time the tool call's window needs a bar at or before: its `as_of` or `from_date`, if any"""
+    if args.get("as_of"):
+        return parse_timestamp(args["as_of"], end_of_day=True)
+    if args.get("from_date"):
+        return parse_timestamp(args["from_date"])
+    return None
+
+
+def covers(series: TimeSeries, args: Dict[str, Any]) -> bool:
+    """Whether `series` reaches back far enough to answer the tool call's window"""
+    start = window_start(args)
+    return start is None or (len(series) > 0 and series.timestamps[0] <= start)
+
+
+def select_window(series: TimeSeries, args: Dict[str, Any]) -> TimeSeries:
+    """Narrow a series to the tool call's `as_of` bar or `from_date`/`to_date` range.
+
+    If the window starts before the series' first bar, `_meta` says where
+    the data starts, so a short or empty answer isn't mistaken for no bars.
+    """
+    if args.get("as_of"):
+        i = series.asof(parse_timestamp(args["as_of"], end_of_day=True))
+        selected = series.slice(0, 0) if i is None else series.slice(i, i + 1)
+    elif args.get("from_date") or args.get("to_date"):
+        start = parse_timestamp(args["from_date"]) if args.get("from_date") else None
+        end = parse_timestamp(args["to_date"], end_of_day=True) if args.get("to_date") else None
+        selected = series.window(start, end)
+    else:
+        return series
+    if not covers(series, args):
+        selected = selected.with_meta(data_starts=format_timestamp(series.timestamps[0]) if len(series) else None)
+    return selected
+
+
+def latest_price(symbol: str, series: TimeSeries) -> Dict[str, Any]:
+    """get_stock_price's answer: the newest bar's close"""
+    latest = series.latest()
+    if latest is None or "close" not in latest:
+        return {"error": "No data found"}
+    return {"symbol": symbol, "latest_time": latest["timestamp"], "latest_close": latest["close"]}
+
+
+def quote_from_daily(symbol: str, daily: TimeSeries) -> Optional[Dict[str, Any]]:
+    """GLOBAL_QUOTE response built from the last two daily bars, or None without a usable previous close"""
+    if len(daily) < 2:
+        return None
+    close = daily["close"]
+    previous = float(close[-2])
+    if not math.isfinite(previous) or previous == 0:
+        return None
+    change = float(close[-1]) - previous
+    return {
+        "Global Quote": {
+            "01. symbol": symbol,
+            "02. open": f"{daily['open'][-1]:.4f}",
+            "03. high": f"{daily['high'][-1]:.4f}",
+            "04. low": f"{daily['low'][-1]:.4f}",
+            "05. price": f"{close[-1]:.4f}",
+            "06. volume": f"{daily['volume'][-1]:.0f}",
+            "07. latest trading day": format_timestamp(daily.timestamps[-1]),
+            "08. previous close": f"{previous:.4f}",
+            "09. change": f"{change:.4f}",
+            "10. change percent": f"{change / previous * 100:.4f}%",
+        }
+    }
+
+
+class DerivationPlanner:
+    """Answers tool calls from fresh cached responses before any quota is spent.
+
+    For each tool it knows, the planner first looks for the exact response
+    in the client's response cache (a hit). Failing that, it looks for a
+    fresh superset it can compute the answer from (a derive):
+
+    - weekly and monthly bars from a full daily history
+    - coarser intraday bars, or the latest intraday price, from a finer interval
+    - a quote from the final daily bar once the session has settled
+
+    Between sessions, the daily history in the client's series store is
+    also a source: once its last bar is the settled session, it is as
+    current as anything upstream. Anything else is a miss, and the tool handler calls upstream as usual.
+    """
+
+    def __init__(self, av_client: Any):
+        self.av_client = av_client
+        self._rules: Dict[str, Callable[[Dict[str, Any]], Awaitable[Optional[Any]]]] = {
+            "get_stock_price": self._stock_price,
+            "get_stock_quote": self._stock_quote,
+            "get_time_series_weekly": lambda args: self._period(args, "weekly"),
+            "get_time_series_monthly": lambda args: self._period(args, "monthly"),
+            "get_time_series_intraday": self._intraday,
+        }
+        self.hits = 0
+        self.derives = 0
+        self.misses = 0
+
+    async def answer(self, name: str, args: Dict[str, Any]) -> Optional[Any]:
+        """Return the tool's response computed without upstream calls, or None"""
+        rule = self._rules.get(name)
+        if rule is None or "symbol" not in args:
+            return None
+        result = await rule(args)
+        if result is None:
+            self.misses += 1
+        return result
+
+    def _hit(self, value: Any) -> Any:
+        self.hits += 1
+        return value
+
+    def _derived(self, value: Any) -> Any:
+        self.derives += 1
+        return value
+
+    async def _stock_quote(self, args: Dict[str, Any]) -> Optional[Any]:
+        symbol = args["symbol"].upper()
+        quote = await self.av_client.cached_response("GLOBAL_QUOTE", symbol)
+        if quote is not None:
+            return self._hit(quote)
+        settled = self.av_client.calendar.last_settled_session()
+        if settled is None:
+            # While the market trades, only a real quote is current enough
+            return None
+        for outputsize in ("compact", "full"):
+            daily = await self.av_client.cached_series("TIME_SERIES_DAILY", symbol, outputsize=outputsize)
+            if daily is not None and len(daily) and format_timestamp(daily.timestamps[-1]) == settled.isoformat():
+                quote = quote_from_daily(symbol, daily)
+                if quote is not None:
+                    return self._derived(quote)
+        daily = self.av_client.settled_daily(symbol)
+        quote = quote_from_daily(symbol, daily) if daily is not None else None
+        return self._derived(quote) if quote is not None else None
+
+    async def _period(self, args: Dict[str, Any], period: str) -> Optional[Any]:
+        symbol = args["symbol"].upper()
+        series = await self.av_client.cached_series(f"TIME_SERIES_{period.upper()}", symbol)
+        if series is not None:
+            return self._hit(series)
+        daily = await self.av_client.cached_series("TIME_SERIES_DAILY", symbol, outputsize="full")
+        if daily is None or not len(daily):
+            daily = self.av_client.settled_daily(symbol, full_history=True)
+            if daily is None:
+                return None
+        return self._derived(to_calendar_period(daily, period))
+
+    async def _intraday(self, args: Dict[str, Any]) -> Optional[Any]:
+        symbol = args["symbol"].upper()
+        interval = args.get("interval", "5min")
+        outputsize = args.get("outputsize", "compact")
+        series = await self.av_client.cached_series("TIME_SERIES_INTRADAY", symbol, interval=interval, outputsize=outputsize)
+        # A cached window that starts after the call's window is a miss; the handler fetches more
+        if series is not None and covers(series, args):
+            return self._hit(series)
+        series = await self.av_client.resampled_intraday(symbol, interval, outputsize)
+        return self._derived(series) if series is not None and covers(series, args) else None
+
+    async def _stock_price(self, args: Dict[str, Any]) -> Optional[Any]:
+        symbol = args["symbol"].upper()
+        interval = args.get("interval", "5min")
+        series = await self.av_client.cached_series("TIME_SERIES_INTRADAY", symbol, interval=interval, outputsize="compact")
+        if series is not None and covers(series, args):
+            return self._hit(latest_price(symbol, select_window(series, args)))
+        series = await self.av_client.resampled_intraday(symbol, interval, "compact")
+        if series is None or not covers(series, args):
+            return None
+        return self._derived(latest_price(symbol, select_window(series, args)))
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "derives": self.derives, "misses": self.misses}
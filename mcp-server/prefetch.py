@@ -0,0 +1,118 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from market_calendar import MarketCalendar
+from rate_limiter import Priority, priority_scope
+
+
+class PrefetchScheduler:
+    """Keeps a watchlist warm by running tool calls ahead of users.
+
+    Every tool in `tools` is run for every symbol in `watchlist`, through
+    the same ToolHandler the MCP server dispatches to. Responses therefore
+    land in the client's response cache under exactly the keys interactive
+    calls read. One pass runs `pre_open_lead` seconds before each session
+    opens (per `calendar`, so holidays are skipped). More passes run every
+    `interval` seconds while the market is open. All requests run at
+    BACKGROUND priority, so they stay within the limiter's background share
+    and queue behind interactive calls.
+    """
+
+    def __init__(
+        self,
+        tool_handler: Any,
+        watchlist: List[str],
+        tools: List[str],
+        interval: float = 300.0,
+        pre_open_lead: float = 1800.0,
+        concurrency: int = 4,
+        calendar: Optional[MarketCalendar] = None
+    ):
+        self.tool_handler = tool_handler
+        self.watchlist = [symbol.upper() for symbol in watchlist]
+        self.tools = tools
+        self.interval = interval
+        self.pre_open_lead = pre_open_lead
+        self.concurrency = concurrency
+        self.calendar = calendar or MarketCalendar()
+        self._warmed_for: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.calls = 0
+        self.errors = 0
+        self.last_run: Optional[float] = None
+        self.last_duration = 0.0
+
+    def start(self):
+        if self._task is None and self.watchlist and self.tools:
+            self._task = asyncio.ensure_future(self._loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.seconds_until_next_run())
+            warms = self.pre_open_session()
+            if warms is not None:
+                # The pre-open pass runs once per session
+                self._warmed_for = warms
+            await self.run_once()
+
+    def pre_open_session(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        """Open of the session a pass at `now` warms up, or None outside its `pre_open_lead` window"""
+        now = now or self.calendar.now()
+        if self.calendar.is_open(now):
+            return None
+        opens_at = self.calendar.next_open(now)
+        if (opens_at - now).total_seconds() > self.pre_open_lead:
+            return None
+        return opens_at
+
+    def seconds_until_next_run(self, now: Optional[datetime] = None) -> float:
+        """Seconds until the next pre-open pass or intraday refresh"""
+        now = now or self.calendar.now()
+        if self.calendar.is_open(now):
+            return self.interval
+        opens_at = self.calendar.next_open(now)
+        if opens_at == self._warmed_for:
+            # Already warmed for this session; wait for the open itself rather
+            # than returning 0 and re-running the pass until the bell
+            return (opens_at - now).total_seconds()
+        return max(0.0, (opens_at - timedelta(seconds=self.pre_open_lead) - now).total_seconds())
+
+    async def run_once(self):
+        """Run every watchlist tool call once at background priority"""
+        started = time.monotonic()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def call(name: str, symbol: str):
+            async with semaphore:
+                result = await self.tool_handler.handle_tool_call(name, {"symbol": symbol})
+            self.calls += 1
+            if result.startswith("Error executing tool"):
+                self.errors += 1
+
+        with priority_scope(Priority.BACKGROUND):
+            await asyncio.gather(*[call(name, symbol) for symbol in self.watchlist for name in self.tools])
+        self.runs += 1
+        self.last_run = time.time()
+        self.last_duration = time.monotonic() - started
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "watchlist": len(self.watchlist),
+            "runs": self.runs,
+            "calls": self.calls,
+            "errors": self.errors,
+            "last_run": self.last_run,
+            "last_duration_s": round(self.last_duration, 2),
+        }
@@ -0,0 +1,70 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+class QuoteBatcher:
+    """Merges concurrent single-symbol quote requests into bulk upstream calls.
+
+    The first request opens a `window`-second collection window; every
+    symbol requested before it closes (up to `max_batch`) is fetched with
+    one call to `fetch_bulk`, and each caller gets its own symbol's result.
+    """
+
+    def __init__(
+        self,
+        fetch_bulk: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+        window: float = 0.05,
+        max_batch: int = 100
+    ):
+        self.fetch_bulk = fetch_bulk
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+        self.batches = 0
+        self.symbols_requested = 0
+
+    async def get(self, symbol: str) -> Any:
+        """Return the quote for `symbol` from the next bulk call"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(symbol, []).append(future)
+        self.symbols_requested += 1
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending:
+            symbols = list(self._pending)[:self.max_batch]
+            batch = {symbol: self._pending.pop(symbol) for symbol in symbols}
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: Dict[str, List[asyncio.Future]]):
+        self.batches += 1
+        try:
+            quotes = await self.fetch_bulk(list(batch))
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        for symbol, futures in batch.items():
+            for future in futures:
+                if future.done():
+                    continue
+                if symbol in quotes:
+                    future.set_result(quotes[symbol])
+                else:
+                    future.set_exception(KeyError(f"No bulk quote returned for {symbol}"))
+
+    def stats(self) -> dict:
+        return {"batches": self.batches, "symbols_requested": self.symbols_requested}
@@ -0,0 +1,130 @@
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import List, Optional, Tuple
+
+
+class Priority(IntEnum):
+    """Scheduling class of an upstream request (lower value is served first)"""
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+# Priority of the request being made from the current task; tool calls coming
+# from ask_openai / handle_tool_call run with the INTERACTIVE default.
+request_priority: ContextVar[Priority] = ContextVar("request_priority", default=Priority.INTERACTIVE)
+
+
+@contextmanager
+def priority_scope(priority: Priority):
+    """Run the enclosed requests with the given priority class"""
+    token = request_priority.set(priority)
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at `capacity` tokens per `period` seconds"""
+
+    def __init__(self, capacity: int, period: float):
+        self.capacity = float(capacity)
+        self.rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, now: float) -> float:
+        """Seconds until one token is available (0 if available now)"""
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def consume(self):
+        self.tokens -= 1
+
+
+class RateLimiter:
+    """Per-minute and per-day token buckets with a priority-ordered wait queue.
+
+    A limit of 0 disables the corresponding bucket. BACKGROUND requests
+    additionally draw from their own buckets sized at `background_share` of
+    each limit, so prefetching can never use up the quota interactive tool
+    calls rely on.
+    """
+
+    def __init__(self, per_minute: int = 5, per_day: int = 25, background_share: float = 1.0):
+        self.buckets: List[TokenBucket] = []
+        self.background_buckets: List[TokenBucket] = []
+        for limit, period in ((per_minute, 60.0), (per_day, 86400.0)):
+            if limit <= 0:
+                continue
+            self.buckets.append(TokenBucket(limit, period))
+            if background_share < 1.0:
+                self.background_buckets.append(TokenBucket(max(1.0, limit * background_share), period))
+        self._queue: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.granted = 0
+        self.background_granted = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    async def acquire(self, priority: Optional[Priority] = None) -> float:
+        """Wait for a token and return the time spent queued in seconds"""
+        if priority is None:
+            priority = request_priority.get()
+        start = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (int(priority), next(self._counter), future))
+        self._dispatch()
+        await future
+        waited = time.monotonic() - start
+        self.granted += 1
+        if priority >= Priority.BACKGROUND:
+            self.background_granted += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        return waited
+
+    def _dispatch(self):
+        """Grant tokens to queued waiters in priority order while buckets allow"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._queue:
+            priority, _, future = self._queue[0]
+            if future.done():
+                heapq.heappop(self._queue)
+                continue
+            now = time.monotonic()
+            buckets = self.buckets
+            if priority >= Priority.BACKGROUND:
+                buckets = buckets + self.background_buckets
+            delay = max((bucket.delay(now) for bucket in buckets), default=0.0)
+            if delay > 0:
+                self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                return
+            for bucket in buckets:
+                bucket.consume()
+            heapq.heappop(self._queue)
+            future.set_result(None)
+
+    def stats(self) -> dict:
+        """Return limiter counters"""
+        return {
+            "granted": self.granted,
+            "background_granted": self.background_granted,
+            "queued": sum(1 for _, _, future in self._queue if not future.done()),
+            "avg_wait_ms": round(self.total_wait / self.granted * 1000, 1) if self.granted else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 1),
+        }
@@ -0,0 +1,98 @@
+from typing import Dict, Optional
+
+import numpy as np
+
+from timeseries import TimeSeries
+
+DAY_SECONDS = 86400
+# 1970-01-01 was a Thursday; shifting by 3 days makes weeks start on Monday
+WEEK_SHIFT_DAYS = 3
+INTRADAY_MINUTES = (1, 5, 15, 30, 60)
+# Bars in a compact intraday response
+COMPACT_BARS = 100
+# Alpha Vantage intraday bars run from the 04:00 extended-hours open
+SESSION_OFFSET = 4 * 3600
+
+SERIES_KEYS = {
+    "weekly": "Weekly Time Series",
+    "monthly": "Monthly Time Series",
+}
+
+
+def interval_minutes(interval: str) -> Optional[int]:
+    """5 for "5min", None for anything that isn't an intraday interval"""
+    if interval.endswith("min") and interval[:-3].isdigit():
+        return int(interval[:-3])
+    return None
+
+
+def _aggregate(series: TimeSeries, starts: np.ndarray) -> Dict[str, np.ndarray]:
+    """Reduce each run of bars beginning at `starts` with OHLCV semantics"""
+    ends = np.append(starts[1:], len(series)) - 1
+    columns = {}
+    for name, column in series.columns.items():
+        if name == "open":
+            columns[name] = column[starts]
+        elif name == "high":
+            columns[name] = np.maximum.reduceat(column, starts)
+        elif name == "low":
+            columns[name] = np.minimum.reduceat(column, starts)
+        elif name in ("volume", "dividend amount"):
+            columns[name] = np.add.reduceat(column, starts)
+        elif name == "split coefficient":
+            columns[name] = np.multiply.reduceat(column, starts)
+        else:
+            # close and anything else: value at the end of the period
+            columns[name] = column[ends]
+    return columns
+
+
+def _group_starts(keys: np.ndarray) -> np.ndarray:
+    """Indices where a new group begins in an ascending key array"""
+    if not len(keys):
+        return np.empty(0, dtype=np.intp)
+    return np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+
+
+def to_calendar_period(daily: TimeSeries, period: str) -> TimeSeries:
+    """Resample daily bars into "weekly" or "monthly" bars.
+
+    As in Alpha Vantage's own weekly and monthly series, each bar is
+    labelled with the last trading day it covers, and the current period
+    is included as a partial bar labelled with the latest day.
+    """
+    days = daily.timestamps // DAY_SECONDS
+    if period == "weekly":
+        keys = (days + WEEK_SHIFT_DAYS) // 7
+    elif period == "monthly":
+        keys = days.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+    else:
+        raise ValueError(f"Unknown period {period!r}")
+    starts = _group_starts(keys)
+    ends = np.append(starts[1:], len(daily)) - 1
+    return TimeSeries(daily.timestamps[ends], _aggregate(daily, starts), dict(daily.metadata),
+                      SERIES_KEYS[period], daily.labels, {"derived_from": "daily"})
+
+
+def to_intraday_interval(series: TimeSeries, source_minutes: int, target_minutes: int,
+                         now: Optional[int] = None) -> TimeSeries:
+    """Resample intraday bars into a coarser interval.
+
+    Bars are labelled by the start of the interval they cover and aligned
+    to the extended session start, matching Alpha Vantage. If `now` (epoch
+    seconds of wall-clock time in the series' time zone, like the index) is
+    given, a trailing interval that hasn't finished yet is dropped.
+    """
+    if target_minutes % source_minutes:
+        raise ValueError(f"Can't build {target_minutes}min bars from {source_minutes}min bars")
+    step = target_minutes * 60
+    buckets = (series.timestamps - SESSION_OFFSET) // step * step + SESSION_OFFSET
+    starts = _group_starts(buckets)
+    result = TimeSeries(buckets[starts], _aggregate(series, starts), dict(series.metadata),
+                        f"Time Series ({target_minutes}min)", series.labels,
+                        {"derived_from": f"{source_minutes}min"})
+    if now is not None and len(result) and result.timestamps[-1] + step > now:
+        result = result.slice(0, len(result) - 1)
+    if "4. Interval" in result.metadata:
+        result.metadata["4. Interval"] = f"{target_minutes}min"
+    return result
@@ -0,0 +1,315 @@
+import asyncio
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from timeseries import TimeSeries
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+WEEK = 7 * DAY
+
+# Cache lifetime in seconds per Alpha Vantage `function`; 0 disables caching
+TTL_POLICY: Dict[str, float] = {
+    # Intraday data and quotes
+    "TIME_SERIES_INTRADAY": 5 * MINUTE,
+    "GLOBAL_QUOTE": 1 * MINUTE,
+    "REALTIME_BULK_QUOTES": 1 * MINUTE,
+    "MARKET_STATUS": 5 * MINUTE,
+    "TOP_GAINERS_LOSERS": 5 * MINUTE,
+    "TRENDING_QUOTES": 5 * MINUTE,
+    "NEWS_SENTIMENTS_TRENDING": 15 * MINUTE,
+    "EXCHANGE_RATES_TRENDING": 5 * MINUTE,
+    # End-of-day series
+    "TIME_SERIES_DAILY": 1 * HOUR,
+    "TIME_SERIES_WEEKLY": 6 * HOUR,
+    "TIME_SERIES_MONTHLY": 6 * HOUR,
+    "FX_DAILY": 1 * HOUR,
+    "FX_WEEKLY": 6 * HOUR,
+    "FX_MONTHLY": 6 * HOUR,
+    "ANALYTICS_FIXED_WINDOW": 1 * HOUR,
+    "ANALYTICS_SLIDING_WINDOW": 1 * HOUR,
+    "HISTORICAL_OPTIONS": 1 * DAY,
+    # Fundamentals and reference data
+    "OVERVIEW": 1 * DAY,
+    "INCOME_STATEMENT": 1 * DAY,
+    "BALANCE_SHEET": 1 * DAY,
+    "CASH_FLOW": 1 * DAY,
+    "FUNDAMENTAL_DATA": 1 * DAY,
+    "COMPANY_OVERVIEW_TRENDING": 1 * DAY,
+    "EARNINGS_TRENDING": 1 * DAY,
+    "ETF_PROFILE_HOLDINGS": 1 * DAY,
+    "CORPORATE_ACTION_DIVIDENDS": 1 * DAY,
+    "CORPORATE_ACTION_SPLITS": 1 * DAY,
+    "EARNINGS_CALL_TRANSCRIPT": 7 * DAY,
+    "INSIDER_TRANSACTIONS_TRENDING": 1 * DAY,
+    "LISTING_DELISTING_STATUS": 1 * DAY,
+    "EARNINGS_CALENDAR": 1 * DAY,
+    "IPO_CALENDAR": 1 * DAY,
+    "SYMBOL_SEARCH": 1 * DAY,
+    # Macro and commodities
+    "REAL_GDP": 1 * WEEK,
+    "REAL_GDP_PER_CAPITA": 1 * WEEK,
+    "CPI": 1 * WEEK,
+    "INFLATION": 1 * WEEK,
+    "RETAIL_SALES": 1 * WEEK,
+    "DURABLES": 1 * WEEK,
+    "UNEMPLOYMENT": 1 * WEEK,
+    "NONFARM_PAYROLL": 1 * WEEK,
+    "FEDERAL_FUNDS_RATE": 1 * DAY,
+    "TREASURY_YIELD": 1 * DAY,
+    "WTI": 1 * WEEK,
+    "BRENT": 1 * WEEK,
+    "NATURAL_GAS": 1 * WEEK,
+    "COPPER": 1 * WEEK,
+    "ALUMINUM": 1 * WEEK,
+    "WHEAT": 1 * WEEK,
+    "CORN": 1 * WEEK,
+    "COTTON": 1 * WEEK,
+    "SUGAR": 1 * WEEK,
+    "COFFEE": 1 * WEEK,
+    "ALL_COMMODITIES": 1 * WEEK,
+}
+
+# Technical indicators and anything else not listed above
+DEFAULT_TTL = 1 * HOUR
+INTRADAY_TTL = 5 * MINUTE
+
+
+def ttl_for(function: str, params: Dict[str, Any]) -> float:
+    """Return the cache lifetime in seconds for a request"""
+    if function in TTL_POLICY:
+        return TTL_POLICY[function]
+    # Indicators follow the interval of the series they are computed on
+    if str(params.get("interval", "")).endswith("min"):
+        return INTRADAY_TTL
+    return DEFAULT_TTL
+
+
+def encode_value(value: Any) -> str:
+    """Serialize a response for the disk tier; TimeSeries are stored in their columnar record form"""
+    if isinstance(value, TimeSeries):
+        return json.dumps({"__timeseries__": value.to_record()})
+    return json.dumps(value)
+
+
+def decode_value(body: str) -> Any:
+    value = json.loads(body)
+    if isinstance(value, dict) and "__timeseries__" in value:
+        return TimeSeries.from_record(value["__timeseries__"])
+    return value
+
+
+def value_size(value: Any, body: str) -> int:
+    """Memory-tier size of an entry: buffer bytes for a TimeSeries, serialized length otherwise"""
+    return value.nbytes if isinstance(value, TimeSeries) else len(body)
+
+
+class LRUCache:
+    """In-memory LRU cache bounded by the total serialized size of its entries"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Return (value, expires_at) and mark the entry recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0], entry[1]
+
+    def set(self, key: str, value: Any, expires_at: float, size: int):
+        self.pop(key)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (value, expires_at, size)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+
+    def pop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[2]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteStore:
+    """Persistent cache tier keeping serialized responses in a SQLite file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, function TEXT, body TEXT, stored_at REAL, expires_at REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        row = self._conn.execute(
+            "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def set(self, key: str, function: str, body: str, expires_at: float):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, function, body, stored_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+            (key, function, body, time.time(), expires_at)
+        )
+        self._conn.commit()
+
+    def purge_expired(self, before: float) -> int:
+        """Delete rows that expired before `before` and return how many were removed"""
+        cursor = self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (before,))
+        self._conn.commit()
+        return cursor.rowcount
+
+    def close(self):
+        self._conn.close()
+
+
+class ResponseCache:
+    """Two-tier response cache: a size-bounded LRU in memory over an optional SQLite store"""
+
+    PURGE_EVERY = 100
+    # Expired rows are the last-known-good fallback; only ones this far past expiry are purged
+    LAST_GOOD_RETENTION = 30 * DAY
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, path: Optional[str] = None):
+        self.memory = LRUCache(max_bytes)
+        self.disk = SQLiteStore(path) if path else None
+        self._lock = asyncio.Lock()
+        self._writes = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.disk_evictions = 0
+        self.stale_hits = 0
+
+    @staticmethod
+    def make_key(request_key: tuple) -> str:
+        return json.dumps(request_key)
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return a fresh cached response, or None"""
+        value, tier = await self._lookup(key)
+        self._count(tier)
+        return value
+
+    async def get_or_stale(self, key: str, grace: float) -> Optional[Tuple[Any, float]]:
+        """Return (value, seconds past expiry): 0 if fresh, up to `grace` if stale; None on a miss.
+
+        The lookup is counted once, as a hit, a stale hit or a miss.
+        """
+        value, tier = await self._lookup(key)
+        if value is not None:
+            self._count(tier)
+            return value, 0.0
+        stale = self._stale(key, grace)
+        self._count("stale" if stale is not None else None)
+        return stale
+
+    def _count(self, tier: Optional[str]):
+        if tier == "memory":
+            self.memory_hits += 1
+        elif tier == "disk":
+            self.disk_hits += 1
+        elif tier == "stale":
+            self.stale_hits += 1
+        else:
+            self.misses += 1
+
+    async def peek(self, key: str) -> Optional[Any]:
+        """Like get(), without counting towards hit and miss statistics"""
+        value, _ = await self._lookup(key)
+        return value
+
+    async def _lookup(self, key: str) -> Tuple[Optional[Any], Optional[str]]:
+        now = time.time()
+        entry = self.memory.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at > now:
+                return value, "memory"
+            # Expired entries stay in memory until evicted so they can be served stale
+        if self.disk is not None:
+            async with self._lock:
+                row = await asyncio.to_thread(self.disk.get, key)
+            if row is not None and row[1] > now:
+                body, expires_at = row
+                value = await asyncio.to_thread(decode_value, body)
+                self.memory.set(key, value, expires_at, value_size(value, body))
+                return value, "disk"
+        return None, None
+
+    def _stale(self, key: str, grace: float) -> Optional[Tuple[Any, float]]:
+        """(value, seconds past expiry) for an expired in-memory entry still within `grace`"""
+        entry = self.memory.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        overdue = time.time() - expires_at
+        if overdue <= 0 or overdue > grace:
+            return None
+        return value, overdue
+
+    async def get_last_good(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Return (value, seconds past expiry) for the newest stored response, expired or not"""
+        entry = self.memory.get(key)
+        if entry is None and self.disk is not None:
+            async with self._lock:
+                row = await asyncio.to_thread(self.disk.get, key)
+            if row is not None:
+                entry = (await asyncio.to_thread(decode_value, row[0]), row[1])
+        if entry is None:
+            return None
+        value, expires_at = entry
+        return value, max(0.0, time.time() - expires_at)
+
+    async def set(self, key: str, function: str, value: Any, ttl: float):
+        """Store a response in both tiers for `ttl` seconds.
+
+        A response with no lifetime left is still stored, already expired,
+        so it remains the key's last-known-good fallback.
+        """
+        expires_at = time.time() + max(ttl, 0.0)
+        body = await asyncio.to_thread(encode_value, value)
+        self.memory.set(key, value, expires_at, value_size(value, body))
+        if self.disk is not None:
+            async with self._lock:
+                await asyncio.to_thread(self.disk.set, key, function, body, expires_at)
+                self._writes += 1
+                if self._writes % self.PURGE_EVERY == 0:
+                    self.disk_evictions += await asyncio.to_thread(
+                        self.disk.purge_expired, time.time() - self.LAST_GOOD_RETENTION
+                    )
+
+    def close(self):
+        if self.disk is not None:
+            self.disk.close()
+
+    def stats(self) -> dict:
+        """Return hit, miss and eviction counters"""
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits,
+            "memory_evictions": self.memory.evictions,
+            "disk_evictions": self.disk_evictions,
+            "memory_entries": len(self.memory),
+            "memory_bytes": self.memory.size,
+        }
@@ -0,0 +1,68 @@
+from typing import Tuple
+
+import numpy as np
+
+from moving_averages import nans
+
+# O(n) rolling window statistics. Outputs are full length with NaN until the
+# first full window; a NaN inside a window makes that window's value NaN.
+
+
+def rolling_sum(x: np.ndarray, period: int) -> np.ndarray:
+    out = nans(len(x))
+    if len(x) >= period:
+        # Sum with NaNs as 0 and count them per window, so a NaN spoils only the windows holding it
+        missing = np.isnan(x)
+        sums = np.cumsum(np.r_[0.0, np.where(missing, 0.0, x)])
+        counts = np.cumsum(np.r_[0, missing])
+        out[period - 1:] = sums[period:] - sums[:-period]
+        out[period - 1:][counts[period:] > counts[:-period]] = np.nan
+    return out
+
+
+def _rolling_extreme(x: np.ndarray, period: int, accumulate: np.ufunc, fill: float) -> np.ndarray:
+    """van Herk/Gil-Werman: three passes whatever the period.
+
+    The series is cut into blocks of `period`. Every window spans the
+    tail of one block and the head of the next, so its extreme combines a
+    suffix extreme of the first with a prefix extreme of the second.
+    """
+    n = len(x)
+    out = nans(n)
+    if n < period:
+        return out
+    if period == 1:
+        out[:] = x
+        return out
+    blocks = -(-n // period)
+    padded = np.full(blocks * period, fill)
+    padded[:n] = x
+    padded = padded.reshape(blocks, period)
+    prefix = accumulate.accumulate(padded, axis=1).ravel()
+    suffix = accumulate.accumulate(padded[:, ::-1], axis=1)[:, ::-1].ravel()
+    out[period - 1:] = accumulate(suffix[:n - period + 1], prefix[period - 1:n])
+    return out
+
+
+def rolling_max(x: np.ndarray, period: int) -> np.ndarray:
+    return _rolling_extreme(x, period, np.maximum, -np.inf)
+
+
+def rolling_min(x: np.ndarray, period: int) -> np.ndarray:
+    return _rolling_extreme(x, period, np.minimum, np.inf)
+
+
+def rolling_mean_std(x: np.ndarray, period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Rolling mean and population standard deviation from running sums of x and x**2"""
+    mean, std = nans(len(x)), nans(len(x))
+    if len(x) < period:
+        return mean, std
+    # Centre first so the sum of squares doesn't swamp the variance
+    centre = float(np.nanmean(x)) if np.isfinite(x).any() else 0.0
+    shifted = x - centre
+    sums = rolling_sum(shifted, period)[period - 1:]
+    squares = rolling_sum(shifted * shifted, period)[period - 1:]
+    average = sums / period
+    mean[period - 1:] = average + centre
+    std[period - 1:] = np.sqrt(np.maximum(squares / period - average * average, 0.0))
+    return mean, std
@@ -0,0 +1,208 @@
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from timeseries import TimeSeries, field_name, to_epoch_seconds
+
+# Matches the object holding the bars, e.g. "Time Series (Daily)" or "Technical Analysis: SMA"
+SERIES_KEY_RE = re.compile(rb'"([^"]*(?:Time Series|Technical Analysis)[^"]*)"\s*:\s*\{')
+META_RE = re.compile(rb'"Meta Data"\s*:\s*(\{[^{}]*\})')
+# One bar: "2024-06-21": { "1. open": "168.1", ... }
+BAR_RE = re.compile(rb'\s*,?\s*"([^"]+)"\s*:\s*\{([^{}]*)\}')
+STAMP_RE = re.compile(rb'"(\d{4}-\d\d-\d\d[^"]*)"\s*:\s*\{')
+FIELD_RE = re.compile(rb'"([^"]+)"\s*:\s*"([^"]*)"')
+VALUE_RE = re.compile(rb'":\s*"([^"]*)"')
+# Key of the series object in each function's JSON response; anything else is an indicator
+SERIES_KEYS = {
+    "TIME_SERIES_INTRADAY": "Time Series ({interval})",
+    "TIME_SERIES_DAILY": "Time Series (Daily)",
+    "TIME_SERIES_DAILY_ADJUSTED": "Time Series (Daily)",
+    "TIME_SERIES_WEEKLY": "Weekly Time Series",
+    "TIME_SERIES_WEEKLY_ADJUSTED": "Weekly Adjusted Time Series",
+    "TIME_SERIES_MONTHLY": "Monthly Time Series",
+    "TIME_SERIES_MONTHLY_ADJUSTED": "Monthly Adjusted Time Series",
+    "FX_INTRADAY": "Time Series FX ({interval})",
+    "FX_DAILY": "Time Series FX (Daily)",
+    "FX_WEEKLY": "Time Series FX (Weekly)",
+    "FX_MONTHLY": "Time Series FX (Monthly)",
+    "CRYPTO_INTRADAY": "Time Series Crypto ({interval})",
+    "DIGITAL_CURRENCY_DAILY": "Time Series (Digital Currency Daily)",
+    "DIGITAL_CURRENCY_WEEKLY": "Time Series (Digital Currency Weekly)",
+    "DIGITAL_CURRENCY_MONTHLY": "Time Series (Digital Currency Monthly)",
+}
+TIMESTAMP_WIDTH = 19  # "YYYY-MM-DD HH:MM:SS"
+# Rough size of one pretty-printed OHLCV bar, used to preallocate from Content-Length
+BYTES_PER_BAR = 150
+
+
+class StreamingSeriesParser:
+    """Incremental decoder for Alpha Vantage time-series JSON.
+
+    Bars are matched directly in the byte stream and each chunk's values are
+    converted in bulk into preallocated numeric columns, so the nested
+    dict-of-strings tree that json.loads would build is never materialized.
+    Feed chunks as they arrive and call finish() at the end; if the body
+    turns out not to hold a series (e.g. an error payload) finish() returns
+    None and `raw` keeps the full body for regular JSON decoding.
+    """
+
+    def __init__(self, size_hint: int = 0):
+        self.capacity = max(64, size_hint // BYTES_PER_BAR)
+        self.count = 0
+        self.raw = b""
+        self._buf = b""
+        self._in_series = False
+        self._done = False
+        self.series_key: Optional[str] = None
+        self.metadata: Optional[Dict[str, Any]] = None
+        self.fields: List[str] = []
+        self.labels: List[str] = []
+        self._stamps = np.empty(self.capacity, dtype=f"S{TIMESTAMP_WIDTH}")
+        self._columns: List[np.ndarray] = []
+
+    def feed(self, chunk: bytes):
+        if self._done:
+            self._buf += chunk
+            return
+        self._buf += chunk
+        if not self._in_series:
+            self._find_series()
+        if self._in_series:
+            self._parse_bars()
+
+    def _find_series(self):
+        if self.metadata is None:
+            meta = META_RE.search(self._buf)
+            if meta:
+                self.metadata = json.loads(meta.group(1))
+        match = SERIES_KEY_RE.search(self._buf)
+        if match is None:
+            # Still in the header (or not a series at all); keep everything
+            self.raw = self._buf
+            return
+        self.series_key = match.group(1).decode()
+        self._in_series = True
+        self.raw = b""
+        self._buf = self._buf[match.end():]
+
+    def _grow(self):
+        self.capacity *= 2
+        self._stamps = np.resize(self._stamps, self.capacity)
+        self._columns = [np.resize(column, self.capacity) for column in self._columns]
+
+    def _parse_bars(self):
+        buf = self._buf
+        end = buf.rfind(b"}")
+        if end < 0:
+            return
+        # A bar closes with `"value" }`; a `}` that follows another `}` closes the series
+        before = buf[:end].rstrip()
+        while before.endswith(b"}"):
+            self._done = True
+            end = len(before) - 1
+            before = buf[:end].rstrip()
+        if STAMP_RE.search(buf, 0, end + 1):
+            self._append(buf[:end + 1])
+        self._buf = buf[end + 1:]
+
+    def _append(self, region: bytes):
+        """Write every complete bar in `region` into the columns with one vectorized conversion"""
+        if not self.fields:
+            first = BAR_RE.match(region)
+            self.labels = [name.decode() for name, _ in FIELD_RE.findall(first.group(2))]
+            self.fields = [field_name(label) for label in self.labels]
+            self._columns = [np.empty(self.capacity, dtype=np.float64) for _ in self.fields]
+        stamps = STAMP_RE.findall(region)
+        values = VALUE_RE.findall(region)
+        n, width = len(stamps), len(self.fields)
+        while self.count + n > self.capacity:
+            self._grow()
+        try:
+            block = np.array(values, dtype=bytes).astype(np.float64).reshape(n, width)
+        except ValueError:
+            # Non-numeric values or ragged bars; fall back to bar-by-bar decoding
+            block = np.full((n, width), np.nan)
+            for row, match in enumerate(BAR_RE.finditer(region)):
+                for col, value in enumerate(VALUE_RE.findall(match.group(2))[:width]):
+                    try:
+                        block[row, col] = float(value)
+                    except ValueError:
+                        pass
+        start = self.count
+        self._stamps[start:start + n] = stamps
+        for col, column in enumerate(self._columns):
+            column[start:start + n] = block[:, col]
+        self.count += n
+
+    def finish(self) -> Optional[TimeSeries]:
+        """Return the decoded columns, or None if the body held no series"""
+        if self.series_key is None:
+            self.raw = self._buf
+            return None
+        if self.metadata is None:
+            meta = META_RE.search(self._buf)
+            self.metadata = json.loads(meta.group(1)) if meta else {}
+        n = self.count
+        timestamps = to_epoch_seconds(self._stamps[:n])
+        columns = {name: column[:n] for name, column in zip(self.fields, self._columns)}
+        # Alpha Vantage lists bars newest first; store them oldest first
+        if n > 1 and timestamps[0] > timestamps[-1]:
+            timestamps = timestamps[::-1].copy()
+            columns = {name: column[::-1].copy() for name, column in columns.items()}
+        else:
+            columns = {name: column.copy() for name, column in columns.items()}
+        return TimeSeries(timestamps, columns, self.metadata, self.series_key, self.labels)
+
+
+def series_key_for(params: Dict[str, Any]) -> str:
+    """The series key Alpha Vantage's JSON response uses for a request, e.g. Time Series (5min)"""
+    function = params["function"]
+    template = SERIES_KEYS.get(function)
+    if template is None:
+        return f"Technical Analysis: {function}"
+    return template.format(interval=params.get("interval", ""))
+
+
+def parse_csv(body: bytes, series_key: str, metadata: Optional[Dict[str, Any]] = None) -> TimeSeries:
+    """Decode a `datatype=csv` response ("timestamp,open,...") into columns.
+
+    All cells are split in one pass and converted per column by NumPy, so
+    no per-row Python objects beyond the split itself are created.
+    """
+    lines = body.replace(b"\r", b"").strip().split(b"\n", 1)
+    # CSV headers use underscores where JSON labels have spaces ("adjusted_close")
+    raw_header = [name.decode().strip().replace("_", " ") for name in lines[0].split(b",")]
+    header = [field_name(name) for name in raw_header]
+    width = len(header)
+    rows = lines[1] if len(lines) > 1 else b""
+    cells = rows.replace(b"\n", b",").split(b",") if rows else []
+    table = np.array(cells, dtype=bytes).reshape(-1, width)
+    timestamps = to_epoch_seconds(table[:, 0].astype(f"S{TIMESTAMP_WIDTH}"))
+    values = table[:, 1:]
+    try:
+        numeric = values.astype(np.float64)
+    except ValueError:
+        numeric = np.array([[_to_float(cell) for cell in row] for row in values], dtype=np.float64).reshape(-1, width - 1)
+    order = slice(None, None, -1) if len(timestamps) > 1 and timestamps[0] > timestamps[-1] else slice(None)
+    columns = {name: numeric[order, i].copy() for i, name in enumerate(header[1:])}
+    labels = raw_header[1:]
+    if "Time Series" in series_key:
+        # JSON responses number price fields ("1. open"); keep renderings identical
+        labels = [f"{i}. {label}" for i, label in enumerate(labels, 1)]
+    return TimeSeries(timestamps[order].copy(), columns, metadata or {}, series_key, labels)
+
+
+def _to_float(cell: bytes) -> float:
+    try:
+        return float(cell)
+    except ValueError:
+        return np.nan
+
+
+def parse_series(body: bytes) -> Optional[TimeSeries]:
+    """Decode a complete time-series body in one go"""
+    parser = StreamingSeriesParser(size_hint=len(body))
+    parser.feed(body)
+    return parser.finish()
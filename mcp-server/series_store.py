@@ -0,0 +1,243 @@
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from timeseries import TimeSeries, merge_series
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process writer lock
+    fcntl = None
+
+# Store interval name per price-series function; intraday uses the request's interval
+STORED_FUNCTIONS = {
+    "TIME_SERIES_DAILY": "daily",
+    "TIME_SERIES_WEEKLY": "weekly",
+    "TIME_SERIES_MONTHLY": "monthly",
+    "TIME_SERIES_INTRADAY": None,
+}
+
+
+def store_interval(function: str, params: Dict[str, Any]) -> Optional[str]:
+    """Interval a response is stored under, or None if it isn't a stored price series"""
+    if function not in STORED_FUNCTIONS:
+        return None
+    interval = STORED_FUNCTIONS[function] or params.get("interval")
+    # Raw intraday bars (adjusted=false) are a different series from the default adjusted ones
+    if interval and str(params.get("adjusted", "true")).lower() == "false":
+        interval += "-raw"
+    return interval
+
+
+class SeriesStore:
+    """Append-only columnar store of memory-mapped NumPy files, one directory per (symbol, interval).
+
+    Each directory holds raw little-endian files, `timestamps.<gen>.i8` and
+    `<field>.<gen>.f8`, plus a `manifest.json` naming the generation, bar
+    count, field labels and metadata. The writer appends bars to the column
+    files first and then atomically replaces the manifest, so a reader
+    mapping `count` rows from the manifest it loaded never sees a partial
+    bar. Revisions to bars already written go to a fresh generation, and the
+    old files are unlinked; existing maps of them stay valid, and a reader
+    that loses the race to open them retries with the new manifest. Reads
+    and writes may run on different threads.
+
+    Only one process may write: the first store opened writable on a
+    directory takes an exclusive lock, and later ones fall back to read-only.
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, root: str, writable: bool = True):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        # Serialises writers; readers never take it, so a read doesn't wait on a rewrite
+        self._lock = threading.Lock()
+        self._views_lock = threading.Lock()
+        self._lock_file = None
+        self.writable = writable and self._acquire_writer_lock()
+        # (symbol, interval) -> (generation, count, TimeSeries of memmap views)
+        self._views: Dict[Tuple[str, str], Tuple[int, int, TimeSeries]] = {}
+        self.appended_bars = 0
+        self.rewrites = 0
+
+    def _acquire_writer_lock(self) -> bool:
+        if fcntl is None:
+            return True
+        self._lock_file = open(os.path.join(self.root, ".writer.lock"), "w")
+        try:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            # Another process writes this store; stats() reports it as read-only
+            self._lock_file.close()
+            self._lock_file = None
+            return False
+        return True
+
+    def close(self):
+        with self._views_lock:
+            self._views.clear()
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def _dir(self, symbol: str, interval: str) -> str:
+        return os.path.join(self.root, symbol.upper(), interval)
+
+    def _manifest(self, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(path, self.MANIFEST), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _file(path: str, name: str, generation: int, suffix: str) -> str:
+        return os.path.join(path, f"{name}.{generation}.{suffix}")
+
+    def read(self, symbol: str, interval: str) -> Optional[TimeSeries]:
+        """Return the stored series as read-only memmap views, or None if nothing is stored"""
+        path = self._dir(symbol, interval)
+        key = (symbol.upper(), interval)
+        manifest = self._manifest(path)
+        while manifest is not None:
+            generation, count = manifest["generation"], manifest["count"]
+            with self._views_lock:
+                cached = self._views.get(key)
+            if cached is not None and cached[0] == generation and cached[1] == count:
+                return cached[2]
+            try:
+                series = self._open(path, manifest)
+            except FileNotFoundError:
+                # A rewrite unlinked this generation after we loaded its manifest;
+                # retry with the one that replaced it
+                latest = self._manifest(path)
+                if latest is not None and latest["generation"] == generation:
+                    raise
+                manifest = latest
+                continue
+            with self._views_lock:
+                self._views[key] = (generation, count, series)
+            return series
+        return None
+
+    def _open(self, path: str, manifest: Dict[str, Any]) -> TimeSeries:
+        generation, count = manifest["generation"], manifest["count"]
+        timestamps = self._map(self._file(path, "timestamps", generation, "i8"), np.int64, count)
+        columns = {
+            name: self._map(self._file(path, name, generation, "f8"), np.float64, count)
+            for name in manifest["fields"]
+        }
+        return TimeSeries(timestamps, columns, manifest["metadata"], manifest["series_key"], manifest["labels"])
+
+    @staticmethod
+    def _map(path: str, dtype, count: int) -> np.ndarray:
+        if count == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r", shape=(count,))
+
+    def has_full_history(self, symbol: str, interval: str) -> bool:
+        """Whether a full-history (`outputsize=full`) response has been written for the key"""
+        manifest = self._manifest(self._dir(symbol, interval))
+        return bool(manifest and manifest["count"] and manifest.get("full"))
+
+    def write(self, symbol: str, interval: str, series: TimeSeries, full: bool = False) -> int:
+        """Merge `series` into the stored copy and return how many bars were added or changed.
+
+        `full` marks `series` as the complete history rather than a recent window.
+        The stored copy stays complete only while each window overlaps it;
+        one that leaves a gap clears the flag until the next full write.
+        """
+        if not self.writable or not len(series):
+            return 0
+        with self._lock:
+            path = self._dir(symbol, interval)
+            os.makedirs(path, exist_ok=True)
+            manifest = self._manifest(path)
+            if manifest is None or manifest["count"] == 0 or list(series.columns) != manifest["fields"]:
+                self._rewrite(path, manifest, series, full)
+                return len(series)
+            stored = self.read(symbol, interval)
+            last = stored.timestamps[-1]
+            if not full:
+                # A window that doesn't reach the stored bars leaves a gap between them
+                overlaps = bool(series.timestamps[0] <= last and series.timestamps[-1] >= stored.timestamps[0])
+                full = manifest.get("full", False) and overlaps
+            merged, revised = merge_series(stored, series)
+            new = len(merged) - len(stored)
+            if len(revised) or merged.timestamps[len(stored) - 1] != last:
+                # Changed or inserted bars can't be appended; publish a new generation
+                self._rewrite(path, manifest, merged, full)
+                return new + len(revised)
+            if new or full != manifest.get("full", False):
+                self._append(path, dict(manifest, full=full), merged, len(stored))
+            return new
+
+    def _append(self, path: str, manifest: Dict[str, Any], merged: TimeSeries, start: int):
+        generation, count = manifest["generation"], manifest["count"]
+        arrays = [("timestamps", "i8", merged.timestamps)] + [(name, "f8", merged.columns[name]) for name in manifest["fields"]]
+        for name, suffix, array in arrays:
+            with open(self._file(path, name, generation, suffix), "r+b") as f:
+                # Drop bytes a crashed append may have left past the published count
+                f.truncate(count * array.itemsize)
+                f.seek(0, os.SEEK_END)
+                f.write(np.ascontiguousarray(array[start:]).tobytes())
+        self._publish(path, dict(manifest, count=len(merged), metadata=merged.metadata))
+        self.appended_bars += len(merged) - start
+
+    def _rewrite(self, path: str, manifest: Optional[Dict[str, Any]], series: TimeSeries, full: bool):
+        old = manifest["generation"] if manifest else None
+        generation = old + 1 if old is not None else 0
+        fields = list(series.columns)
+        with open(self._file(path, "timestamps", generation, "i8"), "wb") as f:
+            f.write(np.ascontiguousarray(series.timestamps, dtype=np.int64).tobytes())
+        for name in fields:
+            with open(self._file(path, name, generation, "f8"), "wb") as f:
+                f.write(np.ascontiguousarray(series.columns[name], dtype=np.float64).tobytes())
+        self._publish(path, {
+            "generation": generation,
+            "count": len(series),
+            "fields": fields,
+            "labels": series.labels,
+            "series_key": series.series_key,
+            "metadata": series.metadata,
+            "full": full,
+        })
+        self.rewrites += 1
+        if old is not None:
+            for name in ["timestamps"] + manifest["fields"]:
+                suffix = "i8" if name == "timestamps" else "f8"
+                try:
+                    # Readers still mapping the old generation keep their pages
+                    os.unlink(self._file(path, name, old, suffix))
+                except OSError:
+                    pass
+
+    def _publish(self, path: str, manifest: Dict[str, Any]):
+        tmp = os.path.join(path, self.MANIFEST + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, os.path.join(path, self.MANIFEST))
+
+    def entries(self) -> List[Tuple[str, str]]:
+        """(symbol, interval) pairs present in the store"""
+        found = []
+        for symbol in sorted(os.listdir(self.root)):
+            symbol_dir = os.path.join(self.root, symbol)
+            if not os.path.isdir(symbol_dir):
+                continue
+            for interval in sorted(os.listdir(symbol_dir)):
+                if os.path.exists(os.path.join(symbol_dir, interval, self.MANIFEST)):
+                    found.append((symbol, interval))
+        return found
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "writable": self.writable,
+            "open_views": len(self._views),
+            "appended_bars": self.appended_bars,
+            "rewrites": self.rewrites,
+        }
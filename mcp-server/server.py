@@ -1,3 +1,6 @@
+import json
+import sys
+
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
@@ -6,7 +9,9 @@ from mcp.types import TextContent, ServerCapabilities
 from config import Config
 from alpha_vantage_client import AlphaVantageClient
 from openai_client import OpenAIClient
+from prefetch import PrefetchScheduler
 from tools import ToolHandler
+from transport import HttpTransport, RecordingTransport, ReplayTransport
 
 
 class FinancialMCPServer:
@@ -20,7 +25,31 @@ class FinancialMCPServer:
     
     def setup_clients(self):
         """Initialize API clients"""
-        self.av_client = AlphaVantageClient(self.config.alpha_vantage_api_key)
+        self.av_client = AlphaVantageClient(
+            api_key=self.config.alpha_vantage_api_key,
+            pool_size=self.config.av_pool_size,
+            keepalive_timeout=self.config.av_keepalive_timeout,
+            dns_cache_ttl=self.config.av_dns_cache_ttl,
+            request_timeout=self.config.av_request_timeout,
+            connect_timeout=self.config.av_connect_timeout,
+            requests_per_minute=self.config.av_requests_per_minute,
+            requests_per_day=self.config.av_requests_per_day,
+            background_share=self.config.av_background_share,
+            cache_max_bytes=self.config.av_cache_max_bytes,
+            cache_path=self.config.av_cache_path,
+            series_store_path=self.config.av_series_store_path,
+            stale_while_revalidate=self.config.av_stale_while_revalidate,
+            stale_grace=self.config.av_stale_grace,
+            max_retries=self.config.av_max_retries,
+            retry_base_delay=self.config.av_retry_base_delay,
+            breaker_failure_threshold=self.config.av_breaker_failure_threshold,
+            breaker_reset_timeout=self.config.av_breaker_reset_timeout,
+            series_datatype=self.config.av_series_datatype,
+            bulk_quotes=self.config.av_bulk_quotes,
+            quote_batch_window=self.config.av_quote_batch_window,
+            transport=self.build_transport(),
+            calendar_reconcile_interval=self.config.av_calendar_reconcile_interval
+        )
         self.openai_client = OpenAIClient(
             api_key=self.config.openai_api_key,
             model=self.config.openai_model,
@@ -28,6 +57,44 @@ class FinancialMCPServer:
             temperature=self.config.temperature
         )
         self.tool_handler = ToolHandler(self.av_client, self.openai_client)
+        self.prefetcher = PrefetchScheduler(
+            self.tool_handler,
+            watchlist=self.config.watchlist,
+            tools=self.config.prefetch_tools,
+            interval=self.config.prefetch_interval,
+            pre_open_lead=self.config.prefetch_pre_open_lead,
+            concurrency=self.config.prefetch_concurrency,
+            calendar=self.av_client.calendar
+        )
+    
+    def build_transport(self):
+        """Build the Alpha Vantage transport selected by AV_TRANSPORT (http, record or replay)"""
+        mode = self.config.av_transport
+        if mode == "replay":
+            return ReplayTransport(
+                fixture_dir=self.config.av_fixture_dir,
+                latency=self.config.av_replay_latency,
+                jitter=self.config.av_replay_jitter,
+                throttle_rate=self.config.av_replay_throttle_rate,
+                seed=self.config.av_replay_seed
+            )
+        http = HttpTransport(
+            base_url=self.config.av_base_url or AlphaVantageClient.BASE_URL,
+            pool_size=self.config.av_pool_size,
+            keepalive_timeout=self.config.av_keepalive_timeout,
+            dns_cache_ttl=self.config.av_dns_cache_ttl,
+            request_timeout=self.config.av_request_timeout,
+            connect_timeout=self.config.av_connect_timeout
+        )
+        if mode == "record":
+            return RecordingTransport(http, self.config.av_fixture_dir)
+        if mode != "http":
+            raise ValueError(f"Unknown AV_TRANSPORT {mode!r}; expected http, record or replay")
+        return http
+    
+    def stats(self):
+        """Return tool handler, client and prefetch counters"""
+        return {**self.tool_handler.stats(), "prefetch": self.prefetcher.stats()}
     
     def setup_handlers(self):
         """Setup MCP server handlers"""
@@ -43,15 +110,23 @@ class FinancialMCPServer:
     
     async def run(self):
         """Run the MCP server"""
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="financial-assistant",
-                    server_version="1.0.0",
-                    capabilities=ServerCapabilities(
-                        tools=None
+        await self.av_client.start()
+        self.prefetcher.start()
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    InitializationOptions(
+                        server_name="financial-assistant",
+                        server_version="1.0.0",
+                        capabilities=ServerCapabilities(
+                            tools=None
+                        ),
                     ),
-                ),
-            )
+                )
+        finally:
+            await self.prefetcher.stop()
+            # stdout carries the MCP session, so the final counters go to stderr
+            print(json.dumps(self.stats(), default=str), file=sys.stderr)
+            await self.av_client.close()
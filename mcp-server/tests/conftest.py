@@ -0,0 +1,47 @@
+import json
+import os
+import sys
+
+import pytest
+
+# The server's modules are flat files in mcp-server/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from alpha_vantage_client import AlphaVantageClient  # noqa: E402
+from transport import ReplayTransport, write_fixture  # noqa: E402
+
+
+class FakeOpenAI:
+    """Stands in for OpenAIClient; ToolHandler only registers functions with it"""
+
+    def __init__(self):
+        self.functions = {}
+
+    def register_function(self, name, function, description, parameters):
+        self.functions[name] = function
+
+
+@pytest.fixture
+def fixtures(tmp_path):
+    """Record a canned upstream response: fixtures(params, body)"""
+    directory = tmp_path / "fixtures"
+    directory.mkdir()
+
+    def record(params, body):
+        if not isinstance(body, bytes):
+            body = (body if isinstance(body, str) else json.dumps(body)).encode()
+        write_fixture(str(directory), params, 200, body)
+
+    record.dir = str(directory)
+    return record
+
+
+@pytest.fixture
+def make_client(fixtures):
+    """AlphaVantageClient replaying `fixtures`, with no rate limits, disk cache or series store"""
+    def make(**options):
+        settings = dict(requests_per_minute=0, requests_per_day=0, cache_path=None,
+                        series_store_path=None, calendar_reconcile_interval=0)
+        settings.update(options)
+        return AlphaVantageClient("test", transport=ReplayTransport(fixtures.dir), **settings)
+    return make
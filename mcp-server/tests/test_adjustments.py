@@ -0,0 +1,69 @@
+import asyncio
+
+import adjustments
+from adjustments import AdjustmentEngine, _remember
+
+
+def daily_body(days, close):
+    rows = {day: {"1. open": str(close), "2. high": str(close), "3. low": str(close), "4. close": str(close),
+                  "5. volume": "1000"} for day in reversed(days)}
+    return {"Meta Data": {"2. Symbol": "IBM"}, "Time Series (Daily)": rows}
+
+
+def intraday_body(bars):
+    rows = {stamp: {"1. open": str(close), "2. high": str(close), "3. low": str(close), "4. close": str(close),
+                    "5. volume": "100"} for stamp, close in reversed(bars)}
+    return {"Meta Data": {"2. Symbol": "IBM", "4. Interval": "60min"}, "Time Series (60min)": rows}
+
+
+def record_ibm(fixtures):
+    """IBM split 2-for-1 on 2024-06-13, with raw intraday bars either side of it"""
+    fixtures({"function": "TIME_SERIES_DAILY", "symbol": "IBM", "outputsize": "full"},
+             daily_body(["2024-06-10", "2024-06-11", "2024-06-12"], 100.0))
+    fixtures({"function": "CORPORATE_ACTION_SPLITS", "symbol": "IBM"},
+             {"data": [{"effective_date": "2024-06-13", "split_factor": "2.0"}]})
+    fixtures({"function": "CORPORATE_ACTION_DIVIDENDS", "symbol": "IBM"}, {"data": []})
+    # Only the raw request is recorded; asking for the default adjusted bars would find no fixture
+    fixtures({"function": "TIME_SERIES_INTRADAY", "symbol": "IBM", "interval": "60min", "outputsize": "full",
+              "adjusted": "false"},
+             intraday_body([("2024-06-12 15:00:00", 100.0), ("2024-06-13 10:00:00", 50.0)]))
+
+
+def test_intraday_bars_are_adjusted_once_from_raw_bars(fixtures, make_client):
+    record_ibm(fixtures)
+    client = make_client()
+    engine = AdjustmentEngine(client)
+
+    async def run():
+        series = await engine.adjusted_series("IBM", "60min")
+        await client.close()
+        return series
+
+    series = asyncio.run(run())
+    assert list(series["close"]) == [50.0, 50.0]
+    assert list(series["volume"]) == [200.0, 100.0]
+
+
+def test_remember_keeps_the_most_recently_used_entries():
+    entries = {}
+    for key in "abc":
+        _remember(entries, key, key.upper(), 2)
+    assert list(entries) == ["b", "c"]
+    _remember(entries, "b", "B", 2)
+    _remember(entries, "d", "D", 2)
+    assert list(entries) == ["b", "d"]
+
+
+def test_factor_cache_is_bounded(fixtures, make_client, monkeypatch):
+    monkeypatch.setattr(adjustments, "FACTOR_ENTRIES", 1)
+    record_ibm(fixtures)
+    client = make_client()
+    engine = AdjustmentEngine(client)
+    engine._factors["OLD"] = (0, None)
+
+    async def run():
+        await engine.adjusted_series("IBM", "daily")
+        await client.close()
+
+    asyncio.run(run())
+    assert list(engine._factors) == ["IBM"]
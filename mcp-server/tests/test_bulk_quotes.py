@@ -0,0 +1,35 @@
+import asyncio
+import json
+
+from conftest import FakeOpenAI
+from tools import ToolHandler
+
+
+def bulk_body(symbols):
+    return {"data": [{"symbol": symbol, "open": "1", "high": "2", "low": "0.5", "close": "1.5",
+                      "volume": "100", "timestamp": "2024-06-21 16:00:00"} for symbol in symbols]}
+
+
+def test_bulk_tool_not_offered_without_bulk_access(make_client):
+    handler = ToolHandler(make_client(bulk_quotes=False), FakeOpenAI())
+    assert "get_bulk_quotes" not in handler._tool_map
+    assert "get_bulk_quotes" not in {tool.name for tool in handler.get_tool_definitions()}
+
+
+def test_bulk_tool_spends_one_call(fixtures, make_client):
+    symbols = ["AAPL", "IBM", "MSFT"]
+    fixtures({"function": "REALTIME_BULK_QUOTES", "symbol": ",".join(symbols)}, bulk_body(symbols))
+    client = make_client(bulk_quotes=True)
+    handler = ToolHandler(client, FakeOpenAI())
+    result = json.loads(asyncio.run(handler.handle_tool_call("get_bulk_quotes", {"symbols": ["msft", "aapl", "ibm"]})))
+    assert {symbol: result[symbol]["Global Quote"]["01. symbol"] for symbol in symbols} == dict(zip(symbols, symbols))
+    assert client.transport.served == 1
+
+
+def test_bulk_tool_refuses_after_bulk_access_is_lost(make_client):
+    client = make_client(bulk_quotes=True)
+    handler = ToolHandler(client, FakeOpenAI())
+    client.bulk_quotes = False
+    result = json.loads(asyncio.run(handler.handle_tool_call("get_bulk_quotes", {"symbols": ["AAPL", "IBM"]})))
+    assert "error" in result
+    assert client.transport.served == 0
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from alpha_vantage_client import AlphaVantageClient, AlphaVantageHTTPError
+from circuit_breaker import CircuitBreaker, CircuitOpenError
+from transport import BufferedResponse, ReplayTransport
+
+COOL_OFF = 0.05
+
+
+class FlakyTransport(ReplayTransport):
+    """Replays fixtures, or answers 503 while `down`"""
+
+    down = False
+
+    async def respond(self, params):
+        if self.down:
+            return BufferedResponse(503, b"")
+        return await super().respond(params)
+
+
+@pytest.fixture
+def client(fixtures):
+    for symbol in ("A", "B", "C", "D", "E", "F"):
+        fixtures({"function": "GLOBAL_QUOTE", "symbol": symbol}, {"Global Quote": {"01. symbol": symbol}})
+    return AlphaVantageClient("test", transport=FlakyTransport(fixtures.dir), requests_per_minute=0,
+                              requests_per_day=0, max_retries=0, breaker_failure_threshold=2,
+                              breaker_reset_timeout=COOL_OFF, calendar_reconcile_interval=0)
+
+
+def test_trip_fail_fast_probe_reopen_and_close(client):
+    breaker = client.breaker
+
+    async def run():
+        client.transport.down = True
+        for symbol in ("A", "B"):
+            with pytest.raises(AlphaVantageHTTPError):
+                await client.get_stock_quote(symbol)
+        assert breaker.state == CircuitBreaker.OPEN and breaker.trips == 1
+        served = client.transport.served
+        with pytest.raises(CircuitOpenError):
+            await client.get_stock_quote("C")
+        assert breaker.rejected == 1
+        # A failed half-open probe reopens the circuit for another cool-off
+        await asyncio.sleep(COOL_OFF)
+        with pytest.raises(AlphaVantageHTTPError):
+            await client.get_stock_quote("C")
+        assert breaker.state == CircuitBreaker.OPEN and breaker.trips == 2
+        # A successful probe closes it
+        client.transport.down = False
+        await asyncio.sleep(COOL_OFF)
+        quote = await client.get_stock_quote("D")
+        assert quote["Global Quote"]["01. symbol"] == "D"
+        assert breaker.state == CircuitBreaker.CLOSED and breaker.failures == 0
+        assert client.transport.served == served + 1
+        await client.close()
+
+    asyncio.run(run())
+
+
+def test_a_cancelled_probe_leaves_the_circuit_half_open(client):
+    breaker = client.breaker
+
+    async def run():
+        client.transport.down = True
+        for symbol in ("A", "B"):
+            with pytest.raises(AlphaVantageHTTPError):
+                await client.get_stock_quote(symbol)
+        await asyncio.sleep(COOL_OFF)
+        client.transport.down = False
+        client.transport.latency = 10.0
+        probe = asyncio.ensure_future(client.get_stock_quote("E"))
+        await asyncio.sleep(0.01)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        # Callers are shielded from the shared upstream call, so cancel that call itself, as shutdown would
+        (load,) = client._inflight._inflight.values()
+        load.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+        # No upstream answer was seen: still half-open, and the next call may probe
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        client.transport.latency = 0.0
+        await client.get_stock_quote("F")
+        assert breaker.state == CircuitBreaker.CLOSED
+        await client.close()
+
+    asyncio.run(run())
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from directional import adx, aroon, dx, wilder_sums
+
+
+def talib_adx(high, low, close, period):
+    """TA-Lib's TA_ADX loop, transcribed bar by bar as a reference: (DX, ADX)"""
+    n = len(close)
+    dx_out, adx_out = np.full(n, np.nan), np.full(n, np.nan)
+    prev_high, prev_low, prev_close = high[0], low[0], close[0]
+    plus_dm = minus_dm = tr = 0.0
+    dx_sum = adx_value = 0.0
+    for today in range(1, n):
+        diff_p, diff_m = high[today] - prev_high, prev_low - low[today]
+        prev_high, prev_low = high[today], low[today]
+        if today >= period:
+            plus_dm -= plus_dm / period
+            minus_dm -= minus_dm / period
+            tr -= tr / period
+        if diff_m > 0 and diff_p < diff_m:
+            minus_dm += diff_m
+        elif diff_p > 0 and diff_p > diff_m:
+            plus_dm += diff_p
+        tr += max(high[today], prev_close) - min(low[today], prev_close)
+        prev_close = close[today]
+        if today < period or tr == 0:
+            continue
+        plus_di, minus_di = 100.0 * plus_dm / tr, 100.0 * minus_dm / tr
+        if plus_di + minus_di == 0:
+            continue
+        dx_out[today] = 100.0 * abs(minus_di - plus_di) / (plus_di + minus_di)
+        if today < 2 * period - 1:
+            dx_sum += dx_out[today]
+        elif today == 2 * period - 1:
+            adx_value = (dx_sum + dx_out[today]) / period
+        else:
+            adx_value = (adx_value * (period - 1) + dx_out[today]) / period
+        if today >= 2 * period - 1:
+            adx_out[today] = adx_value
+    return dx_out, adx_out
+
+
+def random_bars(n=120, seed=3):
+    rng = np.random.default_rng(seed)
+    close = 50.0 + np.cumsum(rng.normal(0, 1, n))
+    return {"high": close + rng.uniform(0.1, 1.5, n), "low": close - rng.uniform(0.1, 1.5, n), "close": close}
+
+
+@pytest.mark.parametrize("period", [2, 5, 14])
+def test_adx_matches_the_talib_loop(period):
+    bars = random_bars()
+    expected_dx, expected_adx = talib_adx(bars["high"], bars["low"], bars["close"], period)
+    scratch = {}
+    out_dx, out_adx = dx(bars, scratch, period), adx(bars, scratch, period)
+    assert np.isnan(out_adx[:2 * period - 1]).all()
+    np.testing.assert_allclose(out_adx[2 * period - 1:], expected_adx[2 * period - 1:], rtol=1e-10)
+    np.testing.assert_allclose(out_dx[period:], expected_dx[period:], rtol=1e-10)
+
+
+def test_wilder_sums_are_seeded_with_period_minus_one_values():
+    x = np.array([np.nan, 1.0, 2.0, 3.0, 4.0])
+    (out,) = wilder_sums(3, x)
+    assert np.isnan(out[:2]).all()
+    # Seed 1 + 2 on bar 2, then S - S/3 + x
+    assert out[2] == 3.0
+    assert out[3] == pytest.approx(3.0 - 1.0 + 3.0)
+    assert out[4] == pytest.approx(5.0 - 5.0 / 3 + 4.0)
+
+
+def test_aroon_ties_go_to_the_most_recent_bar():
+    bars = {"high": np.array([1.0, 3.0, 3.0, 2.0]), "low": np.array([0.0, 0.0, 1.0, 1.0])}
+    down, up = aroon(bars, None, 2)
+    # Window of bars 1-3: the high of 3 was last made 1 bar ago, the low of 0 2 bars ago
+    assert up[3] == 50.0
+    assert down[3] == 0.0
@@ -0,0 +1,68 @@
+import asyncio
+
+import numpy as np
+
+from indicator_engine import IndicatorEngine
+from timeseries import TimeSeries
+
+DAY = 86400
+
+
+def bars(n=60, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0, 1, n))
+    high = close + rng.uniform(0.1, 2.0, n)
+    low = close - rng.uniform(0.1, 2.0, n)
+    columns = {"open": close.copy(), "high": high, "low": low, "close": close, "volume": rng.uniform(1e5, 1e6, n)}
+    timestamps = np.arange(n, dtype=np.int64) * DAY + 19723 * DAY
+    return TimeSeries(timestamps, columns, {}, "Time Series (Daily)")
+
+
+class Engine(IndicatorEngine):
+    """IndicatorEngine over a fixed bar series instead of the client's cache"""
+
+    def __init__(self, series):
+        super().__init__(None)
+        self.series = series
+
+    async def base_series(self, symbol, interval):
+        return self.series
+
+
+def latest(engine, function, **params):
+    series = asyncio.run(engine.compute(function, "IBM", "daily", **params))
+    return {name: float(column[-1]) for name, column in series.columns.items()}
+
+
+def test_related_indicators_share_intermediates():
+    engine = Engine(bars())
+    latest(engine, "ADX", time_period=14)
+    latest(engine, "PLUS_DI", time_period=14)
+    latest(engine, "ATR", time_period=14)
+    assert engine.stats()["scratch_reuses"] == 2
+
+
+def test_an_updated_last_bar_is_recomputed():
+    series = bars()
+    engine = Engine(series)
+    before = {function: latest(engine, function, time_period=14) for function in ("ADX", "ATR", "MFI")}
+    # The session's last bar trades on: same object, same timestamp, new values
+    series["high"][-1] += 5.0
+    series["close"][-1] += 4.0
+    series["volume"][-1] *= 2.0
+    fresh = Engine(bars())
+    fresh.series["high"][-1] += 5.0
+    fresh.series["close"][-1] += 4.0
+    fresh.series["volume"][-1] *= 2.0
+    for function, old in before.items():
+        after = latest(engine, function, time_period=14)
+        assert after != old
+        assert after == latest(fresh, function, time_period=14)
+
+
+def test_a_new_bars_object_starts_a_new_scratch():
+    engine = Engine(bars())
+    latest(engine, "ATR", time_period=14)
+    engine.series = bars()
+    latest(engine, "ATR", time_period=14)
+    assert engine.stats()["scratch_reuses"] == 0
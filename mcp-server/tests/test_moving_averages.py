@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from moving_averages import KAMA_FAST, MAMA_LOOKBACK, T3_VFACTOR, ema, kama, mama, moving_average, sma, t3, wma
+
+# Expected values follow TA-Lib's definitions (which Alpha Vantage runs):
+# outputs start once an average is fully seeded, and recursive averages
+# are seeded from a simple average of their first values.
+
+
+def valid_from(x):
+    return int(np.flatnonzero(~np.isnan(x))[0])
+
+
+def test_sma_starts_on_the_first_full_window():
+    out = sma(np.array([1.0, 2.0, 3.0, 4.0, 5.0]), 3)
+    assert np.isnan(out[:2]).all()
+    assert list(out[2:]) == [2.0, 3.0, 4.0]
+
+
+def test_ema_is_seeded_with_the_sma():
+    out = ema(np.array([1.0, 2.0, 3.0, 10.0]), 3)
+    assert np.isnan(out[:2]).all()
+    # Seed (1+2+3)/3, then k = 2/(3+1)
+    assert list(out[2:]) == [2.0, 6.0]
+
+
+def test_ema_skips_leading_nans_like_a_cascaded_average():
+    out = ema(np.array([np.nan, np.nan, 1.0, 2.0, 3.0, 10.0]), 3)
+    assert valid_from(out) == 4
+    assert list(out[4:]) == [2.0, 6.0]
+
+
+def test_wma_weights_the_newest_bar_most():
+    out = wma(np.array([1.0, 2.0, 6.0]), 3)
+    assert out[2] == pytest.approx((1 + 4 + 18) / 6)
+
+
+def test_kama_is_seeded_with_the_previous_price():
+    out = kama(np.array([1.0, 2.0, 3.0, 4.0]), 2)
+    assert valid_from(out) == 2
+    # A straight line is perfectly efficient, so each step uses the fast constant squared
+    c = KAMA_FAST ** 2
+    first = 2.0 + c * (3.0 - 2.0)
+    assert out[2] == pytest.approx(first)
+    assert out[3] == pytest.approx(first + c * (4.0 - first))
+
+
+def test_kama_on_a_flat_series_stays_flat():
+    out = kama(np.full(10, 7.0), 3)
+    assert (out[3:] == 7.0).all()
+
+
+def test_t3_lookback_and_seeding():
+    period = 3
+    x = np.arange(40, dtype=np.float64)
+    out = t3(x, period)
+    assert valid_from(out) == 6 * (period - 1)
+    # SMA-seeded EMAs of a straight line lag it by exactly (period-1)/2 each
+    # from their first value, so T3 trails it by a fixed weighted sum of lags
+    a = T3_VFACTOR
+    weights = {6: -a ** 3, 5: 3 * a ** 2 + 3 * a ** 3, 4: -6 * a ** 2 - 3 * a - 3 * a ** 3,
+               3: 1 + 3 * a + a ** 3 + 3 * a ** 2}
+    lag = sum(weight * depth for depth, weight in weights.items()) * (period - 1) / 2
+    np.testing.assert_allclose(out[valid_from(out):], x[valid_from(out):] - lag, rtol=0, atol=1e-9)
+
+
+def test_mama_starts_after_its_lookback_and_warms_up_from_zero():
+    price = np.full(80, 5.0)
+    out_mama, out_fama = mama(price)
+    assert valid_from(out_mama) == valid_from(out_fama) == MAMA_LOOKBACK
+    # Both averages start from 0 twelve bars in, so the first outputs are still just below the price
+    assert 4.99 < out_mama[MAMA_LOOKBACK] < 5.0
+    assert out_fama[MAMA_LOOKBACK] < out_mama[MAMA_LOOKBACK]
+    assert out_mama[-1] == pytest.approx(5.0) and out_fama[-1] == pytest.approx(5.0, abs=1e-6)
+
+
+def test_moving_average_seeded_for_a_later_start():
+    x = np.array([1.0, 2.0, 3.0, 10.0, 4.0])
+    # Asked to start at index 3, an EMA(3) is seeded on bars 1-3 instead of 0-2
+    out = moving_average(x, 3, matype=1, start=3)
+    assert valid_from(out) == 3
+    assert out[3] == pytest.approx(5.0)
+    assert out[4] == pytest.approx(4.5)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from moving_averages import ema, ma_lookback, moving_average
+from oscillators import apo, cmo, ppo, roc, rsi, stochf, willr
+
+# Wilder's RSI worked example (period 14) as published by StockCharts; TA-Lib
+# seeds the averages the same way, with the mean of the first 14 changes
+WILDER_CLOSES = np.array([
+    44.3389, 44.0902, 44.1497, 43.6124, 44.3278, 44.8264, 45.0955, 45.4245, 45.8433, 46.0826,
+    45.8931, 46.0328, 45.6140, 46.2820, 46.2820, 46.0028, 46.0328, 46.4116, 46.2222, 45.6439,
+    46.2122, 46.2521, 45.7137, 46.4515, 45.7835, 45.3548, 44.0288, 44.1783, 44.2181, 44.5672,
+    43.4205, 42.6628, 43.1314,
+])
+WILDER_RSI = [
+    70.53, 66.32, 66.55, 69.41, 66.36, 57.97, 62.93, 63.26, 56.06, 62.38,
+    54.71, 50.42, 39.99, 41.46, 41.87, 45.46, 37.30, 33.08, 37.77,
+]
+
+
+def test_rsi_matches_wilders_worked_example():
+    out = rsi(WILDER_CLOSES, 14)
+    assert np.isnan(out[:14]).all()
+    assert list(np.round(out[14:], 2)) == WILDER_RSI
+
+
+def test_rsi_and_cmo_of_a_flat_series_are_zero():
+    flat = np.full(20, 10.0)
+    assert (rsi(flat, 14)[14:] == 0.0).all()
+    assert (cmo(flat, 14)[14:] == 0.0).all()
+
+
+def test_cmo_is_rsi_rescaled():
+    # Both come from the same Wilder-smoothed gains, so CMO = 2 * RSI - 100
+    np.testing.assert_allclose(cmo(WILDER_CLOSES, 14)[14:], 2 * rsi(WILDER_CLOSES, 14)[14:] - 100, atol=1e-9)
+
+
+def test_roc_is_zero_where_the_earlier_price_is_zero():
+    out = roc(np.array([0.0, 2.0, 3.0]), 1)
+    assert np.isnan(out[0])
+    assert list(out[1:]) == [0.0, 50.0]
+
+
+def test_fast_stochastic_and_williams_r():
+    high = np.array([10.0, 12.0, 11.0, 13.0])
+    low = np.array([8.0, 9.0, 9.0, 10.0])
+    close = np.array([9.0, 11.0, 10.0, 12.5])
+    k, d = stochf(high, low, close, 3, 2)
+    # Bar 2: 3-bar range 8-12, close 10; bar 3: range 9-13, close 12.5
+    assert k[2] == pytest.approx(50.0)
+    assert k[3] == pytest.approx(87.5)
+    assert d[3] == pytest.approx(68.75)
+    assert list(willr(high, low, close, 3)[2:]) == pytest.approx([-50.0, -12.5])
+
+
+@pytest.mark.parametrize("matype", [1, 3, 4, 6, 7])
+def test_apo_and_ppo_run_each_average_from_the_first_bar(matype):
+    x = 100 + np.cumsum(np.random.default_rng(7).normal(size=120))
+    fast, slow = moving_average(x, 12, matype), moving_average(x, 26, matype)
+    lookback = ma_lookback(26, matype)
+    out = apo(x, 12, 26, matype)
+    assert np.isnan(out[:lookback]).all()
+    np.testing.assert_allclose(out[lookback:], (fast - slow)[lookback:], rtol=1e-12)
+    np.testing.assert_allclose(ppo(x, 26, 12, matype)[lookback:], (100 * (fast - slow) / slow)[lookback:], rtol=1e-12)
+
+
+def test_exponential_apo_is_the_difference_of_two_emas():
+    x = 100 + np.cumsum(np.random.default_rng(11).normal(size=60))
+    out = apo(x, 12, 26, 1)
+    np.testing.assert_allclose(out[25:], (ema(x, 12) - ema(x, 26))[25:], rtol=1e-12)
@@ -0,0 +1,43 @@
+import asyncio
+
+import numpy as np
+
+from conftest import FakeOpenAI
+from planner import quote_from_daily
+from timeseries import TimeSeries, parse_timestamp
+from tools import ToolHandler
+
+
+def daily(closes):
+    n = len(closes)
+    close = np.array(closes, dtype=np.float64)
+    timestamps = np.array([parse_timestamp(f"2024-06-{10 + i:02d}") for i in range(n)], dtype=np.int64)
+    columns = {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": np.full(n, 1000.0)}
+    return TimeSeries(timestamps, columns, {}, "Time Series (Daily)")
+
+
+def test_quote_from_the_last_two_daily_bars():
+    quote = quote_from_daily("IBM", daily([100.0, 98.0, 102.0]))["Global Quote"]
+    assert quote["05. price"] == "102.0000"
+    assert quote["07. latest trading day"] == "2024-06-12"
+    assert quote["08. previous close"] == "98.0000"
+    assert quote["09. change"] == "4.0000"
+    assert quote["10. change percent"] == "4.0816%"
+
+
+def test_no_quote_without_a_usable_previous_close():
+    assert quote_from_daily("IBM", daily([102.0])) is None
+    assert quote_from_daily("IBM", daily([0.0, 102.0])) is None
+    assert quote_from_daily("IBM", daily([float("nan"), 102.0])) is None
+
+
+def test_handler_stats_include_the_planner_and_local_engines(fixtures, make_client):
+    fixtures({"function": "GLOBAL_QUOTE", "symbol": "IBM"}, {"Global Quote": {"01. symbol": "IBM"}})
+    handler = ToolHandler(make_client(), FakeOpenAI())
+    for _ in range(2):
+        asyncio.run(handler.handle_tool_call("get_stock_quote", {"symbol": "IBM"}))
+    stats = handler.stats()
+    assert stats["planner"] == {"hits": 1, "derives": 0, "misses": 1}
+    assert stats["cache"] == handler.av_client.cache.stats()
+    assert set(stats["indicators"]) >= {"computed", "unavailable"}
+    assert set(stats["adjustments"]) >= {"factor_builds", "hits"}
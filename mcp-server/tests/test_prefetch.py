@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from market_calendar import MarketCalendar
+from prefetch import PrefetchScheduler
+
+NEW_YORK = ZoneInfo("America/New_York")
+
+
+def at(*args):
+    return datetime(*args, tzinfo=NEW_YORK)
+
+
+def scheduler(**options):
+    return PrefetchScheduler(None, ["IBM"], ["get_stock_quote"], calendar=MarketCalendar(), **options)
+
+
+def simulate(prefetch, start, end):
+    """Times at which _loop would run passes between `start` and `end`"""
+    passes, now = [], start
+    while True:
+        now += timedelta(seconds=prefetch.seconds_until_next_run(now))
+        if now >= end:
+            return passes
+        warms = prefetch.pre_open_session(now)
+        if warms is not None:
+            prefetch._warmed_for = warms
+        passes.append(now)
+
+
+def test_pre_open_pass_waits_for_the_open_instead_of_spinning():
+    prefetch = scheduler(pre_open_lead=1800)
+    # Thursday 2024-06-13, 09:00: the pre-open pass has just run
+    now = at(2024, 6, 13, 9, 0)
+    assert prefetch.seconds_until_next_run(now) == 0
+    prefetch._warmed_for = prefetch.pre_open_session(now)
+    assert prefetch.seconds_until_next_run(now) == 1800
+
+
+def test_pre_open_pass_runs_every_day():
+    prefetch = scheduler(interval=300, pre_open_lead=1800)
+    # Starts with an intraday pass just before Wednesday's close
+    passes = simulate(prefetch, at(2024, 6, 12, 15, 58), at(2024, 6, 14, 9, 40))
+    pre_open = [when for when in passes if not prefetch.calendar.is_open(when) and when.hour < 12]
+    assert pre_open == [at(2024, 6, 13, 9, 0), at(2024, 6, 14, 9, 0)]
+    assert at(2024, 6, 13, 9, 30) in passes and at(2024, 6, 14, 9, 30) in passes
+
+
+def test_post_close_pass_does_not_count_as_warm_up():
+    prefetch = scheduler(pre_open_lead=1800)
+    assert prefetch.pre_open_session(at(2024, 6, 12, 16, 3)) is None
+    assert prefetch.pre_open_session(at(2024, 6, 13, 9, 10)) == at(2024, 6, 13, 9, 30)
+    assert prefetch.pre_open_session(at(2024, 6, 13, 10, 0)) is None
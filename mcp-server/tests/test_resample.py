@@ -0,0 +1,94 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from resample import to_calendar_period, to_intraday_interval
+from timeseries import TimeSeries, format_timestamp, parse_timestamp
+
+LABELS = ["1. open", "2. high", "3. low", "4. close", "5. volume"]
+
+
+def bars(stamps, key):
+    """Bars i = 0, 1, ... at `stamps` with open i, high i+1, low i-1, close i+0.5 and volume 100"""
+    n = len(stamps)
+    values = np.arange(n, dtype=np.float64)
+    columns = {"open": values, "high": values + 1, "low": values - 1, "close": values + 0.5,
+               "volume": np.full(n, 100.0)}
+    timestamps = np.array([parse_timestamp(stamp) for stamp in stamps], dtype=np.int64)
+    return TimeSeries(timestamps, columns, {}, key, LABELS)
+
+
+def test_weekly_bars_are_labelled_by_their_last_trading_day():
+    # Wed 2024-06-05 through Tue 2024-06-11
+    daily = bars(["2024-06-05", "2024-06-06", "2024-06-07", "2024-06-10", "2024-06-11"], "Time Series (Daily)")
+    weekly = to_calendar_period(daily, "weekly")
+    assert weekly.series_key == "Weekly Time Series"
+    assert [format_timestamp(t) for t in weekly.timestamps] == ["2024-06-07", "2024-06-11"]
+    assert list(weekly["open"]) == [0.0, 3.0]
+    assert list(weekly["high"]) == [3.0, 5.0]
+    assert list(weekly["low"]) == [-1.0, 2.0]
+    assert list(weekly["close"]) == [2.5, 4.5]
+    assert list(weekly["volume"]) == [300.0, 200.0]
+    assert weekly.info == {"derived_from": "daily"}
+
+
+def test_monthly_bars_split_on_calendar_months():
+    daily = bars(["2024-05-30", "2024-05-31", "2024-06-03"], "Time Series (Daily)")
+    monthly = to_calendar_period(daily, "monthly")
+    assert [format_timestamp(t) for t in monthly.timestamps] == ["2024-05-31", "2024-06-03"]
+    assert list(monthly["close"]) == [1.5, 2.5]
+    assert list(monthly["volume"]) == [200.0, 100.0]
+
+
+def test_intraday_bars_align_to_the_extended_session_start():
+    minutes = ["2024-06-14 09:28", "2024-06-14 09:29", "2024-06-14 09:30", "2024-06-14 09:31", "2024-06-14 09:34"]
+    series = bars(minutes, "Time Series (1min)")
+    series.metadata["4. Interval"] = "1min"
+    five = to_intraday_interval(series, 1, 5)
+    assert [format_timestamp(t) for t in five.timestamps] == ["2024-06-14 09:25:00", "2024-06-14 09:30:00"]
+    assert list(five["open"]) == [0.0, 2.0]
+    assert list(five["close"]) == [1.5, 4.5]
+    assert list(five["volume"]) == [200.0, 300.0]
+    assert five.series_key == "Time Series (5min)"
+    assert five.metadata["4. Interval"] == "5min"
+
+
+def test_intraday_drops_an_unfinished_trailing_bar():
+    series = bars(["2024-06-14 09:30", "2024-06-14 09:35", "2024-06-14 09:40"], "Time Series (5min)")
+    fifteen = to_intraday_interval(series, 5, 15, now=parse_timestamp("2024-06-14 09:44"))
+    assert len(fifteen) == 0
+    fifteen = to_intraday_interval(series, 5, 15, now=parse_timestamp("2024-06-14 09:45"))
+    assert len(fifteen) == 1 and fifteen["high"][0] == 3.0
+
+
+def intraday_payload(symbol, start, count):
+    """A TIME_SERIES_INTRADAY 1min response of `count` bars from `start`"""
+    rows = {}
+    for i in range(count):
+        stamp = (start + timedelta(minutes=i)).strftime("%Y-%m-%d %H:%M:%S")
+        rows[stamp] = {"1. open": str(i), "2. high": str(i + 1), "3. low": str(i - 1),
+                       "4. close": str(i + 0.5), "5. volume": "100"}
+    meta = {"1. Information": "Intraday (1min)", "2. Symbol": symbol, "4. Interval": "1min"}
+    return {"Meta Data": meta, "Time Series (1min)": dict(reversed(list(rows.items())))}
+
+
+def test_client_resamples_only_from_fresh_cached_finer_bars(fixtures, make_client):
+    params = {"function": "TIME_SERIES_INTRADAY", "symbol": "IBM", "interval": "1min", "outputsize": "full"}
+    fixtures(params, intraday_payload("IBM", datetime(2024, 6, 14, 9, 30), 35))
+    client = make_client()
+
+    async def run():
+        assert await client.resampled_intraday("IBM", "5min", "full") is None
+        await client.get_time_series_intraday("IBM", "1min", as_columns=True, outputsize="full")
+        full = await client.resampled_intraday("IBM", "5min", "full")
+        # 35 one-minute bars make seven five-minute bars, too few for a compact answer
+        compact = await client.resampled_intraday("IBM", "5min", "compact")
+        await client.close()
+        return full, compact
+
+    full, compact = asyncio.run(run())
+    assert len(full) == 7
+    assert format_timestamp(full.timestamps[0]) == "2024-06-14 09:30:00"
+    assert list(full["volume"]) == [500.0] * 7
+    assert compact is None
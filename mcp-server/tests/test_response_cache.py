@@ -0,0 +1,67 @@
+import asyncio
+import time
+
+from response_cache import ResponseCache
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_fresh_hit_is_counted_once():
+    cache = ResponseCache()
+    run(cache.set("k", "GLOBAL_QUOTE", {"v": 1}, ttl=60))
+    assert run(cache.get_or_stale("k", grace=30)) == ({"v": 1}, 0.0)
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["stale_hits"], stats["misses"]) == (1, 0, 0)
+
+
+def test_stale_hit_is_not_also_a_miss():
+    cache = ResponseCache()
+    run(cache.set("k", "GLOBAL_QUOTE", {"v": 1}, ttl=60))
+    value, expires_at = cache.memory.get("k")
+    cache.memory.set("k", value, time.time() - 5, 10)
+    value, overdue = run(cache.get_or_stale("k", grace=30))
+    assert value == {"v": 1} and 4 < overdue < 30
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["stale_hits"], stats["misses"]) == (0, 1, 0)
+
+
+def test_expired_past_grace_is_a_miss():
+    cache = ResponseCache()
+    cache.memory.set("k", {"v": 1}, time.time() - 60, 10)
+    assert run(cache.get_or_stale("k", grace=30)) is None
+    assert run(cache.get_or_stale("other", grace=30)) is None
+    stats = cache.stats()
+    assert (stats["stale_hits"], stats["misses"]) == (0, 2)
+
+
+def test_last_good_survives_expiry_purges_and_a_restart(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ResponseCache(path=path)
+    cache.PURGE_EVERY = 1
+    run(cache.set("expired", "GLOBAL_QUOTE", {"v": 1}, ttl=60))
+    cache.disk.set("expired", "GLOBAL_QUOTE", '{"v": 1}', time.time() - 3600)
+    # A response with no lifetime left is kept too, already expired
+    run(cache.set("zero", "GLOBAL_QUOTE", {"v": 2}, ttl=0))
+    assert run(cache.get("zero")) is None
+    cache.close()
+
+    restarted = ResponseCache(path=path)
+    assert run(restarted.get("expired")) is None
+    value, overdue = run(restarted.get_last_good("expired"))
+    assert value == {"v": 1} and overdue >= 3600
+    assert run(restarted.get_last_good("zero"))[0] == {"v": 2}
+    restarted.close()
+
+
+def test_purge_drops_only_rows_past_the_retention_window(tmp_path):
+    cache = ResponseCache(path=str(tmp_path / "cache.sqlite3"))
+    cache.PURGE_EVERY = 1
+    cache.disk.set("ancient", "GLOBAL_QUOTE", '{"v": 0}', time.time() - cache.LAST_GOOD_RETENTION - 60)
+    cache.disk.set("recent", "GLOBAL_QUOTE", '{"v": 1}', time.time() - 60)
+    run(cache.set("new", "GLOBAL_QUOTE", {"v": 2}, ttl=60))
+    assert cache.stats()["disk_evictions"] == 1
+    assert cache.disk.get("ancient") is None
+    assert run(cache.get_last_good("recent"))[0] == {"v": 1}
+    cache.close()
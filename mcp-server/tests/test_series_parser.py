@@ -0,0 +1,36 @@
+from bench_series_transport import synthetic_payloads
+from series_parser import parse_csv, parse_series, series_key_for
+
+
+def test_series_key_for_functions_and_intervals():
+    assert series_key_for({"function": "TIME_SERIES_DAILY"}) == "Time Series (Daily)"
+    assert series_key_for({"function": "TIME_SERIES_INTRADAY", "interval": "5min"}) == "Time Series (5min)"
+    assert series_key_for({"function": "TIME_SERIES_WEEKLY"}) == "Weekly Time Series"
+    assert series_key_for({"function": "FX_DAILY"}) == "Time Series FX (Daily)"
+    assert series_key_for({"function": "SMA", "interval": "daily"}) == "Technical Analysis: SMA"
+
+
+def test_csv_matches_json_rendering():
+    json_body, csv_body = synthetic_payloads(50)
+    from_json = parse_series(json_body)
+    from_csv = parse_csv(csv_body, series_key_for({"function": "TIME_SERIES_DAILY"}))
+    assert from_csv.series_key == from_json.series_key == "Time Series (Daily)"
+    assert from_csv.labels == from_json.labels
+    assert list(from_csv.columns) == list(from_json.columns)
+    assert (from_csv.timestamps == from_json.timestamps).all()
+    assert all((from_csv[name] == from_json[name]).all() for name in from_json.columns)
+
+
+def test_csv_underscore_headers_become_json_labels():
+    body = b"timestamp,open,high,low,close,adjusted_close,volume\n2024-06-21,1,2,0.5,1.5,1.4,100\n"
+    series = parse_csv(body, series_key_for({"function": "TIME_SERIES_DAILY_ADJUSTED"}))
+    assert series.labels[4] == "5. adjusted close"
+    assert "adjusted close" in series.columns
+
+
+def test_indicator_csv_labels_are_not_numbered():
+    body = b"time,SMA\n2024-06-21,10.5\n2024-06-20,10.0\n"
+    series = parse_csv(body, series_key_for({"function": "SMA"}))
+    assert series.series_key == "Technical Analysis: SMA"
+    assert series.labels == ["SMA"]
+    assert list(series["sma"]) == [10.0, 10.5]
@@ -0,0 +1,110 @@
+import threading
+
+import numpy as np
+import pytest
+
+from series_store import SeriesStore, fcntl
+from timeseries import TimeSeries, format_timestamp, parse_timestamp
+
+
+def daily(days, closes=None):
+    """Daily bars on `days` ("2024-01-02", ...) with closes 1, 2, ... unless given"""
+    n = len(days)
+    close = np.arange(1, n + 1, dtype=np.float64) if closes is None else np.array(closes, dtype=np.float64)
+    timestamps = np.array([parse_timestamp(day) for day in days], dtype=np.int64)
+    return TimeSeries(timestamps, {"close": close, "volume": np.full(n, 100.0)}, {}, "Time Series (Daily)",
+                      ["4. close", "5. volume"])
+
+
+def dates(series):
+    return [format_timestamp(t) for t in series.timestamps]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SeriesStore(str(tmp_path / "store"))
+    yield store
+    store.close()
+
+
+def test_new_bars_are_appended_in_place(store):
+    assert store.write("ibm", "daily", daily(["2024-01-02", "2024-01-03"]), full=True) == 2
+    assert store.write("IBM", "daily", daily(["2024-01-03", "2024-01-04"], [2.0, 3.0])) == 1
+    stored = store.read("IBM", "daily")
+    assert dates(stored) == ["2024-01-02", "2024-01-03", "2024-01-04"]
+    assert list(stored["close"]) == [1.0, 2.0, 3.0]
+    assert store.stats()["appended_bars"] == 1
+    assert store.stats()["rewrites"] == 1
+    assert store.has_full_history("IBM", "daily")
+
+
+def test_a_revised_bar_publishes_a_new_generation(store):
+    store.write("IBM", "daily", daily(["2024-01-02", "2024-01-03"]), full=True)
+    before = store.read("IBM", "daily")
+    assert store.write("IBM", "daily", daily(["2024-01-03", "2024-01-04"], [2.5, 3.0])) == 2
+    stored = store.read("IBM", "daily")
+    assert list(stored["close"]) == [1.0, 2.5, 3.0]
+    assert store.stats()["rewrites"] == 2
+    # A view mapped before the rewrite still reads the old generation
+    assert list(before["close"]) == [1.0, 2.0]
+    assert store.has_full_history("IBM", "daily")
+
+
+def test_a_window_past_the_stored_bars_clears_full_history(store):
+    store.write("IBM", "daily", daily(["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"]), full=True)
+    store.write("IBM", "daily", daily(["2024-06-03", "2024-06-04"]))
+    assert len(store.read("IBM", "daily")) == 6
+    assert not store.has_full_history("IBM", "daily")
+    # The next full history closes the gap and is complete again
+    store.write("IBM", "daily", daily(["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05",
+                                       "2024-06-03", "2024-06-04"], [1, 2, 3, 4, 1, 2]), full=True)
+    assert store.has_full_history("IBM", "daily")
+
+
+def test_an_overlapping_window_keeps_full_history(store):
+    store.write("IBM", "daily", daily(["2024-01-02", "2024-01-03"]), full=True)
+    store.write("IBM", "daily", daily(["2024-01-03"], [2.0]))
+    assert store.has_full_history("IBM", "daily")
+
+
+@pytest.mark.skipif(fcntl is None, reason="no cross-process writer lock")
+def test_a_second_writer_opens_read_only(tmp_path, store):
+    other = SeriesStore(store.root)
+    try:
+        assert store.writable and not other.writable
+        assert other.write("IBM", "daily", daily(["2024-01-02"])) == 0
+        assert other.stats()["writable"] is False
+    finally:
+        other.close()
+
+
+@pytest.mark.parametrize("separate_reader", [False, True])
+def test_readers_survive_concurrent_rewrites(store, separate_reader):
+    days = ["2024-01-02", "2024-01-03", "2024-01-04"]
+    store.write("IBM", "daily", daily(days), full=True)
+    reader = SeriesStore(store.root, writable=False) if separate_reader else store
+    errors = []
+
+    def rewrite():
+        try:
+            # Each write revises a stored bar, so it publishes a new generation and unlinks the old one
+            for i in range(300):
+                store.write("IBM", "daily", daily(days, [1.0, 2.0, float(i)]))
+        except Exception as e:
+            errors.append(e)
+
+    writer = threading.Thread(target=rewrite)
+    writer.start()
+    reads = 0
+    try:
+        while writer.is_alive():
+            series = reader.read("IBM", "daily")
+            assert dates(series) == days
+            reads += 1
+    finally:
+        writer.join()
+        if separate_reader:
+            reader.close()
+    assert not errors
+    assert reads and store.stats()["rewrites"] == 301
+    assert store.read("IBM", "daily")["close"][-1] == 299.0
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from rolling import rolling_max, rolling_mean_std, rolling_min, rolling_sum
+from volatility import atr, bbands, sar
+
+
+def test_sar_follows_a_long_trend_and_reverses_to_the_extreme_point():
+    high = np.array([10.0, 11.0, 12.0, 13.0, 12.5, 12.0])
+    low = np.array([9.0, 10.0, 11.0, 12.0, 10.0, 9.5])
+    out = sar(high, low)
+    assert np.isnan(out[0])
+    # Long from the first low; the step grows by 0.02 with each new high
+    assert out[1:5] == pytest.approx([9.0, 9.04, 9.1584, 9.388896])
+    # Bar 5 trades through the stop: short, with the stop at the highest high of the trend
+    assert out[5] == 13.0
+
+
+def test_sar_opens_short_on_a_minus_dm():
+    high = np.array([10.0, 9.5, 9.0])
+    low = np.array([9.0, 8.0, 7.5])
+    out = sar(high, low)
+    assert out[1] == 10.0
+    assert out[2] == pytest.approx(10.0 + 0.02 * (8.0 - 10.0))
+
+
+def test_atr_is_seeded_with_the_mean_true_range():
+    bars = {"high": np.array([10.0, 11.0, 12.0, 12.0]),
+            "low": np.array([9.0, 9.0, 10.0, 9.0]),
+            "close": np.array([9.5, 10.0, 11.0, 10.0])}
+    out = atr(bars, None, 2)
+    # True ranges from bar 1: 2, 2, 3
+    assert np.isnan(out[:2]).all()
+    assert out[2] == 2.0
+    assert out[3] == pytest.approx(2.0 + (3.0 - 2.0) / 2)
+
+
+def test_rolling_extremes_match_a_direct_scan():
+    x = np.random.default_rng(5).normal(size=53)
+    for period in (1, 2, 5, 7, 53):
+        expected = [x[i - period + 1:i + 1].max() for i in range(period - 1, len(x))]
+        assert list(rolling_max(x, period)[period - 1:]) == expected
+        expected = [x[i - period + 1:i + 1].min() for i in range(period - 1, len(x))]
+        assert list(rolling_min(x, period)[period - 1:]) == expected
+    assert np.isnan(rolling_max(x, 54)).all()
+
+
+def test_a_nan_spoils_only_the_windows_that_hold_it():
+    x = np.arange(20.0)
+    x[3] = np.nan
+    out = rolling_sum(x, 3)
+    assert np.isnan(out[:2]).all() and out[2] == 3.0
+    assert np.isnan(out[3:6]).all()
+    assert list(out[6:]) == [3 * i - 3 for i in range(6, 20)]
+    mean, std = rolling_mean_std(x, 3)
+    assert np.isnan(mean[3:6]).all() and np.isnan(std[3:6]).all()
+    assert list(mean[6:]) == pytest.approx(list(range(5, 19)))
+    assert std[6:] == pytest.approx(np.full(14, np.sqrt(2.0 / 3)))
+
+
+def test_bollinger_bands_use_the_population_deviation():
+    x = 1e6 + np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    upper, middle, lower = bbands(x, 5, 2.0, 1.0)
+    assert middle[4] == pytest.approx(1e6 + 3.0)
+    assert upper[4] == pytest.approx(1e6 + 3.0 + 2 * np.sqrt(2.0))
+    assert lower[4] == pytest.approx(1e6 + 3.0 - np.sqrt(2.0))
+    _, std = rolling_mean_std(x, 3)
+    np.testing.assert_allclose(std[2:], np.full(3, np.sqrt(2.0 / 3)), rtol=1e-9)
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from timeseries import TimeSeries, parse_timestamp
+from volume import ad, adosc, mfi, obv, vwap
+
+
+def bars(stamps, typical, volume, span=0.0):
+    """Bars whose typical price is `typical`: high/low `span` either side of the close"""
+    close = np.array(typical, dtype=np.float64)
+    columns = {"open": close, "high": close + span, "low": close - span, "close": close,
+               "volume": np.array(volume, dtype=np.float64)}
+    timestamps = np.array([parse_timestamp(stamp) for stamp in stamps], dtype=np.int64)
+    return TimeSeries(timestamps, columns, {}, "Time Series (5min)")
+
+
+DAYS = ["2024-06-10", "2024-06-11", "2024-06-12", "2024-06-13"]
+
+
+def test_mfi_splits_money_flow_by_the_direction_of_the_typical_price():
+    out = mfi(bars(DAYS, [10.0, 11.0, 10.5, 12.0], [100] * 4), None, 2)
+    assert np.isnan(out[:2]).all()
+    # Bar 2: up-flow 1100 (bar 1), down-flow 1050 (bar 2); bar 3: up 1200, down 1050
+    assert out[2] == pytest.approx(100 * 1100 / 2150)
+    assert out[3] == pytest.approx(100 * 1200 / 2250)
+
+
+def test_mfi_is_zero_without_money_flow():
+    out = mfi(bars(DAYS, [10.0, 11.0, 10.5, 12.0], [0.01] * 4), None, 2)
+    assert list(out[2:]) == [0.0, 0.0]
+
+
+def test_vwap_resets_each_session():
+    stamps = ["2024-06-13 09:30", "2024-06-13 09:35", "2024-06-14 04:00", "2024-06-14 09:30"]
+    out = vwap(bars(stamps, [10.0, 12.0, 20.0, 22.0], [100, 300, 0, 100]), {})
+    assert out[0] == 10.0
+    assert out[1] == pytest.approx((1000 + 3600) / 400)
+    # A new day starts over; before any volume trades the VWAP is the typical price
+    assert out[2] == 20.0
+    assert out[3] == 22.0
+
+
+def test_ad_line_and_oscillator_seeding():
+    series = bars(DAYS, [10.0, 11.0, 10.5, 12.0], [100, 200, 300, 400], span=1.0)
+    series.columns["close"] = series["close"] + np.array([1.0, 0.0, -1.0, 0.5])
+    line = ad(series, None)
+    # Close location value (close-low - (high-close)) / (high-low) times volume, summed
+    assert list(line) == pytest.approx([100.0, 100.0, -200.0, 0.0])
+    out = adosc(series, None, 2, 3)
+    # Both EMAs start from the first A/D value; output starts after the slower period
+    assert np.isnan(out[:2]).all()
+    fast, slow = 100.0, 100.0
+    for value in line[1:3]:
+        fast += 2 / 3 * (value - fast)
+        slow += 2 / 4 * (value - slow)
+    assert out[2] == pytest.approx(fast - slow)
+
+
+def test_obv_starts_from_the_first_volume():
+    series = bars(DAYS, [10.0, 11.0, 11.0, 9.0], [100, 200, 300, 400])
+    assert list(obv(series)) == [100.0, 300.0, 300.0, -100.0]
@@ -0,0 +1,58 @@
+import asyncio
+import json
+
+from bench_series_transport import synthetic_payloads
+from conftest import FakeOpenAI
+from planner import covers, select_window
+from series_parser import parse_series
+from timeseries import format_timestamp
+from tools import ToolHandler
+
+
+def daily_fixtures(fixtures, compact_bars=100, full_bars=300):
+    """Record compact and full daily responses for IBM; return the full series"""
+    compact, _ = synthetic_payloads(compact_bars)
+    full, _ = synthetic_payloads(full_bars)
+    fixtures({"function": "TIME_SERIES_DAILY", "symbol": "IBM", "outputsize": "compact"}, compact)
+    fixtures({"function": "TIME_SERIES_DAILY", "symbol": "IBM", "outputsize": "full"}, full)
+    return parse_series(full)
+
+
+def test_covers_needs_a_bar_at_or_before_the_window_start():
+    series = parse_series(synthetic_payloads(10)[0])
+    first = format_timestamp(series.timestamps[0])
+    assert covers(series, {})
+    assert covers(series, {"from_date": first})
+    assert covers(series, {"as_of": first})
+    assert not covers(series, {"from_date": "2000-01-03"})
+    assert not covers(series, {"as_of": "2000-01-03"})
+    assert covers(series, {"to_date": "2000-01-03"})
+
+
+def test_a_window_before_the_data_says_where_it_starts():
+    series = parse_series(synthetic_payloads(10)[0])
+    first = format_timestamp(series.timestamps[0])
+    assert len(select_window(series, {"as_of": "2000-01-03"})) == 0
+    assert select_window(series, {"as_of": "2000-01-03"}).info["data_starts"] == first
+    assert select_window(series, {"from_date": "2000-01-03"}).info["data_starts"] == first
+    assert "data_starts" not in select_window(series, {"from_date": first}).info
+
+
+def test_daily_window_before_the_compact_bars_fetches_full_history(fixtures, make_client):
+    full = daily_fixtures(fixtures)
+    client = make_client()
+    handler = ToolHandler(client, FakeOpenAI())
+    as_of = format_timestamp(full.timestamps[10])
+    result = json.loads(asyncio.run(handler.handle_tool_call("get_time_series_daily", {"symbol": "IBM", "as_of": as_of})))
+    assert list(result["Time Series (Daily)"]) == [as_of]
+    assert client.transport.served == 2
+
+
+def test_daily_window_inside_the_compact_bars_spends_one_call(fixtures, make_client):
+    full = daily_fixtures(fixtures)
+    client = make_client()
+    handler = ToolHandler(client, FakeOpenAI())
+    from_date = format_timestamp(full.timestamps[-5])
+    result = json.loads(asyncio.run(handler.handle_tool_call("get_time_series_daily", {"symbol": "IBM", "from_date": from_date})))
+    assert len(result["Time Series (Daily)"]) == 5
+    assert client.transport.served == 1
@@ -0,0 +1,193 @@
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# "1. open" -> "open", "7: Time Zone" -> "Time Zone"
+FIELD_PREFIX_RE = re.compile(r'^\d+[a-z]?[.:]\s*')
+
+
+def field_name(raw: str) -> str:
+    """Normalize an Alpha Vantage field label ("1. open" -> "open")"""
+    return FIELD_PREFIX_RE.sub("", raw).strip().lower()
+
+
+def to_epoch_seconds(stamps: np.ndarray) -> np.ndarray:
+    """Convert "YYYY-MM-DD[ HH:MM:SS]" strings to int64 seconds since the epoch.
+
+    Times are kept as wall-clock time in the series' own time zone
+    (Meta Data "Time Zone"); no UTC conversion is applied.
+    """
+    return stamps.astype("datetime64[s]").astype(np.int64)
+
+
+def format_timestamp(seconds: int) -> str:
+    """Render epoch seconds back into Alpha Vantage's "YYYY-MM-DD HH:MM:SS" form"""
+    text = str(np.datetime64(int(seconds), "s")).replace("T", " ")
+    return text[:10] if text.endswith(" 00:00:00") else text
+
+
+def parse_timestamp(text: str, end_of_day: bool = False) -> int:
+    """Parse "YYYY-MM-DD[ HH:MM[:SS]]" into the index's epoch seconds.
+
+    With `end_of_day`, a bare date means its last second, so a window
+    ending on (or an as-of lookup for) that date covers its intraday bars.
+    """
+    text = text.strip()
+    seconds = int(np.datetime64(text.replace(" ", "T"), "s").astype(np.int64))
+    if end_of_day and len(text) == 10:
+        seconds += 86399
+    return seconds
+
+
+def format_value(value: float) -> str:
+    """Render a column value the way Alpha Vantage does, without float noise"""
+    if value != value:
+        return ""
+    return "%.15g" % value
+
+
+class TimeSeries:
+    """Compact columnar time series: an int64 epoch index plus one float64 array per field.
+
+    Bars are stored oldest first, so the latest bar is at index -1. `labels`
+    keeps Alpha Vantage's original field labels ("1. open") for rendering
+    the series back into its response shape; `info` carries the `_meta`
+    annotations a dict response would have.
+    """
+
+    __slots__ = ("timestamps", "columns", "metadata", "series_key", "labels", "info")
+
+    def __init__(self, timestamps: np.ndarray, columns: Dict[str, np.ndarray],
+                 metadata: Dict[str, Any], series_key: str,
+                 labels: Optional[List[str]] = None, info: Optional[Dict[str, Any]] = None):
+        self.timestamps = timestamps
+        self.columns = columns
+        self.metadata = metadata
+        self.series_key = series_key
+        self.labels = labels or list(columns)
+        self.info = info or {}
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    @property
+    def fields(self) -> List[str]:
+        return list(self.columns)
+
+    @property
+    def nbytes(self) -> int:
+        return self.timestamps.nbytes + sum(column.nbytes for column in self.columns.values())
+
+    def with_meta(self, **meta) -> "TimeSeries":
+        """Shallow copy with entries merged into `info` (the `_meta` of a dict response)"""
+        return TimeSeries(self.timestamps, self.columns, self.metadata, self.series_key,
+                          self.labels, {**self.info, **meta})
+
+    def bar(self, i: int) -> Dict[str, Any]:
+        """Return bar `i` (negative counts from the newest) as a dict"""
+        bar = {"timestamp": format_timestamp(self.timestamps[i])}
+        for name, column in self.columns.items():
+            bar[name] = float(column[i])
+        return bar
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """Return the newest bar, or None for an empty series"""
+        return self.bar(-1) if len(self) else None
+
+    def slice(self, start: int, stop: int) -> "TimeSeries":
+        """View of bars `start` to `stop` (positions, oldest first); no data is copied"""
+        return TimeSeries(self.timestamps[start:stop], {name: column[start:stop] for name, column in self.columns.items()},
+                          self.metadata, self.series_key, self.labels, self.info)
+
+    def tail(self, n: int) -> "TimeSeries":
+        """View of the newest `n` bars"""
+        return self.slice(max(0, len(self) - n), len(self))
+
+    def window(self, start: Optional[int] = None, end: Optional[int] = None) -> "TimeSeries":
+        """View of the bars timestamped within [start, end] (epoch seconds), found by binary search"""
+        lo = 0 if start is None else int(np.searchsorted(self.timestamps, start, side="left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.timestamps, end, side="right"))
+        return self.slice(lo, max(lo, hi))
+
+    def asof(self, when: int) -> Optional[int]:
+        """Position of the last bar at or before `when`, or None if every bar is later.
+
+        For daily bars, the as-of position of a holiday or weekend is the
+        previous trading day.
+        """
+        i = int(np.searchsorted(self.timestamps, when, side="right")) - 1
+        return i if i >= 0 else None
+
+    def to_av_dict(self) -> Dict[str, Any]:
+        """Render back into Alpha Vantage's JSON response shape, newest bar first"""
+        names = list(self.columns)
+        columns = [self.columns[name].tolist() for name in names]
+        series = {}
+        for i in range(len(self) - 1, -1, -1):
+            series[format_timestamp(self.timestamps[i])] = {
+                label: format_value(column[i]) for label, column in zip(self.labels, columns)
+            }
+        data = {"Meta Data": self.metadata, self.series_key: series}
+        if self.info:
+            data["_meta"] = self.info
+        return data
+
+    def to_record(self) -> Dict[str, Any]:
+        """Plain JSON-serializable form used by the persistent cache"""
+        return {
+            "series_key": self.series_key,
+            "metadata": self.metadata,
+            "labels": self.labels,
+            "timestamps": self.timestamps.tolist(),
+            "columns": {name: [None if v != v else v for v in column.tolist()] for name, column in self.columns.items()},
+        }
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "TimeSeries":
+        columns = {name: np.array(values, dtype=np.float64) for name, values in record["columns"].items()}
+        return cls(np.array(record["timestamps"], dtype=np.int64), columns,
+                   record["metadata"], record["series_key"], record["labels"])
+
+    @classmethod
+    def from_av_dict(cls, data: Dict[str, Any]) -> Optional["TimeSeries"]:
+        """Build from an already-decoded Alpha Vantage response, or None if it holds no series"""
+        series_key = next((key for key in data if "Time Series" in key or "Technical Analysis" in key), None)
+        if series_key is None:
+            return None
+        bars = data[series_key]
+        stamps = sorted(bars)
+        labels = list(bars[stamps[0]]) if stamps else []
+        columns = {}
+        for label in labels:
+            values = [bars[stamp].get(label) or "nan" for stamp in stamps]
+            columns[field_name(label)] = np.array(values, dtype=np.float64)
+        timestamps = to_epoch_seconds(np.array(stamps, dtype="S19")) if stamps else np.empty(0, dtype=np.int64)
+        return cls(timestamps, columns, data.get("Meta Data", {}), series_key, labels)
+
+
+def merge_series(base: TimeSeries, update: TimeSeries) -> Tuple[TimeSeries, np.ndarray]:
+    """Merge `update` into `base`, de-duplicating by timestamp; `update` wins on overlap.
+
+    Returns the merged series and the timestamps whose values changed
+    between the two (revisions), both in ascending order.
+    """
+    timestamps = np.union1d(base.timestamps, update.timestamps)
+    base_at = np.searchsorted(timestamps, base.timestamps)
+    update_at = np.searchsorted(timestamps, update.timestamps)
+    _, in_base, in_update = np.intersect1d(base.timestamps, update.timestamps, assume_unique=True, return_indices=True)
+    changed = np.zeros(len(in_base), dtype=bool)
+    columns = {}
+    for name, column in base.columns.items():
+        merged = np.full(len(timestamps), np.nan)
+        merged[base_at] = column
+        if name in update.columns:
+            fresh = update.columns[name]
+            merged[update_at] = fresh
+            changed |= ~np.isclose(column[in_base], fresh[in_update], rtol=1e-9, atol=0.0, equal_nan=True)
+        columns[name] = merged
+    revised = base.timestamps[in_base[changed]]
+    return TimeSeries(timestamps, columns, update.metadata or base.metadata, base.series_key, base.labels), revised
@@ -1,8 +1,28 @@
 from mcp.types import Tool
+import asyncio
 import json
 from typing import Any, Callable, Dict, List
+from adjustments import AdjustmentEngine
 from alpha_vantage_client import AlphaVantageClient
+from indicator_engine import IndicatorEngine
 from openai_client import OpenAIClient
+from planner import WINDOW_PROPERTIES, DerivationPlanner, covers, latest_price, select_window
+from timeseries import TimeSeries
+
+# Tools answering with a series (or a value read from one) accept from_date/to_date/as_of
+WINDOWED_TOOLS = frozenset({
+    "get_stock_price", "get_time_series_daily", "get_time_series_intraday", "get_time_series_weekly",
+    "get_time_series_monthly", "get_time_series_monthly_adjusted", "get_adjusted_time_series",
+    "get_fx_daily_data", "get_fx_weekly_data", "get_fx_monthly_data",
+    "get_sma", "get_ema", "get_wma", "get_dema", "get_tema", "get_trima", "get_kama", "get_mama",
+    "get_vwap", "get_tthree", "get_macdext", "get_stoch", "get_stochfast", "get_rsi", "get_stochrsi",
+    "get_willr", "get_adx", "get_adxr", "get_apo", "get_ppo", "get_mom", "get_bop", "get_cci",
+    "get_cmo", "get_roc", "get_rocr", "get_aroon", "get_aroonosc", "get_mfi", "get_trix", "get_ultosc",
+    "get_dx", "get_minus_di", "get_plus_di", "get_minus_dm", "get_plus_dm", "get_bbands",
+    "get_midpoint", "get_midprice", "get_sar", "get_trange", "get_atr", "get_natr", "get_ad",
+    "get_adosc", "get_obv", "get_ht_sine", "get_ht_trendmode", "get_ht_dcperiod", "get_ht_dcphase",
+    "get_ht_phasor",
+})
 
 class ToolHandler:
     """Enhanced tool handler with OpenAI function registration and dynamic dispatch"""
@@ -13,6 +33,9 @@ class ToolHandler:
     ):
         self.av_client = alpha_vantage_client
         self.openai_client = openai_client
+        self.planner = DerivationPlanner(alpha_vantage_client)
+        self.adjuster = AdjustmentEngine(alpha_vantage_client)
+        self.indicators = IndicatorEngine(alpha_vantage_client)
         # Build dynamic mapping of tool names to handlers
         self._build_tool_map()
         # Register functions with OpenAI
@@ -23,6 +46,7 @@ class ToolHandler:
         self._tool_map: Dict[str, Callable[[Dict[str, Any]], Any]] = {
             "get_stock_price": self._get_stock_price,
             "get_stock_quote": self._get_stock_quote,
+            "get_bulk_quotes": self._get_bulk_quotes,
             "get_company_overview": self._get_company_overview,
             "get_time_series_daily": self._get_time_series_daily,
             "get_time_series_intraday": self._get_time_series_intraday,
@@ -30,6 +54,7 @@ class ToolHandler:
             "get_time_series_weekly": self._get_time_series_weekly,
             "get_time_series_monthly": self._get_time_series_monthly,
             "get_time_series_monthly_adjusted": self._get_time_series_monthly_adjusted,
+            "get_adjusted_time_series": self._get_adjusted_time_series,
             "search_ticker": self._search_ticker,
             "get_global_market_status": self._get_global_market_status,
             "get_quote_endpoint_trending": self._get_quote_endpoint_trending,
@@ -138,6 +163,9 @@ class ToolHandler:
             "get_ht_dcphase": self._get_ht_dcphase,
             "get_ht_phasor": self._get_ht_phasor,
         }
+        if not self.av_client.bulk_quotes:
+            # Without bulk access each symbol would cost a separate GLOBAL_QUOTE call
+            del self._tool_map["get_bulk_quotes"]
 
     def _register_functions(self):
         """Register all functions dynamically with OpenAI client"""
@@ -161,6 +189,10 @@ class ToolHandler:
                 {"type": "object", "properties": {"symbol": {"type": "string", "description": "Stock symbol (e.g., AAPL)"}}, "required": ["symbol"]},
                 "Get current stock quote for a given symbol"
             ),
+            "get_bulk_quotes": (
+                {"type": "object", "properties": {"symbols": {"type": "array", "items": {"type": "string"}, "description": "Stock symbols (e.g., [\"AAPL\", \"MSFT\"])"}}, "required": ["symbols"]},
+                "Get current quotes for several symbols in one request"
+            ),
             "get_company_overview": (
                 {"type": "object", "properties": {"symbol": {"type": "string", "description": "Stock symbol (e.g., AAPL)"}}, "required": ["symbol"]},
                 "Get detailed company overview and fundamentals"
@@ -170,7 +202,7 @@ class ToolHandler:
                 "Get daily historical stock price data"
             ),
             "get_time_series_intraday": (
-                {"type": "object", "properties": {"symbol": {"type": "string"}, "interval": {"type": "string", "enum": ["1min", "5min", "15min", "30min", "60min"], "default": "5min"}}, "required": ["symbol"]},
+                {"type": "object", "properties": {"symbol": {"type": "string"}, "interval": {"type": "string", "enum": ["1min", "5min", "15min", "30min", "60min"], "default": "5min"}, "outputsize": {"type": "string", "enum": ["compact", "full"], "default": "compact"}}, "required": ["symbol"]},
                 "Get intraday stock price data for today's trading session"
             ),
             "ask_openai": (
@@ -220,6 +252,25 @@ class ToolHandler:
                 "Get monthly adjusted time series data"
             ),
 
+            "get_adjusted_time_series": (
+                {
+                    "type": "object",
+                    "properties": {
+                        "symbol": {
+                            "type": "string",
+                            "description": "Stock symbol (e.g., AAPL)"
+                        },
+                        "interval": {
+                            "type": "string",
+                            "enum": ["1min", "5min", "15min", "30min", "60min", "daily", "weekly", "monthly"],
+                            "default": "daily"
+                        }
+                    },
+                    "required": ["symbol"]
+                },
+                "Get split- and dividend-adjusted OHLCV with a total-return index at any interval"
+            ),
+
             "search_ticker": (
                 {
                     "type": "object",
@@ -745,7 +796,10 @@ class ToolHandler:
                     "fastperiod": {"type": "integer", "default": 12},
                     "slowperiod": {"type": "integer", "default": 26},
                     "signalperiod": {"type": "integer", "default": 9},
-                    "series_type": {"type": "string", "default": "close"}
+                    "series_type": {"type": "string", "default": "close"},
+                    "fastmatype": {"type": "integer", "enum": list(range(9)), "default": 0},
+                    "slowmatype": {"type": "integer", "enum": list(range(9)), "default": 0},
+                    "signalmatype": {"type": "integer", "enum": list(range(9)), "default": 0}
                 }, "required": ["symbol"]},
                 "Get MACD with additional parameters"
             ),
@@ -1045,7 +1099,10 @@ class ToolHandler:
                 "Get Hilbert Transform - Phasor data"
             ),
         }
-        return definitions[name]
+        schema, description = definitions[name]
+        if name in WINDOWED_TOOLS:
+            schema = {**schema, "properties": {**schema["properties"], **WINDOW_PROPERTIES}}
+        return schema, description
 
     def _make_wrapper(self, name: str) -> Callable:
         """Creates an async wrapper for a given tool name"""
@@ -1053,43 +1110,61 @@ class ToolHandler:
             return await self.handle_tool_call(name, kwargs)
         return wrapper
 
+    @staticmethod
+    def _series_json(series: TimeSeries, args: Dict[str, Any]) -> str:
+        """Render a TimeSeries, narrowed to the call's date window, in Alpha Vantage's response shape"""
+        return json.dumps(select_window(series, args).to_av_dict(), indent=2)
+
     # Internal handlers matching map
     async def _get_stock_price(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "5min")
-        data = await self.av_client.get_time_series_intraday(symbol, interval)
-        # Extract latest price
-        time_series = data.get(f"Time Series ({interval})", {})
-        if not time_series:
-            return json.dumps({"error": "No data found"})
-        latest_time = sorted(time_series.keys())[-1]
-        latest_data = time_series[latest_time]
-        latest_price = latest_data["4. close"]
-        return json.dumps({
-            "symbol": symbol,
-            "latest_time": latest_time,
-            "latest_close": latest_price
-        }, indent=2)
+        series = await self.av_client.get_time_series_intraday(symbol, interval, as_columns=True)
+        if not covers(series, args):
+            # The window starts before the compact response's bars
+            series = await self.av_client.get_time_series_intraday(symbol, interval, as_columns=True, outputsize="full")
+        return json.dumps(latest_price(symbol, select_window(series, args)), indent=2)
 
     async def _get_stock_quote(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         data = await self.av_client.get_stock_quote(symbol)
         return json.dumps(data, indent=2)
 
+    async def _get_bulk_quotes(self, args: Dict[str, Any]) -> str:
+        symbols = [symbol.upper() for symbol in args["symbols"]]
+        if not self.av_client.bulk_quotes:
+            # Bulk access was turned off after a premium error; don't spend a call per symbol
+            return json.dumps({"error": "Bulk quotes are not available for this API key"}, indent=2)
+        quotes = await asyncio.gather(
+            *[self.av_client.get_stock_quote(symbol) for symbol in symbols],
+            return_exceptions=True
+        )
+        data = {
+            symbol: {"error": str(quote)} if isinstance(quote, Exception) else quote
+            for symbol, quote in zip(symbols, quotes)
+        }
+        return json.dumps(data, indent=2)
+
     async def _get_time_series_weekly(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
-        data = await self.av_client.get_time_series_weekly(symbol)
-        return json.dumps(data, indent=2)
+        series = await self.av_client.get_time_series_weekly(symbol, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_time_series_monthly(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
-        data = await self.av_client.get_time_series_monthly(symbol)
-        return json.dumps(data, indent=2)
+        series = await self.av_client.get_time_series_monthly(symbol, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_time_series_monthly_adjusted(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
-        data = await self.av_client.get_time_series_monthly_adjusted(symbol)
-        return json.dumps(data, indent=2)
+        series = await self.adjuster.av_adjusted(symbol, "monthly")
+        return self._series_json(series, args)
+
+    async def _get_adjusted_time_series(self, args: Dict[str, Any]) -> str:
+        symbol = args["symbol"].upper()
+        interval = args.get("interval", "daily")
+        series = await self.adjuster.adjusted_series(symbol, interval)
+        return self._series_json(series, args)
 
     async def _search_ticker(self, args: Dict[str, Any]) -> str:
         keywords = args["keywords"]
@@ -1239,22 +1314,22 @@ class ToolHandler:
         symbol = args.get("symbol")
         if not symbol:
             raise ValueError("symbol is required")
-        data = await self.av_client.get_fx_daily_data(symbol)
-        return json.dumps(data, indent=2)
+        series = await self.av_client.get_fx_daily_data(symbol, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_fx_weekly_data(self, args: Dict[str, Any]) -> str:
         symbol = args.get("symbol")
         if not symbol:
             raise ValueError("symbol is required")
-        data = await self.av_client.get_fx_weekly_data(symbol)
-        return json.dumps(data, indent=2)
+        series = await self.av_client.get_fx_weekly_data(symbol, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_fx_monthly_data(self, args: Dict[str, Any]) -> str:
         symbol = args.get("symbol")
         if not symbol:
             raise ValueError("symbol is required")
-        data = await self.av_client.get_fx_monthly_data(symbol)
-        return json.dumps(data, indent=2)
+        series = await self.av_client.get_fx_monthly_data(symbol, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_exchange_rates_trending(self, args: Dict[str, Any]) -> str:
         symbol = args.get("symbol")
@@ -1267,22 +1342,22 @@ class ToolHandler:
         symbol = args.get("symbol")
         if not symbol:
             raise ValueError("symbol is required")
-        data = await self.av_client.get_fx_daily_data(symbol)
-        return json.dumps(data, indent=2)
+        series = await self.av_client.get_fx_daily_data(symbol, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_fx_weekly_data(self, args: Dict[str, Any]) -> str:
         symbol = args.get("symbol")
         if not symbol:
             raise ValueError("symbol is required")
-        data = await self.av_client.get_fx_weekly_data(symbol)
-        return json.dumps(data, indent=2)
+        series = await self.av_client.get_fx_weekly_data(symbol, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_fx_monthly_data(self, args: Dict[str, Any]) -> str:
         symbol = args.get("symbol")
         if not symbol:
             raise ValueError("symbol is required")
-        data = await self.av_client.get_fx_monthly_data(symbol)
-        return json.dumps(data, indent=2)
+        series = await self.av_client.get_fx_monthly_data(symbol, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_company_overview(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
@@ -1292,14 +1367,21 @@ class ToolHandler:
     async def _get_time_series_daily(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         outputsize = args.get("outputsize", "compact")
-        data = await self.av_client.get_time_series_daily(symbol, outputsize)
-        return json.dumps(data, indent=2)
+        series = await self.av_client.get_time_series_daily(symbol, outputsize, as_columns=True)
+        if outputsize == "compact" and not covers(series, args):
+            # The window starts before the compact response's bars
+            series = await self.av_client.get_time_series_daily(symbol, "full", as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_time_series_intraday(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "5min")
-        data = await self.av_client.get_time_series_intraday(symbol, interval)
-        return json.dumps(data, indent=2)
+        outputsize = args.get("outputsize", "compact")
+        series = await self.av_client.get_time_series_intraday(symbol, interval, as_columns=True, outputsize=outputsize)
+        if outputsize == "compact" and not covers(series, args):
+            # The window starts before the compact response's bars
+            series = await self.av_client.get_time_series_intraday(symbol, interval, as_columns=True, outputsize="full")
+        return self._series_json(series, args)
 
     async def _ask_openai(self, args: Dict[str, Any]) -> str:
         question = args.get("question", "")
@@ -1411,56 +1493,70 @@ class ToolHandler:
         interval = args.get("interval", "daily")
         time_period = args.get("time_period", 20)
         series_type = args.get("series_type", "close")
-        data = await self.av_client.get_sma(symbol, interval, time_period, series_type)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("SMA", symbol, interval, time_period=time_period, series_type=series_type)
+        if series is None:
+            series = await self.av_client.get_sma(symbol, interval, time_period, series_type, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_ema(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
         time_period = args.get("time_period", 20)
         series_type = args.get("series_type", "close")
-        data = await self.av_client.get_ema(symbol, interval, time_period, series_type)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("EMA", symbol, interval, time_period=time_period, series_type=series_type)
+        if series is None:
+            series = await self.av_client.get_ema(symbol, interval, time_period, series_type, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_wma(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
         time_period = args.get("time_period", 20)
         series_type = args.get("series_type", "close")
-        data = await self.av_client.get_wma(symbol, interval, time_period, series_type)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("WMA", symbol, interval, time_period=time_period, series_type=series_type)
+        if series is None:
+            series = await self.av_client.get_wma(symbol, interval, time_period, series_type, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_dema(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
         time_period = args.get("time_period", 20)
         series_type = args.get("series_type", "close")
-        data = await self.av_client.get_dema(symbol, interval, time_period, series_type)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("DEMA", symbol, interval, time_period=time_period, series_type=series_type)
+        if series is None:
+            series = await self.av_client.get_dema(symbol, interval, time_period, series_type, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_tema(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
         time_period = args.get("time_period", 20)
         series_type = args.get("series_type", "close")
-        data = await self.av_client.get_tema(symbol, interval, time_period, series_type)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("TEMA", symbol, interval, time_period=time_period, series_type=series_type)
+        if series is None:
+            series = await self.av_client.get_tema(symbol, interval, time_period, series_type, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_trima(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
         time_period = args.get("time_period", 20)
         series_type = args.get("series_type", "close")
-        data = await self.av_client.get_trima(symbol, interval, time_period, series_type)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("TRIMA", symbol, interval, time_period=time_period, series_type=series_type)
+        if series is None:
+            series = await self.av_client.get_trima(symbol, interval, time_period, series_type, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_kama(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
         time_period = args.get("time_period", 20)
         series_type = args.get("series_type", "close")
-        data = await self.av_client.get_kama(symbol, interval, time_period, series_type)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("KAMA", symbol, interval, time_period=time_period, series_type=series_type)
+        if series is None:
+            series = await self.av_client.get_kama(symbol, interval, time_period, series_type, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_mama(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
@@ -1468,22 +1564,28 @@ class ToolHandler:
         fastlimit = args.get("fastlimit", 0.5)
         slowlimit = args.get("slowlimit", 0.05)
         series_type = args.get("series_type", "close")
-        data = await self.av_client.get_mama(symbol, interval, fastlimit, slowlimit, series_type)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("MAMA", symbol, interval, fastlimit=fastlimit, slowlimit=slowlimit, series_type=series_type)
+        if series is None:
+            series = await self.av_client.get_mama(symbol, interval, fastlimit, slowlimit, series_type, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_vwap(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_vwap(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("VWAP", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_vwap(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_tthree(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
         time_period = args.get("time_period", 20)
         series_type = args.get("series_type", "close")
-        data = await self.av_client.get_tthree(symbol, interval, time_period, series_type)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("T3", symbol, interval, time_period=time_period, series_type=series_type)
+        if series is None:
+            series = await self.av_client.get_tthree(symbol, interval, time_period, series_type, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_macdext(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
@@ -1492,220 +1594,299 @@ class ToolHandler:
         slowperiod = args.get("slowperiod", 26)
         signalperiod = args.get("signalperiod", 9)
         series_type = args.get("series_type", "close")
-        data = await self.av_client.get_macdext(symbol, interval, fastperiod, slowperiod, signalperiod, series_type)
-        return json.dumps(data, indent=2)
+        fastmatype = args.get("fastmatype", 0)
+        slowmatype = args.get("slowmatype", 0)
+        signalmatype = args.get("signalmatype", 0)
+        series = await self.indicators.compute(
+            "MACDEXT", symbol, interval, fastperiod=fastperiod, slowperiod=slowperiod, signalperiod=signalperiod,
+            series_type=series_type, fastmatype=fastmatype, slowmatype=slowmatype, signalmatype=signalmatype
+        )
+        if series is None:
+            series = await self.av_client.get_macdext(symbol, interval, fastperiod, slowperiod, signalperiod, series_type,
+                                                      fastmatype, slowmatype, signalmatype, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_stoch(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_stoch(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("STOCH", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_stoch(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_stochfast(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_stochfast(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("STOCHF", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_stochfast(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_rsi(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
         time_period = args.get("time_period", 14)
         series_type = args.get("series_type", "close")
-        data = await self.av_client.get_rsi(symbol, interval, time_period, series_type)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("RSI", symbol, interval, time_period=time_period, series_type=series_type)
+        if series is None:
+            series = await self.av_client.get_rsi(symbol, interval, time_period, series_type, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_stochrsi(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_stochrsi(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("STOCHRSI", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_stochrsi(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_willr(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_willr(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("WILLR", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_willr(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_adx(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_adx(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("ADX", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_adx(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_adxr(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_adxr(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("ADXR", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_adxr(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_apo(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_apo(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("APO", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_apo(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_ppo(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_ppo(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("PPO", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_ppo(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_mom(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_mom(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("MOM", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_mom(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_bop(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_bop(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("BOP", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_bop(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_cci(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_cci(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("CCI", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_cci(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_cmo(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_cmo(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("CMO", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_cmo(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_roc(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_roc(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("ROC", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_roc(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_rocr(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_rocr(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("ROCR", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_rocr(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_aroon(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_aroon(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("AROON", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_aroon(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_aroonosc(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_aroonosc(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("AROONOSC", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_aroonosc(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_mfi(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_mfi(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("MFI", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_mfi(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_trix(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_trix(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("TRIX", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_trix(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_ultosc(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_ultosc(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("ULTOSC", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_ultosc(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_dx(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_dx(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("DX", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_dx(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_minus_di(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_minus_di(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("MINUS_DI", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_minus_di(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_plus_di(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_plus_di(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("PLUS_DI", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_plus_di(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_minus_dm(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_minus_dm(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("MINUS_DM", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_minus_dm(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_plus_dm(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_plus_dm(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("PLUS_DM", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_plus_dm(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_bbands(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_bbands(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("BBANDS", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_bbands(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_midpoint(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_midpoint(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("MIDPOINT", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_midpoint(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_midprice(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_midprice(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("MIDPRICE", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_midprice(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_sar(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_sar(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("SAR", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_sar(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_trange(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_trange(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("TRANGE", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_trange(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_atr(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_atr(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("ATR", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_atr(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_natr(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_natr(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("NATR", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_natr(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_ad(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_ad(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("AD", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_ad(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_adosc(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_adosc(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("ADOSC", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_adosc(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_obv(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
-        data = await self.av_client.get_obv(symbol, interval)
-        return json.dumps(data, indent=2)
+        series = await self.indicators.compute("OBV", symbol, interval)
+        if series is None:
+            series = await self.av_client.get_obv(symbol, interval, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_ht_trendline(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
@@ -1718,36 +1899,36 @@ class ToolHandler:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
         series_type = args.get("series_type", "close")
-        data = await self.av_client.get_ht_sine(symbol, interval, series_type)
-        return json.dumps(data, indent=2)
+        series = await self.av_client.get_ht_sine(symbol, interval, series_type, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_ht_trendmode(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
         series_type = args.get("series_type", "close")
-        data = await self.av_client.get_ht_trendmode(symbol, interval, series_type)
-        return json.dumps(data, indent=2)
+        series = await self.av_client.get_ht_trendmode(symbol, interval, series_type, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_ht_dcperiod(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
         series_type = args.get("series_type", "close")
-        data = await self.av_client.get_ht_dcperiod(symbol, interval, series_type)
-        return json.dumps(data, indent=2)
+        series = await self.av_client.get_ht_dcperiod(symbol, interval, series_type, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_ht_dcphase(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
         series_type = args.get("series_type", "close")
-        data = await self.av_client.get_ht_dcphase(symbol, interval, series_type)
-        return json.dumps(data, indent=2)
+        series = await self.av_client.get_ht_dcphase(symbol, interval, series_type, as_columns=True)
+        return self._series_json(series, args)
 
     async def _get_ht_phasor(self, args: Dict[str, Any]) -> str:
         symbol = args["symbol"].upper()
         interval = args.get("interval", "daily")
         series_type = args.get("series_type", "close")
-        data = await self.av_client.get_ht_phasor(symbol, interval, series_type)
-        return json.dumps(data, indent=2)
+        series = await self.av_client.get_ht_phasor(symbol, interval, series_type, as_columns=True)
+        return self._series_json(series, args)
 
     async def handle_tool_call(self, name: str, arguments: Dict[str, Any]) -> str:
         """Handle tool execution dynamically via dispatch map"""
@@ -1755,10 +1936,23 @@ class ToolHandler:
             handler = self._tool_map.get(name)
             if not handler:
                 return f"Unknown tool: {name}"
+            # Answer from fresh cached data when possible before spending quota
+            local = await self.planner.answer(name, arguments)
+            if local is not None:
+                return self._series_json(local, arguments) if isinstance(local, TimeSeries) else json.dumps(local, indent=2)
             return await handler(arguments)
         except Exception as e:
             return f"Error executing tool {name}: {str(e)}"
 
+    def stats(self) -> Dict[str, Any]:
+        """Return the client's counters with the planner's and the local engines'"""
+        return {
+            **self.av_client.stats(),
+            "planner": self.planner.stats(),
+            "indicators": self.indicators.stats(),
+            "adjustments": self.adjuster.stats(),
+        }
+
     def get_tool_definitions(self) -> List[Tool]:
         """Return list of available tool definitions for MCP"""
         return [
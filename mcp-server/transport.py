@@ -0,0 +1,206 @@
+import asyncio
+import hashlib
+import json
+import os
+import random
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+import aiohttp
+
+THROTTLE_NOTE = (
+    "Thank you for using Alpha Vantage! Our standard API call frequency is "
+    "5 calls per minute and 500 calls per day."
+)
+
+
+class TransportResponse:
+    """Response handed to AlphaVantageClient: `status`, `content_length`, read() and iter_chunks(size)"""
+
+    status: int
+    content_length: Optional[int]
+
+
+class HttpResponse(TransportResponse):
+    """TransportResponse over a live aiohttp response"""
+
+    def __init__(self, response: aiohttp.ClientResponse):
+        self._response = response
+        self.status = response.status
+        self.content_length = response.content_length
+
+    async def read(self) -> bytes:
+        return await self._response.read()
+
+    async def iter_chunks(self, size: int) -> AsyncIterator[bytes]:
+        async for chunk in self._response.content.iter_chunked(size):
+            yield chunk
+
+
+class BufferedResponse(TransportResponse):
+    """TransportResponse over a body already held in memory"""
+
+    def __init__(self, status: int, body: bytes):
+        self.status = status
+        self.body = body
+        self.content_length = len(body)
+
+    async def read(self) -> bytes:
+        return self.body
+
+    async def iter_chunks(self, size: int) -> AsyncIterator[bytes]:
+        for start in range(0, len(self.body), size):
+            yield self.body[start:start + size]
+
+
+class HttpTransport:
+    """Sends requests to Alpha Vantage over one pooled aiohttp session"""
+
+    def __init__(
+        self,
+        base_url: str,
+        pool_size: int = 20,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: int = 300,
+        request_timeout: float = 15.0,
+        connect_timeout: float = 5.0
+    ):
+        self.base_url = base_url
+        self.pool_size = pool_size
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = aiohttp.ClientTimeout(total=request_timeout, connect=connect_timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def start(self):
+        """Open the shared HTTP session used by every request"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.pool_size,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+                use_dns_cache=True
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+
+    async def close(self):
+        """Close the shared HTTP session and release pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, opening it lazily if start() was not called"""
+        if self._session is None or self._session.closed:
+            await self.start()
+        return self._session
+
+    @asynccontextmanager
+    async def get(self, params: Dict[str, Any]) -> AsyncIterator[TransportResponse]:
+        session = await self._get_session()
+        async with session.get(self.base_url, params=params) as response:
+            yield HttpResponse(response)
+
+
+def fixture_name(params: Dict[str, Any]) -> str:
+    """File name of the fixture for a request, independent of the API key"""
+    canonical = sorted((name, str(value)) for name, value in params.items() if name != "apikey")
+    digest = hashlib.sha1(json.dumps(canonical).encode()).hexdigest()[:12]
+    label = "_".join(str(params[name]) for name in ("function", "symbol") if params.get(name))
+    label = "".join(ch if ch.isalnum() or ch in "-_" else "-" for ch in label)[:60]
+    return f"{label}_{digest}.json"
+
+
+def write_fixture(fixture_dir: str, params: Dict[str, Any], status: int, body: bytes):
+    record = {
+        "params": {name: str(value) for name, value in params.items() if name != "apikey"},
+        "status": status,
+        "body": body.decode("utf-8", errors="replace"),
+    }
+    with open(os.path.join(fixture_dir, fixture_name(params)), "w", encoding="utf-8") as f:
+        json.dump(record, f)
+
+
+def read_fixture(fixture_dir: str, params: Dict[str, Any]) -> Optional[BufferedResponse]:
+    path = os.path.join(fixture_dir, fixture_name(params))
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        record = json.load(f)
+    return BufferedResponse(record["status"], record["body"].encode("utf-8"))
+
+
+class RecordingTransport:
+    """Passes requests to another transport and saves every response as a fixture"""
+
+    def __init__(self, inner: HttpTransport, fixture_dir: str):
+        self.inner = inner
+        self.fixture_dir = fixture_dir
+        os.makedirs(fixture_dir, exist_ok=True)
+
+    async def start(self):
+        await self.inner.start()
+
+    async def close(self):
+        await self.inner.close()
+
+    @asynccontextmanager
+    async def get(self, params: Dict[str, Any]) -> AsyncIterator[TransportResponse]:
+        async with self.inner.get(params) as response:
+            body = await response.read()
+            status = response.status
+        await asyncio.to_thread(write_fixture, self.fixture_dir, params, status, body)
+        yield BufferedResponse(status, body)
+
+
+class ReplayTransport:
+    """Serves recorded fixtures with injected latency and throttling, never touching the network.
+
+    Each request sleeps `latency` seconds plus up to `jitter` seconds, and
+    with probability `throttle_rate` gets Alpha Vantage's per-minute
+    throttle note instead of its fixture. Requests without a fixture get an
+    "Error Message" payload. `seed` makes runs repeatable.
+    """
+
+    def __init__(
+        self,
+        fixture_dir: str,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        throttle_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        self.fixture_dir = fixture_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self._random = random.Random(seed)
+        self.served = 0
+        self.throttled = 0
+        self.missing = 0
+
+    async def start(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def respond(self, params: Dict[str, Any]) -> BufferedResponse:
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self._random.random() < self.throttle_rate:
+            self.throttled += 1
+            return BufferedResponse(200, json.dumps({"Note": THROTTLE_NOTE}).encode())
+        response = await asyncio.to_thread(read_fixture, self.fixture_dir, params)
+        if response is None:
+            self.missing += 1
+            message = f"No fixture recorded for {fixture_name(params)}"
+            return BufferedResponse(200, json.dumps({"Error Message": message}).encode())
+        self.served += 1
+        return response
+
+    @asynccontextmanager
+    async def get(self, params: Dict[str, Any]) -> AsyncIterator[TransportResponse]:
+        yield await self.respond(params)
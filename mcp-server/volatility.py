@@ -0,0 +1,138 @@
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from directional import bar_true_range, shared
+from moving_averages import ema, moving_average, nans
+from rolling import rolling_max, rolling_min, rolling_mean_std
+
+# Volatility and band indicators, following TA-Lib. Rolling statistics are
+# O(n) whatever the period. True range and ATR go through the engine's
+# scratch dict, shared with the directional kernels.
+
+
+def bbands(x: np.ndarray, period: int = 5, nbdevup: float = 2.0, nbdevdn: float = 2.0,
+           matype: int = 0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Upper, middle and lower band: a moving average +/- multiples of the population standard deviation"""
+    mean, std = rolling_mean_std(x, period)
+    middle = mean if int(matype) == 0 else moving_average(x, period, matype)
+    return middle + nbdevup * std, middle, middle - nbdevdn * std
+
+
+def midpoint(x: np.ndarray, period: int = 14) -> np.ndarray:
+    return (rolling_max(x, period) + rolling_min(x, period)) / 2.0
+
+
+def midprice(high: np.ndarray, low: np.ndarray, period: int = 14) -> np.ndarray:
+    return (rolling_max(high, period) + rolling_min(low, period)) / 2.0
+
+
+def atr(bars: Any, scratch: Optional[Dict[Any, Any]], period: int) -> np.ndarray:
+    """Wilder average of true range, seeded with the mean of the first `period` ranges"""
+    return shared(scratch, ("atr", period), lambda: ema(bar_true_range(bars, scratch), period, 1.0 / period))
+
+
+def natr(bars: Any, scratch: Optional[Dict[Any, Any]], period: int) -> np.ndarray:
+    """ATR as a percentage of the close, 0 where the close is 0"""
+    close = bars["close"]
+    zero = close == 0
+    return np.where(zero, 0.0, 100.0 * atr(bars, scratch, period) / np.where(zero, 1.0, close))
+
+
+def sar(high: np.ndarray, low: np.ndarray, acceleration: float = 0.02, maximum: float = 0.2) -> np.ndarray:
+    """Parabolic SAR, a port of TA-Lib's loop; output starts on the second bar"""
+    n = len(high)
+    out = nans(n)
+    if n < 2:
+        return out
+    acceleration = min(acceleration, maximum)
+    highs, lows = high.tolist(), low.tolist()
+    # The opening direction is short if bar 1 has a -DM, long otherwise
+    up, down = highs[1] - highs[0], lows[0] - lows[1]
+    is_long = not (down > 0 and down > up)
+    if is_long:
+        ep, stop = highs[1], lows[0]
+    else:
+        ep, stop = lows[1], highs[0]
+    af = acceleration
+    new_high, new_low = highs[1], lows[1]
+    values = [0.0] * (n - 1)
+    # Each bar's stop depends on the trend state the previous bar left behind
+    for i in range(1, n):
+        prev_high, prev_low = new_high, new_low
+        new_high, new_low = highs[i], lows[i]
+        if is_long:
+            if new_low <= stop:
+                is_long = False
+                stop = max(ep, prev_high, new_high)
+                values[i - 1] = stop
+                af = acceleration
+                ep = new_low
+                stop = max(stop + af * (ep - stop), prev_high, new_high)
+            else:
+                values[i - 1] = stop
+                if new_high > ep:
+                    ep = new_high
+                    af = min(af + acceleration, maximum)
+                stop = min(stop + af * (ep - stop), prev_low, new_low)
+        else:
+            if new_high >= stop:
+                is_long = True
+                stop = min(ep, prev_low, new_low)
+                values[i - 1] = stop
+                af = acceleration
+                ep = new_high
+                stop = min(stop + af * (ep - stop), prev_low, new_low)
+            else:
+                values[i - 1] = stop
+                if new_low < ep:
+                    ep = new_low
+                    af = min(af + acceleration, maximum)
+                stop = max(stop + af * (ep - stop), prev_high, new_high)
+    out[1:] = values
+    return out
+
+
+def _bbands(bars: Any, time_period: int = 20, nbdevup: float = 2, nbdevdn: float = 2,
+            series_type: str = "close", matype: int = 0) -> Dict[str, np.ndarray]:
+    upper, middle, lower = bbands(bars[series_type], int(time_period), float(nbdevup), float(nbdevdn), int(matype))
+    return {"Real Upper Band": upper, "Real Lower Band": lower, "Real Middle Band": middle}
+
+
+def _midpoint(bars: Any, time_period: int = 14, series_type: str = "close") -> Dict[str, np.ndarray]:
+    return {"MIDPOINT": midpoint(bars[series_type], int(time_period))}
+
+
+def _midprice(bars: Any, time_period: int = 14) -> Dict[str, np.ndarray]:
+    return {"MIDPRICE": midprice(bars["high"], bars["low"], int(time_period))}
+
+
+def _sar(bars: Any, acceleration: float = 0.02, maximum: float = 0.2) -> Dict[str, np.ndarray]:
+    return {"SAR": sar(bars["high"], bars["low"], float(acceleration), float(maximum))}
+
+
+def _trange(bars: Any, scratch: Optional[Dict[Any, Any]] = None) -> Dict[str, np.ndarray]:
+    return {"TRANGE": bar_true_range(bars, scratch)}
+
+
+def _atr(bars: Any, time_period: int = 14, scratch: Optional[Dict[Any, Any]] = None) -> Dict[str, np.ndarray]:
+    return {"ATR": atr(bars, scratch, int(time_period))}
+
+
+def _natr(bars: Any, time_period: int = 14, scratch: Optional[Dict[Any, Any]] = None) -> Dict[str, np.ndarray]:
+    return {"NATR": natr(bars, scratch, int(time_period))}
+
+
+# Alpha Vantage function -> (indicator name in Meta Data, kernel over a bar series)
+FUNCTIONS = {
+    "BBANDS": ("Bollinger Bands (BBANDS)", _bbands),
+    "MIDPOINT": ("MidPoint over period (MIDPOINT)", _midpoint),
+    "MIDPRICE": ("Midpoint Price over period (MIDPRICE)", _midprice),
+    "SAR": ("Parabolic SAR (SAR)", _sar),
+    "TRANGE": ("True Range (TRANGE)", _trange),
+    "ATR": ("Average True Range (ATR)", _atr),
+    "NATR": ("Normalized Average True Range (NATR)", _natr),
+}
+
+# Kernels that take the engine's `scratch` dict
+SHARED = frozenset({"TRANGE", "ATR", "NATR"})
@@ -0,0 +1,127 @@
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from directional import shared
+from moving_averages import ema, nans
+from rolling import rolling_sum
+
+# Volume indicators, following TA-Lib (VWAP follows Alpha Vantage's
+# intraday definition). Typical price, money flow and the A/D line are
+# built once per bar series in the engine's scratch dict and shared.
+
+DAY_SECONDS = 86400
+
+
+def typical_price(bars: Any, scratch: Optional[Dict[Any, Any]]) -> np.ndarray:
+    """(high + low + close) / 3"""
+    return shared(scratch, "typical price", lambda: (bars["high"] + bars["low"] + bars["close"]) / 3.0)
+
+
+def money_flow(bars: Any, scratch: Optional[Dict[Any, Any]]) -> np.ndarray:
+    """Typical price times volume"""
+    return shared(scratch, "money flow", lambda: typical_price(bars, scratch) * bars["volume"])
+
+
+def ad(bars: Any, scratch: Optional[Dict[Any, Any]]) -> np.ndarray:
+    """Chaikin accumulation/distribution line: running sum of close location value times volume"""
+    def build():
+        high, low, close = bars["high"], bars["low"], bars["close"]
+        span = high - low
+        flat = span <= 0
+        location = ((close - low) - (high - close)) / np.where(flat, 1.0, span)
+        return np.cumsum(np.where(flat, 0.0, location * bars["volume"]))
+    return shared(scratch, "ad", build)
+
+
+def adosc(bars: Any, scratch: Optional[Dict[Any, Any]], fast_period: int = 3, slow_period: int = 10) -> np.ndarray:
+    """Fast minus slow EMA of the A/D line; TA-Lib seeds both with the first A/D value"""
+    line = ad(bars, scratch)
+    # Period 1 with an explicit alpha seeds the average on the first value
+    out = ema(line, 1, 2.0 / (fast_period + 1)) - ema(line, 1, 2.0 / (slow_period + 1))
+    out[:max(fast_period, slow_period) - 1] = np.nan
+    return out
+
+
+def obv(bars: Any, scratch: Optional[Dict[Any, Any]] = None) -> np.ndarray:
+    """On-balance volume, starting from the first bar's volume"""
+    close, volume = bars["close"], bars["volume"]
+    if not len(close):
+        return nans(0)
+    signed = np.r_[volume[0], np.sign(np.diff(close)) * volume[1:]]
+    return np.cumsum(signed)
+
+
+def mfi(bars: Any, scratch: Optional[Dict[Any, Any]], period: int = 14) -> np.ndarray:
+    """Money flow index: share of the last `period` bars' money flow on up-moves, 0-100"""
+    typical, flow = typical_price(bars, scratch), money_flow(bars, scratch)
+    out = nans(len(typical))
+    if len(typical) <= period:
+        return out
+    change = np.diff(typical)
+    positive = rolling_sum(np.where(change > 0, flow[1:], 0.0), period)
+    negative = rolling_sum(np.where(change < 0, flow[1:], 0.0), period)
+    total = positive + negative
+    # TA-Lib treats a total below 1 as no flow
+    out[1:] = np.where(total < 1.0, 0.0, 100.0 * positive / np.where(total < 1.0, 1.0, total))
+    return out
+
+
+def vwap(bars: Any, scratch: Optional[Dict[Any, Any]]) -> np.ndarray:
+    """Volume-weighted typical price, cumulated from each session's first bar.
+
+    Sessions are calendar days of the bars' exchange-local timestamps, so
+    pre- and post-market bars belong to their day. Before any volume has
+    traded in a session, the VWAP is the typical price.
+    """
+    typical, flow, volume = typical_price(bars, scratch), money_flow(bars, scratch), bars["volume"]
+    n = len(typical)
+    if not n:
+        return nans(0)
+    day = bars.timestamps // DAY_SECONDS
+    opens = np.flatnonzero(np.r_[True, day[1:] != day[:-1]])
+    session = np.cumsum(np.r_[True, day[1:] != day[:-1]]) - 1
+    flow_total, volume_total = np.cumsum(flow), np.cumsum(volume)
+    # Subtract what had accumulated before each session opened
+    flow_before = np.r_[0.0, flow_total][opens][session]
+    volume_before = np.r_[0.0, volume_total][opens][session]
+    traded = volume_total - volume_before
+    no_volume = traded <= 0
+    return np.where(no_volume, typical, (flow_total - flow_before) / np.where(no_volume, 1.0, traded))
+
+
+def _ad(bars: Any, scratch: Optional[Dict[Any, Any]] = None) -> Dict[str, np.ndarray]:
+    return {"Chaikin A/D": ad(bars, scratch)}
+
+
+def _adosc(bars: Any, fastperiod: int = 3, slowperiod: int = 10,
+           scratch: Optional[Dict[Any, Any]] = None) -> Dict[str, np.ndarray]:
+    return {"ADOSC": adosc(bars, scratch, int(fastperiod), int(slowperiod))}
+
+
+def _obv(bars: Any, scratch: Optional[Dict[Any, Any]] = None) -> Dict[str, np.ndarray]:
+    return {"OBV": obv(bars, scratch)}
+
+
+def _mfi(bars: Any, time_period: int = 14, scratch: Optional[Dict[Any, Any]] = None) -> Dict[str, np.ndarray]:
+    return {"MFI": mfi(bars, scratch, int(time_period))}
+
+
+def _vwap(bars: Any, scratch: Optional[Dict[Any, Any]] = None) -> Dict[str, np.ndarray]:
+    return {"VWAP": vwap(bars, scratch)}
+
+
+# Alpha Vantage function -> (indicator name in Meta Data, kernel over a bar series)
+FUNCTIONS = {
+    "AD": ("Chaikin A/D Line", _ad),
+    "ADOSC": ("Chaikin A/D Oscillator (ADOSC)", _adosc),
+    "OBV": ("On Balance Volume (OBV)", _obv),
+    "MFI": ("Money Flow Index (MFI)", _mfi),
+    "VWAP": ("Volume Weighted Average Price (VWAP)", _vwap),
+}
+
+# Kernels that take the engine's `scratch` dict
+SHARED = frozenset(FUNCTIONS)
+
+# Alpha Vantage only serves these for intraday intervals
+INTRADAY_ONLY = frozenset({"VWAP"})